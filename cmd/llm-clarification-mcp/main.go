@@ -7,6 +7,7 @@ import (
 	"os"
 
 	"github.com/modelcontextprotocol/go-sdk/mcp"
+	"github.com/samestrin/llm-tools/internal/clarification/commands"
 	"github.com/samestrin/llm-tools/internal/clarification/mcpserver"
 )
 
@@ -17,10 +18,15 @@ const (
 )
 
 func main() {
-	// Verify llm-clarification binary exists
-	if _, err := os.Stat(mcpserver.BinaryPath); os.IsNotExist(err) {
-		fmt.Fprintf(os.Stderr, "ERROR: llm-clarification binary not found at %s\n", mcpserver.BinaryPath)
-		fmt.Fprintf(os.Stderr, "Please ensure llm-clarification is installed and accessible.\n")
+	// Spawn the llm-clarification binary per call by default.
+	// LLM_CLARIFICATION_MCP_IN_PROCESS=true runs commands inside the server
+	// instead, trading parallelism for startup cost: in-process runs share the
+	// command tree's flag state and so execute one at a time.
+	if os.Getenv("LLM_CLARIFICATION_MCP_IN_PROCESS") == "true" {
+		mcpserver.InProcessRunner = commands.ExecuteArgs
+	} else if !mcpserver.BinaryFound {
+		// Verify llm-clarification binary exists (resolved once during package init)
+		fmt.Fprintf(os.Stderr, "ERROR: llm-clarification binary not found at %s\nPlease ensure llm-clarification is installed and accessible.\n", mcpserver.BinaryPath)
 		os.Exit(1)
 	}
 
@@ -55,8 +61,25 @@ func main() {
 				}
 			}
 
+			// Forward output lines as progress notifications when the client asked for progress.
+			// WithProgress serializes the callback, so the shared line count stays monotonic
+			// across batch operations, and stop ends notifications once this call returns.
+			if token := req.Params.GetProgressToken(); token != nil {
+				var lines float64
+				var stop func()
+				ctx, stop = mcpserver.WithProgress(ctx, func(line string) {
+					lines++
+					_ = req.Session.NotifyProgress(ctx, &mcp.ProgressNotificationParams{
+						ProgressToken: token,
+						Progress:      lines,
+						Message:       line,
+					})
+				})
+				defer stop()
+			}
+
 			// Execute the tool using the handler
-			output, err := mcpserver.ExecuteHandler(td.Name, args)
+			output, err := mcpserver.ExecuteHandlerContext(ctx, td.Name, args)
 			if err != nil {
 				return &mcp.CallToolResult{
 					Content: []mcp.Content{
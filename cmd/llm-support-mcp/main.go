@@ -17,10 +17,9 @@ const (
 )
 
 func main() {
-	// Verify llm-support binary exists
-	if _, err := os.Stat(mcpserver.BinaryPath); os.IsNotExist(err) {
-		fmt.Fprintf(os.Stderr, "ERROR: llm-support binary not found at %s\n", mcpserver.BinaryPath)
-		fmt.Fprintf(os.Stderr, "Please ensure llm-support is installed and accessible.\n")
+	// Verify llm-support binary exists (checked once during package init)
+	if !mcpserver.BinaryFound {
+		fmt.Fprintf(os.Stderr, "ERROR: llm-support binary not found at %s\nPlease ensure llm-support is installed and accessible.\n", mcpserver.BinaryPath)
 		os.Exit(1)
 	}
 
@@ -56,7 +55,7 @@ func main() {
 			}
 
 			// Execute the tool using the handler
-			output, err := mcpserver.ExecuteHandler(td.Name, args)
+			output, err := mcpserver.ExecuteHandlerContext(ctx, td.Name, args)
 			if err != nil {
 				return &mcp.CallToolResult{
 					Content: []mcp.Content{
@@ -1,7 +1,6 @@
 package commands
 
 import (
-	"context"
 	"fmt"
 	"io"
 	"strings"
@@ -63,7 +62,7 @@ type PotentialMatch struct {
 }
 
 func runAddClarification(cmd *cobra.Command, args []string) error {
-	ctx := context.Background()
+	ctx := commandContext(cmd)
 
 	// Get storage instance
 	store, err := GetStorageOrError(ctx, addFile)
@@ -1,7 +1,6 @@
 package commands
 
 import (
-	"context"
 	"encoding/json"
 	"fmt"
 	"io"
@@ -55,7 +54,7 @@ type Candidate struct {
 }
 
 func runIdentifyCandidates(cmd *cobra.Command, args []string) error {
-	ctx := context.Background()
+	ctx := commandContext(cmd)
 
 	// Get storage instance
 	store, err := GetStorageOrError(ctx, candidatesFile)
@@ -94,6 +93,10 @@ func runIdentifyCandidates(cmd *cobra.Command, args []string) error {
 	// Build prompt
 	prompt := buildCandidatesPrompt(eligibleEntries)
 
+	if err := ctx.Err(); err != nil {
+		return err
+	}
+
 	// Call LLM
 	response, err := client.Complete(prompt, 30*time.Second)
 	if err != nil {
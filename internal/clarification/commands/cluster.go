@@ -1,7 +1,6 @@
 package commands
 
 import (
-	"context"
 	"encoding/json"
 	"fmt"
 	"io"
@@ -51,7 +50,7 @@ type ClusterResult struct {
 }
 
 func runClusterClarifications(cmd *cobra.Command, args []string) error {
-	ctx := context.Background()
+	ctx := commandContext(cmd)
 
 	// Get storage instance
 	store, err := GetStorageOrError(ctx, clusterFile)
@@ -103,6 +102,10 @@ func runClusterClarifications(cmd *cobra.Command, args []string) error {
 	// Build prompt
 	prompt := buildClusterPrompt(questions)
 
+	if err := ctx.Err(); err != nil {
+		return err
+	}
+
 	// Call LLM
 	response, err := client.Complete(prompt, 30*time.Second)
 	if err != nil {
@@ -1,7 +1,6 @@
 package commands
 
 import (
-	"context"
 	"encoding/json"
 	"fmt"
 	"io"
@@ -61,7 +60,7 @@ type ConflictsResult struct {
 }
 
 func runDetectConflicts(cmd *cobra.Command, args []string) error {
-	ctx := context.Background()
+	ctx := commandContext(cmd)
 
 	// Get storage instance
 	store, err := GetStorageOrError(ctx, conflictsFile)
@@ -97,6 +96,10 @@ func runDetectConflicts(cmd *cobra.Command, args []string) error {
 	// Build prompt
 	prompt := buildConflictsPrompt(entries)
 
+	if err := ctx.Err(); err != nil {
+		return err
+	}
+
 	// Call LLM
 	response, err := client.Complete(prompt, 30*time.Second)
 	if err != nil {
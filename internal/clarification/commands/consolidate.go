@@ -1,7 +1,6 @@
 package commands
 
 import (
-	"context"
 	"encoding/json"
 	"fmt"
 	"io"
@@ -52,7 +51,7 @@ type ConsolidationSuggestion struct {
 }
 
 func runSuggestConsolidation(cmd *cobra.Command, args []string) error {
-	ctx := context.Background()
+	ctx := commandContext(cmd)
 
 	// Get storage instance
 	store, err := GetStorageOrError(ctx, consolidateFile)
@@ -87,6 +86,10 @@ func runSuggestConsolidation(cmd *cobra.Command, args []string) error {
 	// Build prompt
 	prompt := buildConsolidationPrompt(entries)
 
+	if err := ctx.Err(); err != nil {
+		return err
+	}
+
 	// Call LLM
 	response, err := client.Complete(prompt, 30*time.Second)
 	if err != nil {
@@ -2,7 +2,6 @@ package commands
 
 import (
 	"bufio"
-	"context"
 	"fmt"
 	"io"
 	"strings"
@@ -65,7 +64,7 @@ func init() {
 }
 
 func runDeleteClarification(cmd *cobra.Command, args []string) error {
-	ctx := context.Background()
+	ctx := commandContext(cmd)
 
 	// Open storage
 	store, err := storage.NewStorage(ctx, deleteFile)
@@ -1,7 +1,6 @@
 package commands
 
 import (
-	"context"
 	"fmt"
 	"io"
 
@@ -59,7 +58,7 @@ func init() {
 }
 
 func runExportMemory(cmd *cobra.Command, args []string) error {
-	ctx := context.Background()
+	ctx := commandContext(cmd)
 
 	// Open source storage
 	sourceStore, err := storage.NewStorage(ctx, exportSource)
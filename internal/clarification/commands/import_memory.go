@@ -1,7 +1,6 @@
 package commands
 
 import (
-	"context"
 	"fmt"
 	"io"
 	"strings"
@@ -74,7 +73,7 @@ func init() {
 }
 
 func runImportMemory(cmd *cobra.Command, args []string) error {
-	ctx := context.Background()
+	ctx := commandContext(cmd)
 
 	// Parse import mode
 	mode, err := parseImportMode(importMode)
@@ -1,7 +1,6 @@
 package commands
 
 import (
-	"context"
 	"fmt"
 	"io"
 	"os"
@@ -46,7 +45,7 @@ type InitResult struct {
 }
 
 func runInitTracking(cmd *cobra.Command, args []string) error {
-	ctx := context.Background()
+	ctx := commandContext(cmd)
 
 	// Apply --db override if set
 	outputPath := GetDBPath(initOutput)
@@ -1,7 +1,6 @@
 package commands
 
 import (
-	"context"
 	"encoding/json"
 	"fmt"
 	"io"
@@ -78,7 +77,7 @@ func getLLMClient() (LLMClientInterface, error) {
 }
 
 func runMatchClarification(cmd *cobra.Command, args []string) error {
-	ctx := context.Background()
+	ctx := commandContext(cmd)
 
 	// Get storage instance
 	store, err := GetStorageOrError(ctx, matchFile)
@@ -111,6 +110,10 @@ func runMatchClarification(cmd *cobra.Command, args []string) error {
 	// Build prompt
 	prompt := buildMatchPrompt(matchQuestion, entries)
 
+	if err := ctx.Err(); err != nil {
+		return err
+	}
+
 	// Call LLM
 	response, err := client.Complete(prompt, 30*time.Second)
 	if err != nil {
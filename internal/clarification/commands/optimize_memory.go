@@ -1,7 +1,6 @@
 package commands
 
 import (
-	"context"
 	"fmt"
 	"io"
 	"regexp"
@@ -81,7 +80,7 @@ func init() {
 }
 
 func runOptimizeMemory(cmd *cobra.Command, args []string) error {
-	ctx := context.Background()
+	ctx := commandContext(cmd)
 
 	// If no operation specified, show help
 	if !optimizeVacuum && optimizePruneStale == "" && !optimizeStats {
@@ -1,7 +1,6 @@
 package commands
 
 import (
-	"context"
 	"fmt"
 	"io"
 	"os"
@@ -74,7 +73,7 @@ func init() {
 }
 
 func runReconcileMemory(cmd *cobra.Command, args []string) error {
-	ctx := context.Background()
+	ctx := commandContext(cmd)
 
 	// Verify project root exists
 	if _, err := os.Stat(reconcileProjectRoot); os.IsNotExist(err) {
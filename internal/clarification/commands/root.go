@@ -2,9 +2,15 @@
 package commands
 
 import (
+	"context"
+	"io"
 	"os"
+	"strings"
+	"sync"
 
+	"github.com/samestrin/llm-tools/pkg/output"
 	"github.com/spf13/cobra"
+	"github.com/spf13/pflag"
 )
 
 // Version is set at build time using ldflags
@@ -42,6 +48,76 @@ func Execute() error {
 	return rootCmd.Execute()
 }
 
+// executeMu serializes in-process executions. Command flags are bound to
+// package-level variables, so two runs cannot safely overlap.
+var executeMu sync.Mutex
+
+// ExecuteArgs runs the root command in-process with the given arguments,
+// writing all output to out. Errors are printed to out the same way the
+// llm-clarification binary prints them, and also returned to the caller.
+// Flags and contexts are reset before every run so no state leaks between
+// invocations.
+func ExecuteArgs(ctx context.Context, args []string, out io.Writer) error {
+	executeMu.Lock()
+	defer executeMu.Unlock()
+
+	resetCommands(rootCmd)
+	GlobalJSONOutput = false
+	GlobalMinOutput = false
+
+	rootCmd.SetArgs(args)
+	rootCmd.SetOut(out)
+	rootCmd.SetErr(out)
+	// Never fall back to the process stdin; in an MCP server it carries the protocol stream
+	rootCmd.SetIn(strings.NewReader(""))
+	defer func() {
+		rootCmd.SetArgs(nil)
+		rootCmd.SetOut(nil)
+		rootCmd.SetErr(nil)
+		rootCmd.SetIn(nil)
+	}()
+
+	if err := rootCmd.ExecuteContext(ctx); err != nil {
+		output.New(GlobalJSONOutput, GlobalMinOutput, out).PrintError(err)
+		return err
+	}
+	return nil
+}
+
+// commandContext returns the context the command was executed with, so an
+// in-process run cancelled through ExecuteArgs stops at its next storage or
+// API call instead of running to completion.
+func commandContext(cmd *cobra.Command) context.Context {
+	if ctx := cmd.Context(); ctx != nil {
+		return ctx
+	}
+	return context.Background()
+}
+
+// resetCommands restores every changed flag on cmd and its subcommands to its
+// default value and clears their contexts. Cobra only hands the root context
+// to a subcommand that has none, so without this a later run would inherit
+// the first run's (by then cancelled) context.
+func resetCommands(cmd *cobra.Command) {
+	reset := func(f *pflag.Flag) {
+		if !f.Changed {
+			return
+		}
+		if sv, ok := f.Value.(pflag.SliceValue); ok {
+			_ = sv.Replace(nil)
+		} else {
+			_ = f.Value.Set(f.DefValue)
+		}
+		f.Changed = false
+	}
+	cmd.Flags().VisitAll(reset)
+	cmd.PersistentFlags().VisitAll(reset)
+	cmd.SetContext(nil)
+	for _, sub := range cmd.Commands() {
+		resetCommands(sub)
+	}
+}
+
 // GetDBPath returns the effective database path.
 // Priority: --db flag > CLARIFY_DB_PATH env var > per-command --file flag
 func GetDBPath(cmdFilePath string) string {
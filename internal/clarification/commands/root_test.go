@@ -2,8 +2,12 @@ package commands
 
 import (
 	"bytes"
+	"context"
+	"encoding/json"
+	"errors"
 	"strings"
 	"testing"
+	"time"
 
 	"github.com/spf13/cobra"
 )
@@ -112,3 +116,111 @@ func TestInvalidFlag(t *testing.T) {
 		t.Error("Execute() with invalid flag should return error")
 	}
 }
+
+func TestExecuteArgsResetsFlagsBetweenRuns(t *testing.T) {
+	trackingPath, cleanup := createTestTrackingFile(t)
+	defer cleanup()
+	defer resetAllCommandFlags()
+
+	ctx := context.Background()
+
+	// First run filters by status
+	var first bytes.Buffer
+	if err := ExecuteArgs(ctx, []string{"list-entries", "--file", trackingPath, "--status", "promoted", "--json"}, &first); err != nil {
+		t.Fatalf("first ExecuteArgs failed: %v", err)
+	}
+	var firstResult ListEntriesResult
+	if err := json.Unmarshal(first.Bytes(), &firstResult); err != nil {
+		t.Fatalf("failed to parse first output: %v", err)
+	}
+	if firstResult.Count != 1 {
+		t.Errorf("expected 1 promoted entry, got %d", firstResult.Count)
+	}
+
+	// Second run omits --status; the previous filter must not leak
+	var second bytes.Buffer
+	if err := ExecuteArgs(ctx, []string{"list-entries", "--file", trackingPath, "--json"}, &second); err != nil {
+		t.Fatalf("second ExecuteArgs failed: %v", err)
+	}
+	var secondResult ListEntriesResult
+	if err := json.Unmarshal(second.Bytes(), &secondResult); err != nil {
+		t.Fatalf("failed to parse second output: %v", err)
+	}
+	if secondResult.Count != 3 {
+		t.Errorf("expected 3 entries after flag reset, got %d", secondResult.Count)
+	}
+}
+
+func TestExecuteArgsPrintsErrors(t *testing.T) {
+	defer resetAllCommandFlags()
+
+	var out bytes.Buffer
+	err := ExecuteArgs(context.Background(), []string{"list-entries", "--file", "/nonexistent/tracking.yaml", "--json", "--min"}, &out)
+	if err == nil {
+		t.Fatal("expected error for missing tracking file")
+	}
+	if !strings.Contains(out.String(), `"err":true`) {
+		t.Errorf("expected minimal JSON error in output, got %q", out.String())
+	}
+}
+
+// recordingLLMClient records whether an API call was made
+type recordingLLMClient struct {
+	called bool
+}
+
+func (c *recordingLLMClient) Complete(prompt string, timeout time.Duration) (string, error) {
+	c.called = true
+	return `{"match_id": ""}`, nil
+}
+
+func TestExecuteArgsStopsWhenCancelled(t *testing.T) {
+	trackingPath, cleanup := createTestTrackingFile(t)
+	defer cleanup()
+	defer resetAllCommandFlags()
+
+	client := &recordingLLMClient{}
+	SetLLMClient(client)
+	defer SetLLMClient(nil)
+
+	ctx, cancel := context.WithCancel(context.Background())
+	cancel()
+
+	var out bytes.Buffer
+	err := ExecuteArgs(ctx, []string{"match-clarification", "--file", trackingPath, "--question", "Which database?", "--json"}, &out)
+	if !errors.Is(err, context.Canceled) {
+		t.Fatalf("ExecuteArgs() error = %v, want context.Canceled", err)
+	}
+	if client.called {
+		t.Error("cancelled run should stop before calling the LLM API")
+	}
+}
+
+func TestExecuteArgsUsesEachRunsContext(t *testing.T) {
+	trackingPath, cleanup := createTestTrackingFile(t)
+	defer cleanup()
+	defer resetAllCommandFlags()
+
+	client := &recordingLLMClient{}
+	SetLLMClient(client)
+	defer SetLLMClient(nil)
+
+	args := []string{"match-clarification", "--file", trackingPath, "--question", "Which database?", "--json"}
+
+	// The first run's context is cancelled once it returns
+	first, cancel := context.WithCancel(context.Background())
+	var out bytes.Buffer
+	if err := ExecuteArgs(first, args, &out); err != nil {
+		t.Fatalf("first ExecuteArgs failed: %v", err)
+	}
+	cancel()
+
+	client.called = false
+	out.Reset()
+	if err := ExecuteArgs(context.Background(), args, &out); err != nil {
+		t.Fatalf("second ExecuteArgs failed: %v", err)
+	}
+	if !client.called {
+		t.Error("second run should reach the LLM API")
+	}
+}
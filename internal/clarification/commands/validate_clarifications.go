@@ -1,7 +1,6 @@
 package commands
 
 import (
-	"context"
 	"encoding/json"
 	"fmt"
 	"io"
@@ -58,7 +57,7 @@ type ValidateClarificationsResult struct {
 }
 
 func runValidateClarifications(cmd *cobra.Command, args []string) error {
-	ctx := context.Background()
+	ctx := commandContext(cmd)
 
 	// Get storage instance
 	store, err := GetStorageOrError(ctx, validateFile)
@@ -101,6 +100,10 @@ func runValidateClarifications(cmd *cobra.Command, args []string) error {
 	// Build prompt
 	prompt := buildValidatePrompt(entries, projectContext)
 
+	if err := ctx.Err(); err != nil {
+		return err
+	}
+
 	// Call LLM
 	response, err := client.Complete(prompt, 30*time.Second)
 	if err != nil {
@@ -0,0 +1,112 @@
+package mcpserver
+
+import (
+	"context"
+	"encoding/json"
+	"fmt"
+	"strings"
+	"sync"
+	"sync/atomic"
+)
+
+// BatchMaxConcurrent is the default number of batch operations executed at once
+var BatchMaxConcurrent = 4
+
+// batchCommand is the command name of the batch aggregator tool
+const batchCommand = "batch"
+
+// BatchResult is the outcome of a single operation in a batch
+type BatchResult struct {
+	Index  int    `json:"index"`
+	Tool   string `json:"tool"`
+	Status string `json:"status"` // "ok", "error", or "skipped"
+	Output string `json:"output,omitempty"`
+}
+
+// executeBatch runs every operation in args["operations"] concurrently and
+// returns a JSON array of BatchResult in input order. Write operations are
+// still serialized by ExecuteHandlerContext.
+func executeBatch(ctx context.Context, args map[string]interface{}) (string, error) {
+	ops, ok := args["operations"].([]interface{})
+	if !ok || len(ops) == 0 {
+		return "", fmt.Errorf("operations must be a non-empty array")
+	}
+
+	maxConcurrent := BatchMaxConcurrent
+	if n, ok := getInt(args, "max_concurrent"); ok && n > 0 {
+		maxConcurrent = n
+	}
+	stopOnError := getBool(args, "stop_on_error")
+
+	results := make([]BatchResult, len(ops))
+	sem := make(chan struct{}, maxConcurrent)
+	var stopped atomic.Bool
+	var wg sync.WaitGroup
+
+	for i, raw := range ops {
+		op, _ := raw.(map[string]interface{})
+		tool, _ := op["tool"].(string)
+		opArgs, _ := op["arguments"].(map[string]interface{})
+		results[i] = BatchResult{Index: i, Tool: tool}
+
+		if tool == "" {
+			results[i].Status = "error"
+			results[i].Output = "operation is missing tool name"
+			if stopOnError {
+				stopped.Store(true)
+			}
+			continue
+		}
+		if strings.TrimPrefix(tool, ToolPrefix) == batchCommand {
+			results[i].Status = "error"
+			results[i].Output = "nested batch operations are not supported"
+			if stopOnError {
+				stopped.Store(true)
+			}
+			continue
+		}
+
+		wg.Add(1)
+		go func(i int, tool string, opArgs map[string]interface{}) {
+			defer wg.Done()
+			sem <- struct{}{}
+			defer func() { <-sem }()
+
+			if stopped.Load() {
+				results[i].Status = "skipped"
+				return
+			}
+			// A failed command usually still prints its error, so the
+			// failure is judged on cmdErr rather than on empty output
+			output, cmdErr, err := executeTool(ctx, tool, opArgs)
+			if err != nil || cmdErr != nil {
+				results[i].Status = "error"
+				switch {
+				case err != nil:
+					results[i].Output = err.Error()
+				case output != "":
+					results[i].Output = output
+				default:
+					results[i].Output = fmt.Sprintf("command failed: %v", cmdErr)
+				}
+				if stopOnError {
+					stopped.Store(true)
+				}
+				return
+			}
+			results[i].Status = "ok"
+			results[i].Output = output
+		}(i, tool, opArgs)
+	}
+	wg.Wait()
+
+	// Encode straight into the result string; outputs are already JSON text,
+	// so skipping HTML escaping keeps them compact and readable
+	var sb strings.Builder
+	enc := json.NewEncoder(&sb)
+	enc.SetEscapeHTML(false)
+	if err := enc.Encode(results); err != nil {
+		return "", fmt.Errorf("failed to encode batch results: %w", err)
+	}
+	return strings.TrimSuffix(sb.String(), "\n"), nil
+}
@@ -0,0 +1,242 @@
+package mcpserver
+
+import (
+	"context"
+	"encoding/json"
+	"errors"
+	"fmt"
+	"io"
+	"os"
+	"path/filepath"
+	"strings"
+	"sync/atomic"
+	"testing"
+)
+
+func TestExecuteBatch(t *testing.T) {
+	orig := InProcessRunner
+	defer func() { InProcessRunner = orig }()
+
+	InProcessRunner = func(ctx context.Context, args []string, out io.Writer) error {
+		fmt.Fprintf(out, "ran %s", args[0])
+		return nil
+	}
+
+	args := map[string]interface{}{
+		"operations": []interface{}{
+			map[string]interface{}{"tool": "llm_clarification_list_entries", "arguments": map[string]interface{}{"file": "t.yaml"}},
+			map[string]interface{}{"tool": "init_tracking", "arguments": map[string]interface{}{"output": "t.yaml"}},
+			map[string]interface{}{"tool": "unknown_tool"},
+			map[string]interface{}{"tool": "llm_clarification_batch"},
+		},
+	}
+
+	output, err := ExecuteHandler(ToolPrefix+"batch", args)
+	if err != nil {
+		t.Fatalf("ExecuteHandler(batch) error = %v", err)
+	}
+
+	var results []BatchResult
+	if err := json.Unmarshal([]byte(output), &results); err != nil {
+		t.Fatalf("failed to parse batch output: %v", err)
+	}
+	if len(results) != 4 {
+		t.Fatalf("expected 4 results, got %d", len(results))
+	}
+
+	want := []struct {
+		status string
+		output string
+	}{
+		{"ok", "ran list-entries"},
+		{"ok", "ran init-tracking"},
+		{"error", "unknown command: unknown_tool"},
+		{"error", "nested batch operations are not supported"},
+	}
+	for i, w := range want {
+		if results[i].Index != i {
+			t.Errorf("results[%d].Index = %d", i, results[i].Index)
+		}
+		if results[i].Status != w.status || results[i].Output != w.output {
+			t.Errorf("results[%d] = %+v, want status %q output %q", i, results[i], w.status, w.output)
+		}
+	}
+}
+
+func TestExecuteBatchStopOnError(t *testing.T) {
+	orig := InProcessRunner
+	defer func() { InProcessRunner = orig }()
+
+	var calls int32
+	InProcessRunner = func(ctx context.Context, args []string, out io.Writer) error {
+		atomic.AddInt32(&calls, 1)
+		return errors.New("boom")
+	}
+
+	ops := make([]interface{}, 5)
+	for i := range ops {
+		ops[i] = map[string]interface{}{
+			"tool":      "list_entries",
+			"arguments": map[string]interface{}{"file": "tracking.yaml"},
+		}
+	}
+	output, err := ExecuteHandler(ToolPrefix+"batch", map[string]interface{}{
+		"operations":     ops,
+		"max_concurrent": float64(1),
+		"stop_on_error":  true,
+	})
+	if err != nil {
+		t.Fatalf("ExecuteHandler(batch) error = %v", err)
+	}
+
+	var results []BatchResult
+	if err := json.Unmarshal([]byte(output), &results); err != nil {
+		t.Fatalf("failed to parse batch output: %v", err)
+	}
+	if calls != 1 {
+		t.Errorf("expected 1 operation to run before stopping, got %d", calls)
+	}
+	skipped := 0
+	for _, r := range results {
+		if r.Status == "skipped" {
+			skipped++
+		}
+	}
+	if skipped != 4 {
+		t.Errorf("expected 4 skipped operations, got %d", skipped)
+	}
+}
+
+func TestExecuteBatchStopOnErrorWithOutput(t *testing.T) {
+	orig := InProcessRunner
+	defer func() { InProcessRunner = orig }()
+
+	var calls int32
+	InProcessRunner = func(ctx context.Context, args []string, out io.Writer) error {
+		atomic.AddInt32(&calls, 1)
+		fmt.Fprint(out, `{"err":true,"msg":"tracking file not found"}`)
+		return errors.New("boom")
+	}
+
+	ops := make([]interface{}, 5)
+	for i := range ops {
+		ops[i] = map[string]interface{}{
+			"tool":      "list_entries",
+			"arguments": map[string]interface{}{"file": "tracking.yaml"},
+		}
+	}
+	output, err := ExecuteHandler(ToolPrefix+"batch", map[string]interface{}{
+		"operations":     ops,
+		"max_concurrent": float64(1),
+		"stop_on_error":  true,
+	})
+	if err != nil {
+		t.Fatalf("ExecuteHandler(batch) error = %v", err)
+	}
+
+	var results []BatchResult
+	if err := json.Unmarshal([]byte(output), &results); err != nil {
+		t.Fatalf("failed to parse batch output: %v", err)
+	}
+	if calls != 1 {
+		t.Errorf("expected 1 operation to run before stopping, got %d", calls)
+	}
+	skipped := 0
+	for _, r := range results {
+		switch r.Status {
+		case "skipped":
+			skipped++
+		case "error":
+			if !strings.Contains(r.Output, "tracking file not found") {
+				t.Errorf("expected failed operation to carry its output, got %q", r.Output)
+			}
+		default:
+			t.Errorf("operation %d status = %q, want error or skipped", r.Index, r.Status)
+		}
+	}
+	if skipped != 4 {
+		t.Errorf("expected 4 skipped operations, got %d", skipped)
+	}
+}
+
+func TestExecuteBatchRequiresOperations(t *testing.T) {
+	if _, err := ExecuteHandler(ToolPrefix+"batch", map[string]interface{}{}); err == nil {
+		t.Error("expected error for missing operations")
+	}
+}
+
+func TestExecuteBatchDoesNotEscapeHTML(t *testing.T) {
+	orig := InProcessRunner
+	defer func() { InProcessRunner = orig }()
+
+	InProcessRunner = func(ctx context.Context, args []string, out io.Writer) error {
+		fmt.Fprint(out, `{"q":"a < b && c > d"}`)
+		return nil
+	}
+
+	output, err := ExecuteHandler(ToolPrefix+"batch", map[string]interface{}{
+		"operations": []interface{}{map[string]interface{}{
+			"tool":      "list_entries",
+			"arguments": map[string]interface{}{"file": "tracking.yaml"},
+		}},
+	})
+	if err != nil {
+		t.Fatalf("ExecuteHandler(batch) error = %v", err)
+	}
+	if strings.Contains(output, `\u003c`) || !strings.Contains(output, "a < b") || strings.HasSuffix(output, "\n") {
+		t.Errorf("batch output should be compact and unescaped, got %q", output)
+	}
+}
+
+func TestExecuteBatchSerializesWrites(t *testing.T) {
+	orig, origPath, origSem := InProcessRunner, BinaryPath, commandSem
+	defer func() { InProcessRunner, BinaryPath, commandSem = orig, origPath, origSem }()
+	InProcessRunner = nil
+	commandSem = make(chan struct{}, 6)
+
+	// A fake binary with an unlocked read-modify-write, as separate
+	// llm-clarification processes sharing a YAML file would do
+	dir := t.TempDir()
+	BinaryPath = filepath.Join(dir, "llm-clarification")
+	script := `#!/bin/sh
+while [ $# -gt 0 ]; do
+	case "$1" in
+		--file) file=$2; shift ;;
+		--question) question=$2; shift ;;
+	esac
+	shift
+done
+old=$(cat "$file")
+sleep 0.02
+printf '%s\n%s' "$old" "$question" > "$file"
+echo '{"status":"added"}'
+`
+	if err := os.WriteFile(BinaryPath, []byte(script), 0755); err != nil {
+		t.Fatal(err)
+	}
+	tracking := filepath.Join(dir, "tracking.yaml")
+	if err := os.WriteFile(tracking, nil, 0644); err != nil {
+		t.Fatal(err)
+	}
+
+	var ops []interface{}
+	for i := 0; i < 6; i++ {
+		ops = append(ops, map[string]interface{}{
+			"tool":      "add_clarification",
+			"arguments": map[string]interface{}{"file": tracking, "question": fmt.Sprintf("q%d", i)},
+		})
+	}
+	if _, err := ExecuteHandler(ToolPrefix+"batch", map[string]interface{}{"operations": ops, "max_concurrent": float64(6)}); err != nil {
+		t.Fatalf("batch error = %v", err)
+	}
+
+	data, err := os.ReadFile(tracking)
+	if err != nil {
+		t.Fatal(err)
+	}
+	for i := 0; i < 6; i++ {
+		if q := fmt.Sprintf("q%d", i); !strings.Contains(string(data), q) {
+			t.Errorf("entry %s was lost; file contains %q", q, data)
+		}
+	}
+}
@@ -0,0 +1,109 @@
+package mcpserver
+
+import (
+	"encoding/json"
+	"os"
+	"path/filepath"
+	"strconv"
+	"strings"
+	"time"
+
+	"github.com/samestrin/llm-tools/internal/mcputil"
+)
+
+// ResultCacheTTL is how long a cached analysis result stays valid
+var ResultCacheTTL = 5 * time.Minute
+
+// ResultCacheSize is the maximum number of cached analysis results
+var ResultCacheSize = 256
+
+// analysisFileKeys are the arguments naming files an analysis result depends on
+var analysisFileKeys = []string{"file", "questions_file"}
+
+// writeFileKeys are the arguments naming files a write command may modify
+var writeFileKeys = []string{"file", "output", "target"}
+
+// storageFileKeys are the arguments naming the tracking storage, which
+// CLARIFY_DB_PATH overrides in the CLI
+var storageFileKeys = map[string]bool{"file": true, "output": true, "target": true}
+
+// analysisCache holds results of effectAnalysis commands
+var analysisCache = newResultCache()
+
+func newResultCache() *mcputil.ResultCache {
+	return mcputil.NewResultCache(ResultCacheSize, ResultCacheTTL)
+}
+
+// analysisCacheKey builds the cache key for a tool call. The key combines the
+// command, its canonicalized arguments, and the modification time of every
+// file the command reads, so editing a file outside the MCP server also
+// misses. SQLite storage runs in WAL mode, where commits land in the -wal
+// file before reaching the database itself, so that file is stat'ed too.
+func analysisCacheKey(cmdName string, args map[string]interface{}) (string, bool) {
+	// encoding/json sorts map keys, so equal arguments always encode identically.
+	// Encoding directly into the key avoids an intermediate buffer.
+	var sb strings.Builder
+	sb.WriteString(cmdName)
+	sb.WriteByte(0)
+	enc := json.NewEncoder(&sb)
+	enc.SetEscapeHTML(false)
+	if err := enc.Encode(args); err != nil {
+		return "", false
+	}
+	for _, path := range referencedFiles(args, analysisFileKeys) {
+		info, err := os.Stat(path)
+		if err != nil {
+			return "", false
+		}
+		sb.WriteByte(0)
+		sb.WriteString(path)
+		sb.WriteByte('@')
+		sb.WriteString(strconv.FormatInt(info.ModTime().UnixNano(), 10))
+		if isSQLitePath(path) {
+			sb.WriteByte('+')
+			if wal, err := os.Stat(path + "-wal"); err == nil {
+				sb.WriteString(strconv.FormatInt(wal.ModTime().UnixNano(), 10))
+				sb.WriteByte(':')
+				sb.WriteString(strconv.FormatInt(wal.Size(), 10))
+			}
+		}
+	}
+	return sb.String(), true
+}
+
+// referencedFiles returns the absolute paths of the files named by the given
+// argument keys. Storage is resolved the way the CLI's GetDBPath does: when
+// CLARIFY_DB_PATH is set it replaces any storage argument and is always
+// included, since commands fall back to it when no file is given.
+func referencedFiles(args map[string]interface{}, keys []string) []string {
+	var paths []string
+	dbPath := os.Getenv("CLARIFY_DB_PATH")
+	for _, key := range keys {
+		if dbPath != "" && storageFileKeys[key] {
+			continue
+		}
+		if p, ok := args[key].(string); ok && p != "" {
+			paths = append(paths, absPath(p))
+		}
+	}
+	if dbPath != "" {
+		paths = append(paths, absPath(dbPath))
+	}
+	return paths
+}
+
+func absPath(p string) string {
+	if abs, err := filepath.Abs(p); err == nil {
+		return abs
+	}
+	return p
+}
+
+// isSQLitePath mirrors the storage factory's choice of backend by extension
+func isSQLitePath(path string) bool {
+	switch strings.ToLower(filepath.Ext(path)) {
+	case ".db", ".sqlite", ".sqlite3":
+		return true
+	}
+	return false
+}
@@ -0,0 +1,219 @@
+package mcpserver
+
+import (
+	"context"
+	"fmt"
+	"io"
+	"os"
+	"path/filepath"
+	"testing"
+	"time"
+)
+
+// countingRunner installs an InProcessRunner that counts its invocations
+func countingRunner(t *testing.T) *int {
+	t.Helper()
+	orig := InProcessRunner
+	analysisCache = newResultCache()
+	t.Cleanup(func() {
+		InProcessRunner = orig
+		analysisCache = newResultCache()
+	})
+
+	calls := 0
+	InProcessRunner = func(ctx context.Context, args []string, out io.Writer) error {
+		calls++
+		fmt.Fprintf(out, "result %d", calls)
+		return nil
+	}
+	return &calls
+}
+
+func TestAnalysisCacheHit(t *testing.T) {
+	calls := countingRunner(t)
+	args := map[string]interface{}{"question": "Which ORM?", "entries_json": "[]"}
+
+	first, err := ExecuteHandler(ToolPrefix+"match_clarification", args)
+	if err != nil {
+		t.Fatalf("first call error = %v", err)
+	}
+	second, err := ExecuteHandler(ToolPrefix+"match_clarification", args)
+	if err != nil {
+		t.Fatalf("second call error = %v", err)
+	}
+	if *calls != 1 || first != second {
+		t.Errorf("expected cached result: calls = %d, outputs %q / %q", *calls, first, second)
+	}
+
+	// Different arguments miss
+	if _, err := ExecuteHandler(ToolPrefix+"match_clarification", map[string]interface{}{"question": "Which DB?"}); err != nil {
+		t.Fatalf("third call error = %v", err)
+	}
+	if *calls != 2 {
+		t.Errorf("expected cache miss for different args, calls = %d", *calls)
+	}
+}
+
+func TestAnalysisCacheSkipsWriteCommands(t *testing.T) {
+	calls := countingRunner(t)
+	args := map[string]interface{}{"file": "tracking.yaml"}
+
+	for i := 0; i < 2; i++ {
+		if _, err := ExecuteHandler(ToolPrefix+"list_entries", args); err != nil {
+			t.Fatalf("list_entries error = %v", err)
+		}
+	}
+	if *calls != 2 {
+		t.Errorf("list_entries should not be cached, calls = %d", *calls)
+	}
+}
+
+func TestAnalysisCacheFileChanges(t *testing.T) {
+	calls := countingRunner(t)
+	path := filepath.Join(t.TempDir(), "tracking.yaml")
+	if err := os.WriteFile(path, []byte("entries: []\n"), 0644); err != nil {
+		t.Fatal(err)
+	}
+	args := map[string]interface{}{"file": path}
+
+	ExecuteHandler(ToolPrefix+"detect_conflicts", args)
+	ExecuteHandler(ToolPrefix+"detect_conflicts", args)
+	if *calls != 1 {
+		t.Fatalf("expected cache hit, calls = %d", *calls)
+	}
+
+	// A modified file changes the key
+	future := time.Now().Add(time.Hour)
+	if err := os.Chtimes(path, future, future); err != nil {
+		t.Fatal(err)
+	}
+	ExecuteHandler(ToolPrefix+"detect_conflicts", args)
+	if *calls != 2 {
+		t.Fatalf("expected miss after file change, calls = %d", *calls)
+	}
+
+	// A write through the server invalidates results for that file
+	ExecuteHandler(ToolPrefix+"add_clarification", map[string]interface{}{"file": path, "question": "q", "answer": "a"})
+	ExecuteHandler(ToolPrefix+"detect_conflicts", args)
+	if *calls != 4 {
+		t.Errorf("expected miss after write, calls = %d", *calls)
+	}
+}
+
+func TestAnalysisCacheInvalidatedByAbandonedWrite(t *testing.T) {
+	countingRunner(t)
+	origTimeout := CommandTimeout
+	CommandTimeout = 20 * time.Millisecond
+	t.Cleanup(func() { CommandTimeout = origTimeout })
+
+	path, err := filepath.Abs("tracking.yaml")
+	if err != nil {
+		t.Fatal(err)
+	}
+	analysisCache.Put("conflicts", []string{path}, "cached")
+
+	// The write outlives the handler's timeout and completes afterwards
+	unblock := make(chan struct{})
+	InProcessRunner = func(ctx context.Context, args []string, out io.Writer) error {
+		<-unblock
+		return nil
+	}
+	if _, err := ExecuteHandler(ToolPrefix+"add_clarification", map[string]interface{}{"file": "tracking.yaml", "question": "q", "answer": "a"}); err == nil {
+		t.Fatal("expected timeout error")
+	}
+	close(unblock)
+
+	deadline := time.Now().Add(time.Second)
+	for {
+		if _, ok := analysisCache.Get("conflicts"); !ok {
+			break
+		}
+		if time.Now().After(deadline) {
+			t.Fatal("abandoned write did not invalidate the cache")
+		}
+		time.Sleep(5 * time.Millisecond)
+	}
+}
+
+func TestAnalysisCacheUsesDBPathEnv(t *testing.T) {
+	calls := countingRunner(t)
+	dir := t.TempDir()
+	dbPath := filepath.Join(dir, "clarify.yaml")
+	if err := os.WriteFile(dbPath, []byte("entries: []\n"), 0644); err != nil {
+		t.Fatal(err)
+	}
+	t.Setenv("CLARIFY_DB_PATH", dbPath)
+
+	// The file argument is overridden by CLARIFY_DB_PATH and need not exist
+	args := map[string]interface{}{"file": filepath.Join(dir, "ignored.yaml")}
+	ExecuteHandler(ToolPrefix+"detect_conflicts", args)
+	ExecuteHandler(ToolPrefix+"detect_conflicts", args)
+	if *calls != 1 {
+		t.Fatalf("expected cache hit, calls = %d", *calls)
+	}
+
+	future := time.Now().Add(time.Hour)
+	if err := os.Chtimes(dbPath, future, future); err != nil {
+		t.Fatal(err)
+	}
+	ExecuteHandler(ToolPrefix+"detect_conflicts", args)
+	if *calls != 2 {
+		t.Fatalf("expected miss after storage change, calls = %d", *calls)
+	}
+
+	// A write naming any file invalidates results for the resolved storage
+	ExecuteHandler(ToolPrefix+"add_clarification", map[string]interface{}{"file": "other.yaml", "question": "q", "answer": "a"})
+	ExecuteHandler(ToolPrefix+"detect_conflicts", args)
+	if *calls != 4 {
+		t.Errorf("expected miss after write, calls = %d", *calls)
+	}
+}
+
+func TestAnalysisCacheSQLiteWAL(t *testing.T) {
+	calls := countingRunner(t)
+	path := filepath.Join(t.TempDir(), "tracking.db")
+	if err := os.WriteFile(path, []byte("db"), 0644); err != nil {
+		t.Fatal(err)
+	}
+	args := map[string]interface{}{"file": path}
+
+	ExecuteHandler(ToolPrefix+"detect_conflicts", args)
+	ExecuteHandler(ToolPrefix+"detect_conflicts", args)
+	if *calls != 1 {
+		t.Fatalf("expected cache hit, calls = %d", *calls)
+	}
+
+	// A commit that only reaches the WAL leaves the database file untouched
+	if err := os.WriteFile(path+"-wal", []byte("frame"), 0644); err != nil {
+		t.Fatal(err)
+	}
+	ExecuteHandler(ToolPrefix+"detect_conflicts", args)
+	if *calls != 2 {
+		t.Fatalf("expected miss after WAL write, calls = %d", *calls)
+	}
+
+	if err := os.WriteFile(path+"-wal", []byte("frame frame"), 0644); err != nil {
+		t.Fatal(err)
+	}
+	ExecuteHandler(ToolPrefix+"detect_conflicts", args)
+	if *calls != 3 {
+		t.Errorf("expected miss after WAL growth, calls = %d", *calls)
+	}
+}
+
+func TestAnalysisCacheErrorsNotCached(t *testing.T) {
+	countingRunner(t)
+	calls := 0
+	InProcessRunner = func(ctx context.Context, args []string, out io.Writer) error {
+		calls++
+		fmt.Fprint(out, `{"err":true}`)
+		return fmt.Errorf("api unavailable")
+	}
+
+	args := map[string]interface{}{"questions_json": `["a","b"]`}
+	ExecuteHandler(ToolPrefix+"cluster_clarifications", args)
+	ExecuteHandler(ToolPrefix+"cluster_clarifications", args)
+	if calls != 2 {
+		t.Errorf("failed results should not be cached, calls = %d", calls)
+	}
+}
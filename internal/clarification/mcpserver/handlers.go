@@ -3,392 +3,405 @@ package mcpserver
 import (
 	"context"
 	"fmt"
+	"io"
 	"os"
 	"os/exec"
+	"runtime"
 	"strconv"
 	"strings"
 	"time"
+
+	"github.com/samestrin/llm-tools/internal/mcputil"
 )
 
 // BinaryPath is the path to the llm-clarification binary
 // Defaults to "llm-clarification" (PATH lookup), falls back to /usr/local/bin
 var BinaryPath = "llm-clarification"
 
+// BinaryFound reports whether init located the llm-clarification binary,
+// so callers need not stat BinaryPath again
+var BinaryFound bool
+
 // CommandTimeout is the default timeout for command execution
 var CommandTimeout = 120 * time.Second
 
+// InProcessRunner, when set, runs llm-clarification commands inside the MCP
+// server process instead of spawning the binary for every tool call.
+// cmd/llm-clarification-mcp wires this to commands.ExecuteArgs only when
+// LLM_CLARIFICATION_MCP_IN_PROCESS=true; when nil (the default) the binary at
+// BinaryPath is executed as a subprocess.
+var InProcessRunner func(ctx context.Context, args []string, out io.Writer) error
+
+// MaxConcurrent bounds how many local commands execute at once, so a large
+// batch cannot fork a process per operation. Defaults to the CPU count with a
+// floor of 2 and can be overridden via LLM_CLARIFICATION_MCP_MAX_CONCURRENT.
+// Analysis commands are not counted against it.
+var MaxConcurrent = max(2, runtime.NumCPU())
+
+// MaxConcurrentAPI bounds concurrent API-backed analysis commands to a
+// provider-safe level. They spend their time waiting on the API rather than
+// the CPU, so they draw from this pool instead of MaxConcurrent.
+var MaxConcurrentAPI = 8
+
+// Semaphores enforcing MaxConcurrent and MaxConcurrentAPI, sized in init
+var (
+	commandSem chan struct{}
+	apiSem     chan struct{}
+)
+
+// writeSem runs write commands one at a time. Storage locking is only
+// in-process, so concurrent llm-clarification processes updating the same
+// tracking file would otherwise lose each other's changes.
+var writeSem = make(chan struct{}, 1)
+
 func init() {
-	// Check if binary is in PATH
-	if _, err := exec.LookPath(BinaryPath); err != nil {
+	if v := os.Getenv("LLM_CLARIFICATION_MCP_MAX_CONCURRENT"); v != "" {
+		if n, err := strconv.Atoi(v); err == nil && n > 0 {
+			MaxConcurrent = n
+		}
+	}
+	commandSem = make(chan struct{}, MaxConcurrent)
+	apiSem = make(chan struct{}, MaxConcurrentAPI)
+
+	// Resolve binary to absolute path once; exec.Command would otherwise
+	// repeat the PATH search on every call
+	if resolvedPath, err := exec.LookPath(BinaryPath); err == nil {
+		BinaryPath = resolvedPath
+		BinaryFound = true
+	} else {
 		// Not in PATH, fallback to standard install location
 		if _, err := os.Stat("/usr/local/bin/llm-clarification"); err == nil {
 			BinaryPath = "/usr/local/bin/llm-clarification"
+			BinaryFound = true
 		}
 	}
 }
 
 // ExecuteHandler executes the appropriate command for a tool
 func ExecuteHandler(toolName string, args map[string]interface{}) (string, error) {
-	// Strip prefix
-	cmdName := strings.TrimPrefix(toolName, ToolPrefix)
+	return ExecuteHandlerContext(context.Background(), toolName, args)
+}
 
-	// Build command args
-	cmdArgs, err := buildArgs(cmdName, args)
+// ExecuteHandlerContext executes the appropriate command for a tool.
+// Cancelling ctx (e.g. when the MCP client cancels the request) kills a
+// subprocess command. An in-process command receives the cancelled context
+// and stops at its next storage or LLM API call; a call already in flight
+// finishes first.
+func ExecuteHandlerContext(ctx context.Context, toolName string, args map[string]interface{}) (string, error) {
+	output, cmdErr, err := executeTool(ctx, toolName, args)
 	if err != nil {
 		return "", err
 	}
-
-	// Add --json and --min flags for machine-parseable, token-optimized output
-	cmdArgs = append(cmdArgs, "--json", "--min")
-
-	// Execute command
-	ctx, cancel := context.WithTimeout(context.Background(), CommandTimeout)
-	defer cancel()
-
-	cmd := exec.CommandContext(ctx, BinaryPath, cmdArgs...)
-	output, err := cmd.CombinedOutput()
-
-	if ctx.Err() == context.DeadlineExceeded {
-		return "", fmt.Errorf("command timed out after %v", CommandTimeout)
-	}
-
-	if err != nil {
+	if cmdErr != nil {
 		// Return output even on error (may contain useful error message)
 		if len(output) > 0 {
-			return string(output), nil
+			return output, nil
 		}
-		return "", fmt.Errorf("command failed: %w", err)
+		return "", fmt.Errorf("command failed: %w", cmdErr)
 	}
-
-	return string(output), nil
+	return output, nil
 }
 
-// buildArgs builds CLI arguments for the given tool
-func buildArgs(cmdName string, args map[string]interface{}) ([]string, error) {
-	switch cmdName {
-	case "match_clarification":
-		return buildMatchArgs(args), nil
-	case "cluster_clarifications":
-		return buildClusterArgs(args), nil
-	case "detect_conflicts":
-		return buildDetectConflictsArgs(args), nil
-	case "validate_clarifications":
-		return buildValidateArgs(args), nil
-	case "init_tracking":
-		return buildInitArgs(args), nil
-	case "add_clarification":
-		return buildAddArgs(args), nil
-	case "promote_clarification":
-		return buildPromoteArgs(args), nil
-	case "list_entries":
-		return buildListArgs(args), nil
-	case "delete_clarification":
-		return buildDeleteArgs(args), nil
-	case "export_memory":
-		return buildExportArgs(args), nil
-	case "import_memory":
-		return buildImportArgs(args), nil
-	case "optimize_memory":
-		return buildOptimizeArgs(args), nil
-	case "reconcile_memory":
-		return buildReconcileArgs(args), nil
-	default:
-		return nil, fmt.Errorf("unknown command: %s", cmdName)
-	}
-}
+// executeTool runs a tool call and reports a failed command separately from
+// its output. err is set when the command could not be run at all; cmdErr
+// when it ran and failed, in which case output holds whatever it printed.
+func executeTool(ctx context.Context, toolName string, args map[string]interface{}) (output string, cmdErr error, err error) {
+	// Strip prefix
+	cmdName := strings.TrimPrefix(toolName, ToolPrefix)
 
-func buildMatchArgs(args map[string]interface{}) []string {
-	cmdArgs := []string{"match-clarification"}
-	if q, ok := args["question"].(string); ok {
-		cmdArgs = append(cmdArgs, "--question", q)
-	}
-	if f, ok := args["file"].(string); ok {
-		cmdArgs = append(cmdArgs, "--file", f)
-	}
-	if j, ok := args["entries_json"].(string); ok {
-		cmdArgs = append(cmdArgs, "--entries-json", j)
-	}
-	if t, ok := getInt(args, "timeout"); ok {
-		cmdArgs = append(cmdArgs, "--timeout", strconv.Itoa(t))
+	// Reject malformed calls before paying for a command run
+	if err := validateArgs(cmdName, args); err != nil {
+		return "", nil, err
 	}
-	if getBoolDefault(args, "json", true) {
-		cmdArgs = append(cmdArgs, "--json")
-	}
-	if getBoolDefault(args, "min", true) {
-		cmdArgs = append(cmdArgs, "--min")
-	}
-	return cmdArgs
-}
 
-func buildClusterArgs(args map[string]interface{}) []string {
-	cmdArgs := []string{"cluster-clarifications"}
-	if f, ok := args["questions_file"].(string); ok {
-		cmdArgs = append(cmdArgs, "--questions-file", f)
+	// Batch aggregates other tools rather than mapping to a CLI command
+	if cmdName == batchCommand {
+		output, err := executeBatch(ctx, args)
+		return output, nil, err
 	}
-	if j, ok := args["questions_json"].(string); ok {
-		cmdArgs = append(cmdArgs, "--questions-json", j)
+
+	// A single table lookup yields the command line and how results are cached
+	spec, ok := commandSpecs[cmdName]
+	if !ok {
+		return "", nil, fmt.Errorf("unknown command: %s", cmdName)
 	}
-	if t, ok := getInt(args, "timeout"); ok {
-		cmdArgs = append(cmdArgs, "--timeout", strconv.Itoa(t))
+	cmdArgs := spec.buildArgs(args)
+
+	// Add --json and --min flags for machine-parseable, token-optimized output
+	cmdArgs = append(cmdArgs, "--json", "--min")
+
+	// Read-only analysis results are served from cache while their inputs are unchanged
+	var cacheKey string
+	cacheable := false
+	if spec.effect == effectAnalysis {
+		cacheKey, cacheable = analysisCacheKey(cmdName, args)
+	}
+	if cacheable {
+		if output, ok := analysisCache.Get(cacheKey); ok {
+			return output, nil, nil
+		}
 	}
-	if getBoolDefault(args, "json", true) {
-		cmdArgs = append(cmdArgs, "--json")
+
+	// Any write may change what the analysis commands would return. The cache
+	// is invalidated once the write finishes, whatever its outcome, including
+	// an in-process write that completes after the handler timed out.
+	var finished func()
+	if spec.effect == effectWrite {
+		files := referencedFiles(args, writeFileKeys)
+		finished = func() { analysisCache.Invalidate(files) }
 	}
-	if getBoolDefault(args, "min", true) {
-		cmdArgs = append(cmdArgs, "--min")
+
+	output, cmdErr, err = runLimited(ctx, spec, cmdArgs, finished)
+	if err == nil && cmdErr == nil && cacheable {
+		analysisCache.Put(cacheKey, referencedFiles(args, analysisFileKeys), output)
 	}
-	return cmdArgs
+	return output, cmdErr, err
 }
 
-func buildDetectConflictsArgs(args map[string]interface{}) []string {
-	cmdArgs := []string{"detect-conflicts"}
-	if f, ok := args["file"].(string); ok {
-		cmdArgs = append(cmdArgs, "--file", f)
-	}
-	if t, ok := getInt(args, "timeout"); ok {
-		cmdArgs = append(cmdArgs, "--timeout", strconv.Itoa(t))
+// runLimited executes the command once a concurrency slot is free. Slots are
+// held until the command itself finishes, which for an in-process run
+// abandoned on timeout or cancellation is after runLimited has returned.
+// finished, if non-nil, is called at that point, just before the slots are
+// released.
+func runLimited(ctx context.Context, spec commandSpec, cmdArgs []string, finished func()) (output string, cmdErr error, err error) {
+	release, err := acquireSlots(ctx, spec.effect)
+	if err != nil {
+		return "", nil, err
 	}
-	if getBoolDefault(args, "json", true) {
-		cmdArgs = append(cmdArgs, "--json")
+	if finished != nil {
+		releaseSlots := release
+		release = func() {
+			finished()
+			releaseSlots()
+		}
 	}
-	if getBoolDefault(args, "min", true) {
-		cmdArgs = append(cmdArgs, "--min")
+	if InProcessRunner != nil {
+		return runInProcess(ctx, cmdArgs, release)
 	}
-	return cmdArgs
+	defer release()
+	return runSubprocess(ctx, cmdArgs)
 }
 
-func buildValidateArgs(args map[string]interface{}) []string {
-	cmdArgs := []string{"validate-clarifications"}
-	if f, ok := args["file"].(string); ok {
-		cmdArgs = append(cmdArgs, "--file", f)
-	}
-	if c, ok := args["context"].(string); ok {
-		cmdArgs = append(cmdArgs, "--context", c)
-	}
-	if t, ok := getInt(args, "timeout"); ok {
-		cmdArgs = append(cmdArgs, "--timeout", strconv.Itoa(t))
-	}
-	if getBoolDefault(args, "json", true) {
-		cmdArgs = append(cmdArgs, "--json")
+// acquireSlots takes the semaphores a command of the given effect must hold,
+// returning a function that releases them
+func acquireSlots(ctx context.Context, effect commandEffect) (func(), error) {
+	sems := []chan struct{}{commandSem}
+	switch effect {
+	case effectAnalysis:
+		sems = []chan struct{}{apiSem}
+	case effectWrite:
+		sems = []chan struct{}{writeSem, commandSem}
+	}
+	held := 0
+	release := func() {
+		for i := held - 1; i >= 0; i-- {
+			<-sems[i]
+		}
 	}
-	if getBoolDefault(args, "min", true) {
-		cmdArgs = append(cmdArgs, "--min")
+	for _, sem := range sems {
+		if err := acquire(ctx, sem); err != nil {
+			release()
+			return nil, err
+		}
+		held++
 	}
-	return cmdArgs
+	return release, nil
 }
 
-func buildInitArgs(args map[string]interface{}) []string {
-	cmdArgs := []string{"init-tracking"}
-	if o, ok := args["output"].(string); ok {
-		cmdArgs = append(cmdArgs, "--output", o)
-	}
-	if getBool(args, "force") {
-		cmdArgs = append(cmdArgs, "--force")
+// acquire takes a slot from sem, giving up if ctx ends first
+func acquire(ctx context.Context, sem chan struct{}) error {
+	select {
+	case sem <- struct{}{}:
+		return nil
+	case <-ctx.Done():
+		return contextError(ctx)
 	}
-	if getBoolDefault(args, "json", true) {
-		cmdArgs = append(cmdArgs, "--json")
-	}
-	if getBoolDefault(args, "min", true) {
-		cmdArgs = append(cmdArgs, "--min")
-	}
-	return cmdArgs
 }
 
-func buildAddArgs(args map[string]interface{}) []string {
-	cmdArgs := []string{"add-clarification"}
-	if f, ok := args["file"].(string); ok {
-		cmdArgs = append(cmdArgs, "--file", f)
-	}
-	if q, ok := args["question"].(string); ok {
-		cmdArgs = append(cmdArgs, "--question", q)
-	}
-	if a, ok := args["answer"].(string); ok {
-		cmdArgs = append(cmdArgs, "--answer", a)
-	}
-	if id, ok := args["id"].(string); ok {
-		cmdArgs = append(cmdArgs, "--id", id)
-	}
-	// NOTE: MCP parameter "sprint_id" maps to CLI flag "--sprint"
-	if s, ok := args["sprint_id"].(string); ok {
-		cmdArgs = append(cmdArgs, "--sprint", s)
-	}
-	// NOTE: MCP parameter "context_tags" is comma-separated, maps to multiple --tag flags
-	if t, ok := args["context_tags"].(string); ok && t != "" {
-		for _, tag := range strings.Split(t, ",") {
-			tag = strings.TrimSpace(tag)
-			if tag != "" {
-				cmdArgs = append(cmdArgs, "--tag", tag)
-			}
-		}
-	}
-	if getBool(args, "check_match") {
-		cmdArgs = append(cmdArgs, "--check-match")
-	}
-	if getBoolDefault(args, "json", true) {
-		cmdArgs = append(cmdArgs, "--json")
-	}
-	if getBoolDefault(args, "min", true) {
-		cmdArgs = append(cmdArgs, "--min")
+// contextError describes why a command's context ended
+func contextError(ctx context.Context) error {
+	if ctx.Err() == context.DeadlineExceeded {
+		return fmt.Errorf("command timed out after %v", CommandTimeout)
 	}
-	return cmdArgs
+	return fmt.Errorf("command cancelled: %w", ctx.Err())
 }
 
-func buildPromoteArgs(args map[string]interface{}) []string {
-	cmdArgs := []string{"promote-clarification"}
-	if f, ok := args["file"].(string); ok {
-		cmdArgs = append(cmdArgs, "--file", f)
-	}
-	if id, ok := args["id"].(string); ok {
-		cmdArgs = append(cmdArgs, "--id", id)
-	}
-	if t, ok := args["target"].(string); ok {
-		cmdArgs = append(cmdArgs, "--target", t)
-	}
-	if getBool(args, "force") {
-		cmdArgs = append(cmdArgs, "--force")
-	}
-	if getBoolDefault(args, "json", true) {
-		cmdArgs = append(cmdArgs, "--json")
+// runInProcess executes the command through InProcessRunner. cmdErr is the
+// command's own failure; err reports a timeout or cancellation. done is
+// called once the runner returns, even if that is after a timeout.
+func runInProcess(parent context.Context, cmdArgs []string, done func()) (output string, cmdErr error, err error) {
+	ctx, cancel := context.WithTimeout(parent, CommandTimeout)
+	defer cancel()
+
+	if ctx.Err() != nil {
+		done()
+		return "", nil, contextError(ctx)
 	}
-	if getBoolDefault(args, "min", true) {
-		cmdArgs = append(cmdArgs, "--min")
+
+	// strings.Builder hands its buffer to String() without copying
+	run := InProcessRunner
+	var out strings.Builder
+	result := make(chan error, 1)
+	w, flush := progressOutput(parent, &out)
+	go func() {
+		runErr := run(ctx, cmdArgs, w)
+		flush()
+		done()
+		result <- runErr
+	}()
+
+	select {
+	case runErr := <-result:
+		return out.String(), runErr, nil
+	case <-ctx.Done():
+		return "", nil, contextError(ctx)
 	}
-	return cmdArgs
 }
 
-func buildListArgs(args map[string]interface{}) []string {
-	cmdArgs := []string{"list-entries"}
-	if f, ok := args["file"].(string); ok {
-		cmdArgs = append(cmdArgs, "--file", f)
-	}
-	if s, ok := args["status"].(string); ok {
-		cmdArgs = append(cmdArgs, "--status", s)
-	}
-	if m, ok := getInt(args, "min_occurrences"); ok {
-		cmdArgs = append(cmdArgs, "--min-occurrences", strconv.Itoa(m))
-	}
-	if getBoolDefault(args, "json", true) {
-		cmdArgs = append(cmdArgs, "--json")
-	}
-	if getBoolDefault(args, "min", true) {
-		cmdArgs = append(cmdArgs, "--min")
+// runSubprocess executes the command by spawning the llm-clarification binary.
+// cmdErr is the command's own failure; err reports a timeout or cancellation.
+func runSubprocess(parent context.Context, cmdArgs []string) (output string, cmdErr error, err error) {
+	ctx, cancel := context.WithTimeout(parent, CommandTimeout)
+	defer cancel()
+
+	// CommandContext kills the process when ctx ends; WaitDelay bounds the
+	// wait for its output pipes so a lingering grandchild cannot hang the call
+	cmd := exec.CommandContext(ctx, BinaryPath, cmdArgs...)
+	cmd.WaitDelay = time.Second
+
+	// Stream stdout and stderr into one builder, as CombinedOutput would,
+	// but without the final []byte-to-string copy
+	var out strings.Builder
+	w, flush := progressOutput(parent, &out)
+	cmd.Stdout = w
+	cmd.Stderr = w
+	cmdErr = cmd.Run()
+	flush()
+
+	if ctx.Err() != nil {
+		return "", nil, contextError(ctx)
 	}
-	return cmdArgs
+	return out.String(), cmdErr, nil
 }
 
-func buildDeleteArgs(args map[string]interface{}) []string {
-	cmdArgs := []string{"delete-clarification"}
-	if f, ok := args["file"].(string); ok {
-		cmdArgs = append(cmdArgs, "--file", f)
-	}
-	if id, ok := args["id"].(string); ok {
-		cmdArgs = append(cmdArgs, "--id", id)
-	}
-	if getBool(args, "force") {
-		cmdArgs = append(cmdArgs, "--force")
-	}
-	if getBool(args, "quiet") {
-		cmdArgs = append(cmdArgs, "--quiet")
-	}
-	if getBoolDefault(args, "json", true) {
-		cmdArgs = append(cmdArgs, "--json")
-	}
-	if getBoolDefault(args, "min", true) {
-		cmdArgs = append(cmdArgs, "--min")
-	}
-	return cmdArgs
+// commandEffect classifies what a command does to clarification storage
+type commandEffect int
+
+const (
+	effectRead     commandEffect = iota // reads storage; results are not cached
+	effectAnalysis                      // read-only LLM analysis; results are cached
+	effectWrite                         // modifies storage; invalidates cached results
+)
+
+// commandSpec describes how a tool's arguments become an llm-clarification command line
+type commandSpec struct {
+	subcommand string
+	effect     commandEffect
+	args       []mcputil.ArgSpec
 }
 
-func buildExportArgs(args map[string]interface{}) []string {
-	cmdArgs := []string{"export-memory"}
-	if s, ok := args["source"].(string); ok {
-		cmdArgs = append(cmdArgs, "--source", s)
-	}
-	if o, ok := args["output"].(string); ok {
-		cmdArgs = append(cmdArgs, "--output", o)
-	}
-	if getBool(args, "quiet") {
-		cmdArgs = append(cmdArgs, "--quiet")
-	}
-	if getBoolDefault(args, "json", true) {
-		cmdArgs = append(cmdArgs, "--json")
-	}
-	if getBoolDefault(args, "min", true) {
-		cmdArgs = append(cmdArgs, "--min")
-	}
-	return cmdArgs
+// withOutputFlags appends the --json/--min flags that every command accepts
+func withOutputFlags(specs ...mcputil.ArgSpec) []mcputil.ArgSpec {
+	return append(specs, mcputil.Arg("json", "--json", mcputil.ArgBoolOn), mcputil.Arg("min", "--min", mcputil.ArgBoolOn))
 }
 
-func buildImportArgs(args map[string]interface{}) []string {
-	cmdArgs := []string{"import-memory"}
-	if s, ok := args["source"].(string); ok {
-		cmdArgs = append(cmdArgs, "--source", s)
-	}
-	if t, ok := args["target"].(string); ok {
-		cmdArgs = append(cmdArgs, "--target", t)
-	}
-	if m, ok := args["mode"].(string); ok {
-		cmdArgs = append(cmdArgs, "--mode", m)
-	}
-	if getBool(args, "quiet") {
-		cmdArgs = append(cmdArgs, "--quiet")
-	}
-	if getBoolDefault(args, "json", true) {
-		cmdArgs = append(cmdArgs, "--json")
-	}
-	if getBoolDefault(args, "min", true) {
-		cmdArgs = append(cmdArgs, "--min")
-	}
-	return cmdArgs
+// commandSpecs is the dispatch table mapping tool command names to their CLI
+// subcommand, effect and flags. Flags are emitted in the order listed.
+var commandSpecs = map[string]commandSpec{
+	"match_clarification": {"match-clarification", effectAnalysis, withOutputFlags(
+		mcputil.Arg("question", "--question", mcputil.ArgString),
+		mcputil.Arg("file", "--file", mcputil.ArgString),
+		mcputil.Arg("entries_json", "--entries-json", mcputil.ArgString),
+		mcputil.Arg("timeout", "--timeout", mcputil.ArgInt),
+	)},
+	"cluster_clarifications": {"cluster-clarifications", effectAnalysis, withOutputFlags(
+		mcputil.Arg("questions_file", "--questions-file", mcputil.ArgString),
+		mcputil.Arg("questions_json", "--questions-json", mcputil.ArgString),
+		mcputil.Arg("timeout", "--timeout", mcputil.ArgInt),
+	)},
+	"detect_conflicts": {"detect-conflicts", effectAnalysis, withOutputFlags(
+		mcputil.Arg("file", "--file", mcputil.ArgString),
+		mcputil.Arg("timeout", "--timeout", mcputil.ArgInt),
+	)},
+	"validate_clarifications": {"validate-clarifications", effectAnalysis, withOutputFlags(
+		mcputil.Arg("file", "--file", mcputil.ArgString),
+		mcputil.Arg("context", "--context", mcputil.ArgString),
+		mcputil.Arg("timeout", "--timeout", mcputil.ArgInt),
+	)},
+	"init_tracking": {"init-tracking", effectWrite, withOutputFlags(
+		mcputil.Arg("output", "--output", mcputil.ArgString),
+		mcputil.Arg("force", "--force", mcputil.ArgBool),
+	)},
+	"add_clarification": {"add-clarification", effectWrite, withOutputFlags(
+		mcputil.Arg("file", "--file", mcputil.ArgString),
+		mcputil.Arg("question", "--question", mcputil.ArgString),
+		mcputil.Arg("answer", "--answer", mcputil.ArgString),
+		mcputil.Arg("id", "--id", mcputil.ArgString),
+		// NOTE: MCP parameter "sprint_id" maps to CLI flag "--sprint"
+		mcputil.Arg("sprint_id", "--sprint", mcputil.ArgString),
+		// NOTE: MCP parameter "context_tags" is comma-separated, maps to multiple --tag flags
+		mcputil.Arg("context_tags", "--tag", mcputil.ArgCSV),
+		mcputil.Arg("check_match", "--check-match", mcputil.ArgBool),
+	)},
+	"promote_clarification": {"promote-clarification", effectWrite, withOutputFlags(
+		mcputil.Arg("file", "--file", mcputil.ArgString),
+		mcputil.Arg("id", "--id", mcputil.ArgString),
+		mcputil.Arg("target", "--target", mcputil.ArgString),
+		mcputil.Arg("force", "--force", mcputil.ArgBool),
+	)},
+	"list_entries": {"list-entries", effectRead, withOutputFlags(
+		mcputil.Arg("file", "--file", mcputil.ArgString),
+		mcputil.Arg("status", "--status", mcputil.ArgString),
+		mcputil.Arg("min_occurrences", "--min-occurrences", mcputil.ArgInt),
+	)},
+	"delete_clarification": {"delete-clarification", effectWrite, withOutputFlags(
+		mcputil.Arg("file", "--file", mcputil.ArgString),
+		mcputil.Arg("id", "--id", mcputil.ArgString),
+		mcputil.Arg("force", "--force", mcputil.ArgBool),
+		mcputil.Arg("quiet", "--quiet", mcputil.ArgBool),
+	)},
+	"export_memory": {"export-memory", effectRead, withOutputFlags(
+		mcputil.Arg("source", "--source", mcputil.ArgString),
+		mcputil.Arg("output", "--output", mcputil.ArgString),
+		mcputil.Arg("quiet", "--quiet", mcputil.ArgBool),
+	)},
+	"import_memory": {"import-memory", effectWrite, withOutputFlags(
+		mcputil.Arg("source", "--source", mcputil.ArgString),
+		mcputil.Arg("target", "--target", mcputil.ArgString),
+		mcputil.Arg("mode", "--mode", mcputil.ArgString),
+		mcputil.Arg("quiet", "--quiet", mcputil.ArgBool),
+	)},
+	"optimize_memory": {"optimize-memory", effectWrite, withOutputFlags(
+		mcputil.Arg("file", "--file", mcputil.ArgString),
+		mcputil.Arg("vacuum", "--vacuum", mcputil.ArgBool),
+		mcputil.Arg("prune_stale", "--prune-stale", mcputil.ArgString),
+		mcputil.Arg("stats", "--stats", mcputil.ArgBool),
+		mcputil.Arg("quiet", "--quiet", mcputil.ArgBool),
+	)},
+	"reconcile_memory": {"reconcile-memory", effectWrite, withOutputFlags(
+		mcputil.Arg("file", "--file", mcputil.ArgString),
+		mcputil.Arg("project_root", "--project-root", mcputil.ArgString),
+		mcputil.Arg("dry_run", "--dry-run", mcputil.ArgBool),
+		mcputil.Arg("quiet", "--quiet", mcputil.ArgBool),
+	)},
 }
 
-func buildOptimizeArgs(args map[string]interface{}) []string {
-	cmdArgs := []string{"optimize-memory"}
-	if f, ok := args["file"].(string); ok {
-		cmdArgs = append(cmdArgs, "--file", f)
-	}
-	if getBool(args, "vacuum") {
-		cmdArgs = append(cmdArgs, "--vacuum")
-	}
-	if ps, ok := args["prune_stale"].(string); ok {
-		cmdArgs = append(cmdArgs, "--prune-stale", ps)
-	}
-	if getBool(args, "stats") {
-		cmdArgs = append(cmdArgs, "--stats")
-	}
-	if getBool(args, "quiet") {
-		cmdArgs = append(cmdArgs, "--quiet")
-	}
-	if getBoolDefault(args, "json", true) {
-		cmdArgs = append(cmdArgs, "--json")
-	}
-	if getBoolDefault(args, "min", true) {
-		cmdArgs = append(cmdArgs, "--min")
+// buildArgs builds CLI arguments for the given tool from its commandSpec
+func buildArgs(cmdName string, args map[string]interface{}) ([]string, error) {
+	spec, ok := commandSpecs[cmdName]
+	if !ok {
+		return nil, fmt.Errorf("unknown command: %s", cmdName)
 	}
-	return cmdArgs
+	return spec.buildArgs(args), nil
 }
 
-func buildReconcileArgs(args map[string]interface{}) []string {
-	cmdArgs := []string{"reconcile-memory"}
-	if f, ok := args["file"].(string); ok {
-		cmdArgs = append(cmdArgs, "--file", f)
-	}
-	if pr, ok := args["project_root"].(string); ok {
-		cmdArgs = append(cmdArgs, "--project-root", pr)
-	}
-	if getBool(args, "dry_run") {
-		cmdArgs = append(cmdArgs, "--dry-run")
-	}
-	if getBool(args, "quiet") {
-		cmdArgs = append(cmdArgs, "--quiet")
-	}
-	if getBoolDefault(args, "json", true) {
-		cmdArgs = append(cmdArgs, "--json")
-	}
-	if getBoolDefault(args, "min", true) {
-		cmdArgs = append(cmdArgs, "--min")
-	}
-	return cmdArgs
+// buildArgs renders the command line for args according to the spec
+func (spec commandSpec) buildArgs(args map[string]interface{}) []string {
+	// Size for every flag taking a value, plus the --json --min pair the
+	// handler appends, so the argv is allocated once
+	cmdArgs := make([]string, 1, 1+2*len(spec.args)+2)
+	cmdArgs[0] = spec.subcommand
+	return mcputil.AppendArgs(cmdArgs, spec.args, args)
 }
 
 // Helper functions
@@ -400,23 +413,6 @@ func getBool(args map[string]interface{}, key string) bool {
 	return false
 }
 
-// getBoolDefault returns the bool value for key, or defaultVal if not set.
-// Used for json/min flags that should default to true in MCP context.
-func getBoolDefault(args map[string]interface{}, key string, defaultVal bool) bool {
-	if v, ok := args[key].(bool); ok {
-		return v
-	}
-	return defaultVal
-}
-
 func getInt(args map[string]interface{}, key string) (int, bool) {
-	switch v := args[key].(type) {
-	case int:
-		return v, true
-	case float64:
-		return int(v), true
-	case int64:
-		return int(v), true
-	}
-	return 0, false
+	return mcputil.IntValue(args[key])
 }
@@ -1,10 +1,27 @@
 package mcpserver
 
 import (
+	"context"
+	"errors"
+	"fmt"
+	"io"
 	"reflect"
+	"sync"
+	"sync/atomic"
 	"testing"
+	"time"
 )
 
+// mustBuildArgs builds CLI arguments for a known command, failing the test on error
+func mustBuildArgs(t *testing.T, cmdName string, args map[string]interface{}) []string {
+	t.Helper()
+	got, err := buildArgs(cmdName, args)
+	if err != nil {
+		t.Fatalf("buildArgs(%s) error = %v", cmdName, err)
+	}
+	return got
+}
+
 func TestBuildMatchArgs(t *testing.T) {
 	// Default behavior includes --json --min
 	args := map[string]interface{}{
@@ -13,11 +30,11 @@ func TestBuildMatchArgs(t *testing.T) {
 		"timeout":  float64(60),
 	}
 
-	got := buildMatchArgs(args)
+	got := mustBuildArgs(t, "match_clarification", args)
 	want := []string{"match-clarification", "--question", "What testing framework?", "--file", "tracking.yaml", "--timeout", "60", "--json", "--min"}
 
 	if !reflect.DeepEqual(got, want) {
-		t.Errorf("buildMatchArgs() = %v, want %v", got, want)
+		t.Errorf("buildArgs(match_clarification) = %v, want %v", got, want)
 	}
 
 	// Test with json+min disabled
@@ -26,10 +43,10 @@ func TestBuildMatchArgs(t *testing.T) {
 		"json":     false,
 		"min":      false,
 	}
-	gotNoFlags := buildMatchArgs(argsNoFlags)
+	gotNoFlags := mustBuildArgs(t, "match_clarification", argsNoFlags)
 	wantNoFlags := []string{"match-clarification", "--question", "What testing framework?"}
 	if !reflect.DeepEqual(gotNoFlags, wantNoFlags) {
-		t.Errorf("buildMatchArgs(disabled) = %v, want %v", gotNoFlags, wantNoFlags)
+		t.Errorf("buildArgs(match_clarification, disabled) = %v, want %v", gotNoFlags, wantNoFlags)
 	}
 }
 
@@ -58,9 +75,9 @@ func TestBuildInitArgs(t *testing.T) {
 
 	for _, tt := range tests {
 		t.Run(tt.name, func(t *testing.T) {
-			got := buildInitArgs(tt.args)
+			got := mustBuildArgs(t, "init_tracking", tt.args)
 			if !reflect.DeepEqual(got, tt.want) {
-				t.Errorf("buildInitArgs() = %v, want %v", got, tt.want)
+				t.Errorf("buildArgs(init_tracking) = %v, want %v", got, tt.want)
 			}
 		})
 	}
@@ -75,13 +92,13 @@ func TestBuildAddArgs(t *testing.T) {
 		"context_tags": "testing,frontend",
 	}
 
-	got := buildAddArgs(args)
+	got := mustBuildArgs(t, "add_clarification", args)
 
 	// Check key elements exist
 	expected := []string{"add-clarification", "--file", "tracking.yaml"}
 	for i, exp := range expected {
 		if got[i] != exp {
-			t.Errorf("buildAddArgs()[%d] = %v, want %v", i, got[i], exp)
+			t.Errorf("buildArgs(add_clarification)[%d] = %v, want %v", i, got[i], exp)
 		}
 	}
 
@@ -107,11 +124,11 @@ func TestBuildPromoteArgs(t *testing.T) {
 		"force":  true,
 	}
 
-	got := buildPromoteArgs(args)
+	got := mustBuildArgs(t, "promote_clarification", args)
 	want := []string{"promote-clarification", "--file", "tracking.yaml", "--id", "clarify-001", "--target", "CLAUDE.md", "--force", "--json", "--min"}
 
 	if !reflect.DeepEqual(got, want) {
-		t.Errorf("buildPromoteArgs() = %v, want %v", got, want)
+		t.Errorf("buildArgs(promote_clarification) = %v, want %v", got, want)
 	}
 }
 
@@ -144,9 +161,9 @@ func TestBuildListArgs(t *testing.T) {
 
 	for _, tt := range tests {
 		t.Run(tt.name, func(t *testing.T) {
-			got := buildListArgs(tt.args)
+			got := mustBuildArgs(t, "list_entries", tt.args)
 			if !reflect.DeepEqual(got, tt.want) {
-				t.Errorf("buildListArgs() = %v, want %v", got, tt.want)
+				t.Errorf("buildArgs(list_entries) = %v, want %v", got, tt.want)
 			}
 		})
 	}
@@ -159,11 +176,11 @@ func TestBuildDetectConflictsArgs(t *testing.T) {
 		"timeout": float64(45),
 	}
 
-	got := buildDetectConflictsArgs(args)
+	got := mustBuildArgs(t, "detect_conflicts", args)
 	want := []string{"detect-conflicts", "--file", "tracking.yaml", "--timeout", "45", "--json", "--min"}
 
 	if !reflect.DeepEqual(got, want) {
-		t.Errorf("buildDetectConflictsArgs() = %v, want %v", got, want)
+		t.Errorf("buildArgs(detect_conflicts) = %v, want %v", got, want)
 	}
 }
 
@@ -174,11 +191,11 @@ func TestBuildValidateArgs(t *testing.T) {
 		"context": "React frontend project",
 	}
 
-	got := buildValidateArgs(args)
+	got := mustBuildArgs(t, "validate_clarifications", args)
 	want := []string{"validate-clarifications", "--file", "tracking.yaml", "--context", "React frontend project", "--json", "--min"}
 
 	if !reflect.DeepEqual(got, want) {
-		t.Errorf("buildValidateArgs() = %v, want %v", got, want)
+		t.Errorf("buildArgs(validate_clarifications) = %v, want %v", got, want)
 	}
 }
 
@@ -189,11 +206,11 @@ func TestBuildClusterArgs(t *testing.T) {
 		"timeout":        float64(30),
 	}
 
-	got := buildClusterArgs(args)
+	got := mustBuildArgs(t, "cluster_clarifications", args)
 	want := []string{"cluster-clarifications", "--questions-file", "questions.txt", "--timeout", "30", "--json", "--min"}
 
 	if !reflect.DeepEqual(got, want) {
-		t.Errorf("buildClusterArgs() = %v, want %v", got, want)
+		t.Errorf("buildArgs(cluster_clarifications) = %v, want %v", got, want)
 	}
 }
 
@@ -203,11 +220,11 @@ func TestBuildClusterArgsWithJSON(t *testing.T) {
 		"questions_json": `["q1","q2"]`,
 	}
 
-	got := buildClusterArgs(args)
+	got := mustBuildArgs(t, "cluster_clarifications", args)
 	want := []string{"cluster-clarifications", "--questions-json", `["q1","q2"]`, "--json", "--min"}
 
 	if !reflect.DeepEqual(got, want) {
-		t.Errorf("buildClusterArgs() = %v, want %v", got, want)
+		t.Errorf("buildArgs(cluster_clarifications) = %v, want %v", got, want)
 	}
 }
 
@@ -218,11 +235,11 @@ func TestBuildMatchArgsWithEntriesJSON(t *testing.T) {
 		"entries_json": `[{"q":"test","a":"answer"}]`,
 	}
 
-	got := buildMatchArgs(args)
+	got := mustBuildArgs(t, "match_clarification", args)
 	want := []string{"match-clarification", "--question", "What framework?", "--entries-json", `[{"q":"test","a":"answer"}]`, "--json", "--min"}
 
 	if !reflect.DeepEqual(got, want) {
-		t.Errorf("buildMatchArgs() = %v, want %v", got, want)
+		t.Errorf("buildArgs(match_clarification) = %v, want %v", got, want)
 	}
 }
 
@@ -233,11 +250,11 @@ func TestBuildValidateArgsWithTimeout(t *testing.T) {
 		"timeout": float64(90),
 	}
 
-	got := buildValidateArgs(args)
+	got := mustBuildArgs(t, "validate_clarifications", args)
 	want := []string{"validate-clarifications", "--file", "tracking.yaml", "--timeout", "90", "--json", "--min"}
 
 	if !reflect.DeepEqual(got, want) {
-		t.Errorf("buildValidateArgs() = %v, want %v", got, want)
+		t.Errorf("buildArgs(validate_clarifications) = %v, want %v", got, want)
 	}
 }
 
@@ -250,7 +267,7 @@ func TestBuildAddArgsWithID(t *testing.T) {
 		"check_match": true,
 	}
 
-	got := buildAddArgs(args)
+	got := mustBuildArgs(t, "add_clarification", args)
 
 	// Check for id flag
 	hasID := false
@@ -417,9 +434,9 @@ func TestBuildDeleteArgs(t *testing.T) {
 
 	for _, tt := range tests {
 		t.Run(tt.name, func(t *testing.T) {
-			got := buildDeleteArgs(tt.args)
+			got := mustBuildArgs(t, "delete_clarification", tt.args)
 			if !reflect.DeepEqual(got, tt.want) {
-				t.Errorf("buildDeleteArgs() = %v, want %v", got, tt.want)
+				t.Errorf("buildArgs(delete_clarification) = %v, want %v", got, tt.want)
 			}
 		})
 	}
@@ -454,9 +471,9 @@ func TestBuildExportArgs(t *testing.T) {
 
 	for _, tt := range tests {
 		t.Run(tt.name, func(t *testing.T) {
-			got := buildExportArgs(tt.args)
+			got := mustBuildArgs(t, "export_memory", tt.args)
 			if !reflect.DeepEqual(got, tt.want) {
-				t.Errorf("buildExportArgs() = %v, want %v", got, tt.want)
+				t.Errorf("buildArgs(export_memory) = %v, want %v", got, tt.want)
 			}
 		})
 	}
@@ -492,9 +509,9 @@ func TestBuildImportArgs(t *testing.T) {
 
 	for _, tt := range tests {
 		t.Run(tt.name, func(t *testing.T) {
-			got := buildImportArgs(tt.args)
+			got := mustBuildArgs(t, "import_memory", tt.args)
 			if !reflect.DeepEqual(got, tt.want) {
-				t.Errorf("buildImportArgs() = %v, want %v", got, tt.want)
+				t.Errorf("buildArgs(import_memory) = %v, want %v", got, tt.want)
 			}
 		})
 	}
@@ -538,9 +555,9 @@ func TestBuildOptimizeArgs(t *testing.T) {
 
 	for _, tt := range tests {
 		t.Run(tt.name, func(t *testing.T) {
-			got := buildOptimizeArgs(tt.args)
+			got := mustBuildArgs(t, "optimize_memory", tt.args)
 			if !reflect.DeepEqual(got, tt.want) {
-				t.Errorf("buildOptimizeArgs() = %v, want %v", got, tt.want)
+				t.Errorf("buildArgs(optimize_memory) = %v, want %v", got, tt.want)
 			}
 		})
 	}
@@ -576,9 +593,9 @@ func TestBuildReconcileArgs(t *testing.T) {
 
 	for _, tt := range tests {
 		t.Run(tt.name, func(t *testing.T) {
-			got := buildReconcileArgs(tt.args)
+			got := mustBuildArgs(t, "reconcile_memory", tt.args)
 			if !reflect.DeepEqual(got, tt.want) {
-				t.Errorf("buildReconcileArgs() = %v, want %v", got, tt.want)
+				t.Errorf("buildArgs(reconcile_memory) = %v, want %v", got, tt.want)
 			}
 		})
 	}
@@ -617,3 +634,233 @@ func TestBuildArgsDispatcherNewCommands(t *testing.T) {
 		})
 	}
 }
+
+func TestExecuteHandlerInProcess(t *testing.T) {
+	orig := InProcessRunner
+	defer func() { InProcessRunner = orig }()
+
+	var gotArgs []string
+	InProcessRunner = func(ctx context.Context, args []string, out io.Writer) error {
+		gotArgs = args
+		fmt.Fprint(out, `{"count":0}`)
+		return nil
+	}
+
+	output, err := ExecuteHandler(ToolPrefix+"list_entries", map[string]interface{}{"file": "tracking.yaml"})
+	if err != nil {
+		t.Fatalf("ExecuteHandler() error = %v", err)
+	}
+	if output != `{"count":0}` {
+		t.Errorf("ExecuteHandler() output = %q", output)
+	}
+	want := []string{"list-entries", "--file", "tracking.yaml", "--json", "--min", "--json", "--min"}
+	if !reflect.DeepEqual(gotArgs, want) {
+		t.Errorf("runner args = %v, want %v", gotArgs, want)
+	}
+}
+
+func TestExecuteHandlerInProcessError(t *testing.T) {
+	orig := InProcessRunner
+	defer func() { InProcessRunner = orig }()
+
+	// Error with output: output is returned (mirrors the binary's exit-with-message behavior)
+	InProcessRunner = func(ctx context.Context, args []string, out io.Writer) error {
+		fmt.Fprint(out, `{"err":true,"msg":"entry not found"}`)
+		return errors.New("entry not found")
+	}
+	output, err := ExecuteHandler(ToolPrefix+"delete_clarification", map[string]interface{}{"file": "tracking.yaml", "id": "x"})
+	if err != nil {
+		t.Fatalf("ExecuteHandler() error = %v", err)
+	}
+	if output != `{"err":true,"msg":"entry not found"}` {
+		t.Errorf("ExecuteHandler() output = %q", output)
+	}
+
+	// Error without output: error is surfaced
+	InProcessRunner = func(ctx context.Context, args []string, out io.Writer) error {
+		return errors.New("boom")
+	}
+	if _, err := ExecuteHandler(ToolPrefix+"list_entries", nil); err == nil {
+		t.Error("ExecuteHandler() expected error when runner fails without output")
+	}
+}
+
+func TestExecuteHandlerContextCancelled(t *testing.T) {
+	orig := InProcessRunner
+	defer func() { InProcessRunner = orig }()
+
+	release := make(chan struct{})
+	defer close(release)
+	InProcessRunner = func(ctx context.Context, args []string, out io.Writer) error {
+		<-release
+		return nil
+	}
+
+	ctx, cancel := context.WithCancel(context.Background())
+	cancel()
+
+	_, err := ExecuteHandlerContext(ctx, ToolPrefix+"list_entries", map[string]interface{}{"file": "t.yaml"})
+	if err == nil || !errors.Is(err, context.Canceled) {
+		t.Errorf("ExecuteHandlerContext() error = %v, want context.Canceled", err)
+	}
+}
+
+func TestExecuteHandlerCancelStopsInProcessCommand(t *testing.T) {
+	orig := InProcessRunner
+	defer func() { InProcessRunner = orig }()
+
+	started, stopped := make(chan struct{}), make(chan struct{})
+	InProcessRunner = func(ctx context.Context, args []string, out io.Writer) error {
+		close(started)
+		<-ctx.Done()
+		close(stopped)
+		return ctx.Err()
+	}
+
+	ctx, cancel := context.WithCancel(context.Background())
+	go func() {
+		<-started
+		cancel()
+	}()
+
+	if _, err := ExecuteHandlerContext(ctx, ToolPrefix+"list_entries", map[string]interface{}{"file": "t.yaml"}); !errors.Is(err, context.Canceled) {
+		t.Errorf("ExecuteHandlerContext() error = %v, want context.Canceled", err)
+	}
+	select {
+	case <-stopped:
+	case <-time.After(time.Second):
+		t.Error("in-process command kept running after cancellation")
+	}
+}
+
+func TestBuildArgsContextTags(t *testing.T) {
+	args := map[string]interface{}{
+		"file":         "tracking.yaml",
+		"question":     "Q?",
+		"answer":       "A",
+		"sprint_id":    "sprint-2",
+		"context_tags": " testing, ,frontend ",
+		"json":         false,
+		"min":          false,
+	}
+
+	got := mustBuildArgs(t, "add_clarification", args)
+	want := []string{"add-clarification", "--file", "tracking.yaml", "--question", "Q?", "--answer", "A", "--sprint", "sprint-2", "--tag", "testing", "--tag", "frontend"}
+	if !reflect.DeepEqual(got, want) {
+		t.Errorf("buildArgs(add_clarification) = %v, want %v", got, want)
+	}
+}
+
+func TestCommandSpecsCoverTools(t *testing.T) {
+	for _, tool := range GetToolDefinitions() {
+		cmdName := tool.Name[len(ToolPrefix):]
+		if cmdName == batchCommand {
+			continue
+		}
+		if _, ok := commandSpecs[cmdName]; !ok {
+			t.Errorf("tool %s has no command spec", tool.Name)
+		}
+	}
+}
+
+func TestExecuteHandlerBoundsConcurrency(t *testing.T) {
+	orig, origSem := InProcessRunner, commandSem
+	defer func() { InProcessRunner, commandSem = orig, origSem }()
+
+	commandSem = make(chan struct{}, 2)
+	var running, peak int32
+	InProcessRunner = func(ctx context.Context, args []string, out io.Writer) error {
+		n := atomic.AddInt32(&running, 1)
+		for {
+			p := atomic.LoadInt32(&peak)
+			if n <= p || atomic.CompareAndSwapInt32(&peak, p, n) {
+				break
+			}
+		}
+		time.Sleep(10 * time.Millisecond)
+		atomic.AddInt32(&running, -1)
+		return nil
+	}
+
+	var wg sync.WaitGroup
+	for i := 0; i < 8; i++ {
+		wg.Add(1)
+		go func() {
+			defer wg.Done()
+			ExecuteHandler(ToolPrefix+"list_entries", map[string]interface{}{"file": "t.yaml"})
+		}()
+	}
+	wg.Wait()
+
+	if peak > 2 {
+		t.Errorf("expected at most 2 concurrent commands, saw %d", peak)
+	}
+}
+
+func TestExecuteHandlerAnalysisUsesAPIPool(t *testing.T) {
+	countingRunner(t)
+	origCmd, origAPI := commandSem, apiSem
+	defer func() { commandSem, apiSem = origCmd, origAPI }()
+
+	// Local commands hold every CPU slot
+	commandSem, apiSem = make(chan struct{}, 1), make(chan struct{}, 1)
+	commandSem <- struct{}{}
+
+	if _, err := ExecuteHandler(ToolPrefix+"match_clarification", map[string]interface{}{"question": "q"}); err != nil {
+		t.Fatalf("analysis command blocked by local commands: %v", err)
+	}
+
+	// A full API pool still makes analysis wait
+	apiSem <- struct{}{}
+	ctx, cancel := context.WithTimeout(context.Background(), 50*time.Millisecond)
+	defer cancel()
+	if _, err := ExecuteHandlerContext(ctx, ToolPrefix+"match_clarification", map[string]interface{}{"question": "other"}); err == nil {
+		t.Error("expected analysis command to wait for an API slot")
+	}
+}
+
+func TestExecuteHandlerHoldsSlotForAbandonedRun(t *testing.T) {
+	orig, origSem, origTimeout := InProcessRunner, commandSem, CommandTimeout
+	defer func() { InProcessRunner, commandSem, CommandTimeout = orig, origSem, origTimeout }()
+
+	commandSem = make(chan struct{}, 1)
+	CommandTimeout = 20 * time.Millisecond
+	var runs int32
+	unblock := make(chan struct{})
+	InProcessRunner = func(ctx context.Context, args []string, out io.Writer) error {
+		atomic.AddInt32(&runs, 1)
+		<-unblock // ignores ctx, like a command stuck in an API call
+		return nil
+	}
+	args := map[string]interface{}{"file": "t.yaml"}
+
+	if _, err := ExecuteHandler(ToolPrefix+"list_entries", args); err == nil {
+		t.Fatal("expected the first call to time out")
+	}
+	// The abandoned run still holds the only slot
+	ctx, cancel := context.WithTimeout(context.Background(), 50*time.Millisecond)
+	defer cancel()
+	if _, err := ExecuteHandlerContext(ctx, ToolPrefix+"list_entries", args); err == nil {
+		t.Error("expected the second call to give up waiting for a slot")
+	}
+	if n := atomic.LoadInt32(&runs); n != 1 {
+		t.Errorf("runner started %d times while the slot was held, want 1", n)
+	}
+
+	close(unblock)
+	CommandTimeout = time.Second
+	if _, err := ExecuteHandler(ToolPrefix+"list_entries", args); err != nil {
+		t.Errorf("slot should be free once the abandoned run returns: %v", err)
+	}
+}
+
+func TestBuildArgsPreallocates(t *testing.T) {
+	args := map[string]interface{}{"output": "tracking.yaml", "force": true}
+	allocs := testing.AllocsPerRun(100, func() {
+		cmdArgs := commandSpecs["init_tracking"].buildArgs(args)
+		_ = append(cmdArgs, "--json", "--min")
+	})
+	if allocs > 1 {
+		t.Errorf("buildArgs allocated %v times, want 1", allocs)
+	}
+}
@@ -0,0 +1,113 @@
+package mcpserver
+
+import (
+	"bytes"
+	"context"
+	"io"
+	"sync"
+)
+
+// ProgressFunc receives each line of command output as it is produced
+type ProgressFunc func(line string)
+
+type progressKey struct{}
+
+// WithProgress returns a context that reports command output line by line to fn.
+// The complete output is still returned by ExecuteHandlerContext. A final line
+// without a trailing newline is reported when its command finishes.
+//
+// Calls to fn are serialized, so fn may keep state such as a line counter even
+// when a batch runs operations concurrently. Calling stop reports any such
+// final line still buffered and then suppresses further calls, e.g. from an
+// in-process run abandoned after the request finished.
+func WithProgress(ctx context.Context, fn ProgressFunc) (_ context.Context, stop func()) {
+	r := &progressReporter{fn: fn, writers: make(map[*progressWriter]struct{})}
+	return context.WithValue(ctx, progressKey{}, r), r.stop
+}
+
+// progressReporter serializes calls to a ProgressFunc until stopped. It
+// tracks the writers of commands still running so stop can flush them.
+type progressReporter struct {
+	mu      sync.Mutex
+	fn      ProgressFunc
+	stopped bool
+	writers map[*progressWriter]struct{}
+}
+
+func (r *progressReporter) stop() {
+	r.mu.Lock()
+	defer r.mu.Unlock()
+	if r.stopped {
+		return
+	}
+	for p := range r.writers {
+		p.flushLocked()
+	}
+	r.writers = nil
+	r.stopped = true
+}
+
+// progressOutput wraps w so complete lines are also sent to the context's
+// ProgressFunc, if any. flush reports a trailing partial line and must be
+// called once the command has finished writing.
+func progressOutput(ctx context.Context, w io.Writer) (_ io.Writer, flush func()) {
+	r, ok := ctx.Value(progressKey{}).(*progressReporter)
+	if !ok {
+		return w, func() {}
+	}
+	p := &progressWriter{w: w, r: r}
+	r.mu.Lock()
+	if !r.stopped {
+		r.writers[p] = struct{}{}
+	}
+	r.mu.Unlock()
+	return p, p.flush
+}
+
+// progressWriter forwards each complete, non-empty line written through it to
+// its reporter. partial is guarded by the reporter's mutex.
+type progressWriter struct {
+	w       io.Writer
+	r       *progressReporter
+	partial []byte
+}
+
+func (p *progressWriter) Write(b []byte) (int, error) {
+	n, err := p.w.Write(b)
+
+	p.r.mu.Lock()
+	defer p.r.mu.Unlock()
+	if p.r.stopped {
+		return n, err
+	}
+	p.partial = append(p.partial, b[:n]...)
+	for {
+		i := bytes.IndexByte(p.partial, '\n')
+		if i < 0 {
+			break
+		}
+		if i > 0 {
+			p.r.fn(string(p.partial[:i]))
+		}
+		p.partial = p.partial[i+1:]
+	}
+	return n, err
+}
+
+func (p *progressWriter) flush() {
+	p.r.mu.Lock()
+	defer p.r.mu.Unlock()
+	if p.r.stopped {
+		return
+	}
+	p.flushLocked()
+	delete(p.r.writers, p)
+}
+
+// flushLocked reports the buffered partial line; the reporter's mutex must be held
+func (p *progressWriter) flushLocked() {
+	if len(p.partial) > 0 {
+		p.r.fn(string(p.partial))
+		p.partial = nil
+	}
+}
@@ -0,0 +1,114 @@
+package mcpserver
+
+import (
+	"context"
+	"fmt"
+	"io"
+	"reflect"
+	"sync"
+	"testing"
+)
+
+func TestExecuteHandlerProgress(t *testing.T) {
+	orig := InProcessRunner
+	defer func() { InProcessRunner = orig }()
+
+	InProcessRunner = func(ctx context.Context, args []string, out io.Writer) error {
+		fmt.Fprint(out, "clustering 2 questions\n\n")
+		fmt.Fprint(out, "{\"clusters\":")
+		fmt.Fprint(out, "[]}\n")
+		return nil
+	}
+
+	var lines []string
+	ctx, stop := WithProgress(context.Background(), func(line string) {
+		lines = append(lines, line)
+	})
+	defer stop()
+
+	output, err := ExecuteHandlerContext(ctx, ToolPrefix+"list_entries", map[string]interface{}{"file": "t.yaml"})
+	if err != nil {
+		t.Fatalf("ExecuteHandlerContext() error = %v", err)
+	}
+	if output != "clustering 2 questions\n\n{\"clusters\":[]}\n" {
+		t.Errorf("full output should still be returned, got %q", output)
+	}
+	want := []string{"clustering 2 questions", `{"clusters":[]}`}
+	if !reflect.DeepEqual(lines, want) {
+		t.Errorf("progress lines = %q, want %q", lines, want)
+	}
+}
+
+func TestWithProgressSerializesAndStops(t *testing.T) {
+	var count int
+	ctx, stop := WithProgress(context.Background(), func(line string) {
+		count++ // unsynchronized on purpose; calls must already be serialized
+	})
+
+	var wg sync.WaitGroup
+	for i := 0; i < 8; i++ {
+		wg.Add(1)
+		go func() {
+			defer wg.Done()
+			w, flush := progressOutput(ctx, io.Discard)
+			defer flush()
+			for j := 0; j < 50; j++ {
+				fmt.Fprintln(w, "line")
+			}
+		}()
+	}
+	wg.Wait()
+	if count != 400 {
+		t.Errorf("progress calls = %d, want 400", count)
+	}
+
+	stop()
+	w, _ := progressOutput(ctx, io.Discard)
+	fmt.Fprintln(w, "late line")
+	if count != 400 {
+		t.Error("progress reported after stop")
+	}
+}
+
+func TestExecuteHandlerProgressReportsFinalPartialLine(t *testing.T) {
+	orig := InProcessRunner
+	defer func() { InProcessRunner = orig }()
+
+	InProcessRunner = func(ctx context.Context, args []string, out io.Writer) error {
+		fmt.Fprint(out, "step 1\n{\"entries\":[]}")
+		return nil
+	}
+
+	var lines []string
+	ctx, stop := WithProgress(context.Background(), func(line string) {
+		lines = append(lines, line)
+	})
+	defer stop()
+
+	if _, err := ExecuteHandlerContext(ctx, ToolPrefix+"list_entries", map[string]interface{}{"file": "t.yaml"}); err != nil {
+		t.Fatalf("ExecuteHandlerContext() error = %v", err)
+	}
+	want := []string{"step 1", `{"entries":[]}`}
+	if !reflect.DeepEqual(lines, want) {
+		t.Errorf("progress lines = %q, want %q", lines, want)
+	}
+}
+
+func TestWithProgressStopFlushesPartialLine(t *testing.T) {
+	var lines []string
+	ctx, stop := WithProgress(context.Background(), func(line string) {
+		lines = append(lines, line)
+	})
+
+	// A command still running when the request ends
+	w, flush := progressOutput(ctx, io.Discard)
+	fmt.Fprint(w, "done\npartial")
+	stop()
+	flush()
+	fmt.Fprint(w, " more\n")
+
+	want := []string{"done", "partial"}
+	if !reflect.DeepEqual(lines, want) {
+		t.Errorf("progress lines = %q, want %q", lines, want)
+	}
+}
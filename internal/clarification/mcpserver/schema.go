@@ -0,0 +1,34 @@
+package mcpserver
+
+import (
+	"fmt"
+	"strings"
+
+	"github.com/samestrin/llm-tools/internal/mcputil"
+)
+
+// argValidators holds one validator per command, compiled once from the tool definitions
+var argValidators = compileValidators(toolDefinitions)
+
+func compileValidators(defs []ToolDefinition) map[string]*mcputil.Validator {
+	validators := make(map[string]*mcputil.Validator, len(defs))
+	for _, def := range defs {
+		v, err := mcputil.CompileValidator(def.InputSchema, nil)
+		if err != nil {
+			panic(fmt.Sprintf("invalid input schema for %s: %v", def.Name, err))
+		}
+		validators[strings.TrimPrefix(def.Name, ToolPrefix)] = v
+	}
+	return validators
+}
+
+// validateArgs rejects missing required arguments and values of the wrong
+// JSON type before any command is built or run. Commands without a
+// compiled validator are left to buildArgs to reject.
+func validateArgs(cmdName string, args map[string]interface{}) error {
+	v, ok := argValidators[cmdName]
+	if !ok {
+		return nil
+	}
+	return v.Validate(args)
+}
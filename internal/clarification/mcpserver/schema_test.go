@@ -0,0 +1,67 @@
+package mcpserver
+
+import (
+	"context"
+	"io"
+	"strings"
+	"testing"
+)
+
+func TestValidateArgs(t *testing.T) {
+	tests := []struct {
+		name    string
+		cmd     string
+		args    map[string]interface{}
+		wantErr string
+	}{
+		{"valid", "match_clarification", map[string]interface{}{"question": "q", "timeout": float64(30)}, ""},
+		{"missing required", "add_clarification", map[string]interface{}{"file": "t.yaml"}, `missing required argument "question"`},
+		{"wrong string type", "list_entries", map[string]interface{}{"file": float64(1)}, `"file" must be of type string`},
+		{"fractional integer", "match_clarification", map[string]interface{}{"question": "q", "timeout": 1.5}, `"timeout" must be of type integer`},
+		{"wrong boolean type", "list_entries", map[string]interface{}{"file": "t.yaml", "json": "yes"}, `"json" must be of type boolean`},
+		{"wrong array type", "batch", map[string]interface{}{"operations": "list_entries"}, `"operations" must be of type array`},
+		{"undeclared key ignored", "list_entries", map[string]interface{}{"file": "t.yaml", "extra": 1}, ""},
+		{"unknown command", "nonexistent", map[string]interface{}{}, ""},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			err := validateArgs(tt.cmd, tt.args)
+			if tt.wantErr == "" {
+				if err != nil {
+					t.Errorf("validateArgs() error = %v", err)
+				}
+				return
+			}
+			if err == nil || !strings.Contains(err.Error(), tt.wantErr) {
+				t.Errorf("validateArgs() error = %v, want %q", err, tt.wantErr)
+			}
+		})
+	}
+}
+
+func TestCompileValidatorsCoversTools(t *testing.T) {
+	for _, def := range GetToolDefinitions() {
+		if _, ok := argValidators[strings.TrimPrefix(def.Name, ToolPrefix)]; !ok {
+			t.Errorf("no validator compiled for %s", def.Name)
+		}
+	}
+}
+
+func TestExecuteHandlerRejectsInvalidArgsWithoutRunning(t *testing.T) {
+	orig := InProcessRunner
+	defer func() { InProcessRunner = orig }()
+
+	ran := false
+	InProcessRunner = func(ctx context.Context, args []string, out io.Writer) error {
+		ran = true
+		return nil
+	}
+
+	if _, err := ExecuteHandler(ToolPrefix+"delete_clarification", map[string]interface{}{"file": "t.yaml"}); err == nil {
+		t.Error("expected error for missing id")
+	}
+	if ran {
+		t.Error("command should not run when arguments are invalid")
+	}
+}
@@ -8,9 +8,9 @@ import (
 func TestGetToolDefinitions(t *testing.T) {
 	tools := GetToolDefinitions()
 
-	// Verify we have exactly 13 tools
-	if len(tools) != 13 {
-		t.Errorf("Expected 13 tools, got %d", len(tools))
+	// Verify we have exactly 14 tools
+	if len(tools) != 14 {
+		t.Errorf("Expected 14 tools, got %d", len(tools))
 	}
 
 	// Verify all tools have the correct prefix
@@ -48,6 +48,7 @@ func TestGetToolDefinitions(t *testing.T) {
 		"llm_clarification_import_memory",
 		"llm_clarification_optimize_memory",
 		"llm_clarification_reconcile_memory",
+		"llm_clarification_batch",
 	}
 
 	toolMap := make(map[string]bool)
@@ -177,3 +178,12 @@ func containsHelper(s, substr string) bool {
 	}
 	return false
 }
+
+func TestGetToolDefinitionsCached(t *testing.T) {
+	first := GetToolDefinitions()
+	second := GetToolDefinitions()
+
+	if len(first) == 0 || &first[0] != &second[0] {
+		t.Error("GetToolDefinitions() should return the same cached slice on every call")
+	}
+}
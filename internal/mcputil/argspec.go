@@ -0,0 +1,116 @@
+package mcputil
+
+import (
+	"strconv"
+	"strings"
+)
+
+// ArgKind describes how an MCP argument maps onto CLI flags
+type ArgKind int
+
+const (
+	ArgPositional ArgKind = iota // <value> without a flag when the argument is a string
+	ArgString                    // --flag <value> when the argument is a string
+	ArgNonEmpty                  // --flag <value> when the argument is a non-empty string
+	ArgInt                       // --flag <n> when the argument is a number
+	ArgBool                      // --flag when the argument is true
+	ArgBoolOn                    // --flag unless the argument is false (json/min default on in MCP)
+	ArgBoolOff                   // flag (written as --name=false) when the argument is false, for CLI flags defaulting to on
+	ArgStringList                // --flag <item> for each string in an array argument
+	ArgCSV                       // --flag <item> for each item of a comma-separated string
+	ArgAlways                    // --flag on every call; key is unused
+)
+
+// ArgSpec maps one MCP argument to its CLI flag
+type ArgSpec struct {
+	Key  string
+	Flag string
+	Kind ArgKind
+}
+
+// Arg returns the ArgSpec mapping key to flag
+func Arg(key, flag string, kind ArgKind) ArgSpec {
+	return ArgSpec{Key: key, Flag: flag, Kind: kind}
+}
+
+// AppendArgs renders args onto cmdArgs according to specs, in the order
+// listed. Values of the wrong type are skipped. Callers that size cmdArgs
+// for two entries per spec row avoid reallocating.
+func AppendArgs(cmdArgs []string, specs []ArgSpec, args map[string]interface{}) []string {
+	for _, a := range specs {
+		if a.Kind == ArgAlways {
+			cmdArgs = append(cmdArgs, a.Flag)
+			continue
+		}
+		// One map lookup per spec row; absent keys only matter for
+		// flags that default to on
+		v, present := args[a.Key]
+		if !present {
+			if a.Kind == ArgBoolOn {
+				cmdArgs = append(cmdArgs, a.Flag)
+			}
+			continue
+		}
+		switch a.Kind {
+		case ArgPositional:
+			if s, ok := v.(string); ok {
+				cmdArgs = append(cmdArgs, s)
+			}
+		case ArgString:
+			if s, ok := v.(string); ok {
+				cmdArgs = append(cmdArgs, a.Flag, s)
+			}
+		case ArgNonEmpty:
+			if s, ok := v.(string); ok && s != "" {
+				cmdArgs = append(cmdArgs, a.Flag, s)
+			}
+		case ArgInt:
+			if n, ok := IntValue(v); ok {
+				cmdArgs = append(cmdArgs, a.Flag, strconv.Itoa(n))
+			}
+		case ArgBool:
+			if b, ok := v.(bool); ok && b {
+				cmdArgs = append(cmdArgs, a.Flag)
+			}
+		case ArgBoolOn:
+			if b, ok := v.(bool); !ok || b {
+				cmdArgs = append(cmdArgs, a.Flag)
+			}
+		case ArgBoolOff:
+			if b, ok := v.(bool); ok && !b {
+				cmdArgs = append(cmdArgs, a.Flag)
+			}
+		case ArgStringList:
+			if items, ok := v.([]interface{}); ok {
+				for _, item := range items {
+					if s, ok := item.(string); ok {
+						cmdArgs = append(cmdArgs, a.Flag, s)
+					}
+				}
+			}
+		case ArgCSV:
+			if s, ok := v.(string); ok && s != "" {
+				for _, item := range strings.Split(s, ",") {
+					item = strings.TrimSpace(item)
+					if item != "" {
+						cmdArgs = append(cmdArgs, a.Flag, item)
+					}
+				}
+			}
+		}
+	}
+	return cmdArgs
+}
+
+// IntValue converts a decoded JSON number to int
+func IntValue(val interface{}) (int, bool) {
+	switch v := val.(type) {
+	case int:
+		return v, true
+	case float64:
+		return int(v), true
+	case int64:
+		return int(v), true
+	}
+	return 0, false
+}
@@ -0,0 +1,60 @@
+package mcputil
+
+import (
+	"reflect"
+	"testing"
+)
+
+func TestAppendArgsKinds(t *testing.T) {
+	specs := []ArgSpec{
+		Arg("pos", "", ArgPositional),
+		Arg("s", "--s", ArgString),
+		Arg("ne", "--ne", ArgNonEmpty),
+		Arg("n", "--n", ArgInt),
+		Arg("b", "--b", ArgBool),
+		Arg("on", "--on", ArgBoolOn),
+		Arg("off", "--off=false", ArgBoolOff),
+		Arg("list", "--item", ArgStringList),
+		Arg("csv", "--tag", ArgCSV),
+		Arg("", "--always", ArgAlways),
+	}
+
+	tests := []struct {
+		name string
+		args map[string]interface{}
+		want []string
+	}{
+		{
+			name: "empty args",
+			args: map[string]interface{}{},
+			want: []string{"cmd", "sub", "--on", "--always"},
+		},
+		{
+			name: "all set",
+			args: map[string]interface{}{
+				"pos": "file.txt", "s": "x", "ne": "y", "n": float64(3), "b": true, "on": true, "off": false,
+				"list": []interface{}{"a", 1, "b"}, "csv": "go, api,,",
+			},
+			want: []string{"cmd", "sub", "file.txt", "--s", "x", "--ne", "y", "--n", "3", "--b", "--on", "--off=false", "--item", "a", "--item", "b", "--tag", "go", "--tag", "api", "--always"},
+		},
+		{
+			name: "defaults and empty values",
+			args: map[string]interface{}{"s": "", "ne": "", "b": false, "on": false, "off": true},
+			want: []string{"cmd", "sub", "--s", "", "--always"},
+		},
+		{
+			name: "wrong types ignored",
+			args: map[string]interface{}{"pos": 1, "s": 1, "n": "3", "b": "true", "on": "false"},
+			want: []string{"cmd", "sub", "--on", "--always"},
+		},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			got := AppendArgs([]string{"cmd", "sub"}, specs, tt.args)
+			if !reflect.DeepEqual(got, tt.want) {
+				t.Errorf("AppendArgs() = %q, want %q", got, tt.want)
+			}
+		})
+	}
+}
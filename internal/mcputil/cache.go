@@ -0,0 +1,101 @@
+package mcputil
+
+import (
+	"container/list"
+	"sync"
+	"time"
+)
+
+// ResultCache is a size-bounded LRU cache of tool output whose entries expire
+// after a fixed TTL. It is safe for concurrent use.
+type ResultCache struct {
+	mu    sync.Mutex
+	size  int
+	ttl   time.Duration
+	order *list.List // front = most recently used
+	items map[string]*list.Element
+}
+
+type cacheEntry struct {
+	key     string
+	files   []string
+	output  string
+	expires time.Time
+}
+
+// NewResultCache returns a cache holding at most size entries for ttl each
+func NewResultCache(size int, ttl time.Duration) *ResultCache {
+	return &ResultCache{
+		size:  size,
+		ttl:   ttl,
+		order: list.New(),
+		items: make(map[string]*list.Element),
+	}
+}
+
+// Get returns the cached output for key if present and not expired
+func (c *ResultCache) Get(key string) (string, bool) {
+	c.mu.Lock()
+	defer c.mu.Unlock()
+
+	elem, ok := c.items[key]
+	if !ok {
+		return "", false
+	}
+	entry := elem.Value.(*cacheEntry)
+	if time.Now().After(entry.expires) {
+		c.remove(elem)
+		return "", false
+	}
+	c.order.MoveToFront(elem)
+	return entry.output, true
+}
+
+// Put stores output under key, evicting the least recently used entry when
+// full. files lists the paths the output depends on, for Invalidate; it may
+// be nil.
+func (c *ResultCache) Put(key string, files []string, output string) {
+	c.mu.Lock()
+	defer c.mu.Unlock()
+
+	entry := &cacheEntry{key: key, files: files, output: output, expires: time.Now().Add(c.ttl)}
+	if elem, ok := c.items[key]; ok {
+		elem.Value = entry
+		c.order.MoveToFront(elem)
+		return
+	}
+	c.items[key] = c.order.PushFront(entry)
+	for c.order.Len() > c.size {
+		c.remove(c.order.Back())
+	}
+}
+
+// Invalidate drops entries that depend on any of files, or every entry if files is empty
+func (c *ResultCache) Invalidate(files []string) {
+	c.mu.Lock()
+	defer c.mu.Unlock()
+
+	for elem := c.order.Front(); elem != nil; {
+		next := elem.Next()
+		if len(files) == 0 || sharesFile(elem.Value.(*cacheEntry).files, files) {
+			c.remove(elem)
+		}
+		elem = next
+	}
+}
+
+func (c *ResultCache) remove(elem *list.Element) {
+	c.order.Remove(elem)
+	delete(c.items, elem.Value.(*cacheEntry).key)
+}
+
+func sharesFile(a, b []string) bool {
+	for _, x := range a {
+		for _, y := range b {
+			if x == y {
+				return true
+			}
+		}
+	}
+	return false
+}
@@ -0,0 +1,49 @@
+package mcputil
+
+import (
+	"testing"
+	"time"
+)
+
+func TestResultCacheEviction(t *testing.T) {
+	c := NewResultCache(2, time.Minute)
+	c.Put("a", nil, "A")
+	c.Put("b", nil, "B")
+	c.Get("a") // a becomes most recently used
+	c.Put("c", nil, "C")
+
+	if _, ok := c.Get("b"); ok {
+		t.Error("least recently used entry should have been evicted")
+	}
+	if out, ok := c.Get("a"); !ok || out != "A" {
+		t.Error("recently used entry should remain cached")
+	}
+}
+
+func TestResultCacheExpiry(t *testing.T) {
+	c := NewResultCache(2, -time.Second)
+	c.Put("a", nil, "A")
+	if _, ok := c.Get("a"); ok {
+		t.Error("expired entry should not be returned")
+	}
+}
+
+func TestResultCacheInvalidate(t *testing.T) {
+	c := NewResultCache(4, time.Minute)
+	c.Put("a", []string{"/x"}, "A")
+	c.Put("b", []string{"/y"}, "B")
+	c.Put("c", nil, "C")
+
+	c.Invalidate([]string{"/x"})
+	if _, ok := c.Get("a"); ok {
+		t.Error("entry depending on an invalidated file should be dropped")
+	}
+	if _, ok := c.Get("b"); !ok {
+		t.Error("unrelated entry should remain cached")
+	}
+
+	c.Invalidate(nil)
+	if _, ok := c.Get("b"); ok {
+		t.Error("empty invalidation should drop every entry")
+	}
+}
@@ -0,0 +1,118 @@
+// Package mcputil holds helpers shared by the llm-support and
+// llm-clarification MCP servers.
+package mcputil
+
+import (
+	"encoding/json"
+	"fmt"
+	"math"
+)
+
+// Validator checks tool arguments against the required fields and top-level
+// property types declared in a tool's InputSchema
+type Validator struct {
+	required []string
+	types    map[string]string
+	aliases  map[string][]string
+}
+
+// CompileValidator builds a Validator from a tool's InputSchema. aliases maps
+// canonical argument names to alternative names the server remaps before
+// building a command line; it may be nil. Only aliases that are not
+// themselves canonical names satisfy a required argument, since those are
+// the ones a server remaps.
+func CompileValidator(schema json.RawMessage, aliases map[string][]string) (*Validator, error) {
+	var parsed struct {
+		Properties map[string]struct {
+			Type interface{} `json:"type"`
+		} `json:"properties"`
+		Required []string `json:"required"`
+	}
+	if err := json.Unmarshal(schema, &parsed); err != nil {
+		return nil, err
+	}
+	v := &Validator{
+		required: parsed.Required,
+		types:    make(map[string]string, len(parsed.Properties)),
+		aliases:  aliases,
+	}
+	for name, prop := range parsed.Properties {
+		// Only single-type properties are checked
+		if t, ok := prop.Type.(string); ok {
+			v.types[name] = t
+		}
+	}
+	return v, nil
+}
+
+// Validate rejects missing required arguments and values of the wrong JSON
+// type. It runs on the arguments as sent, so alias keys the schema does not
+// declare are not type-checked.
+func (v *Validator) Validate(args map[string]interface{}) error {
+	for _, key := range v.required {
+		if !v.hasArgOrAlias(args, key) {
+			return fmt.Errorf("invalid arguments: missing required argument %q", key)
+		}
+	}
+	for key, val := range args {
+		want, declared := v.types[key]
+		if !declared || val == nil {
+			continue
+		}
+		if !matchesType(val, want) {
+			return fmt.Errorf("invalid arguments: %q must be of type %s", key, want)
+		}
+	}
+	return nil
+}
+
+// hasArgOrAlias reports whether key is present in args or will be once the
+// server remaps aliases. Aliases that are themselves canonical names (e.g.
+// "path" for "file") are never remapped, so they don't count here either.
+func (v *Validator) hasArgOrAlias(args map[string]interface{}, key string) bool {
+	if _, ok := args[key]; ok {
+		return true
+	}
+	for _, alias := range v.aliases[key] {
+		if _, canonical := v.aliases[alias]; canonical {
+			continue
+		}
+		if _, ok := args[alias]; ok {
+			return true
+		}
+	}
+	return false
+}
+
+// matchesType reports whether a decoded JSON value satisfies a schema type
+func matchesType(val interface{}, want string) bool {
+	switch want {
+	case "string":
+		_, ok := val.(string)
+		return ok
+	case "boolean":
+		_, ok := val.(bool)
+		return ok
+	case "integer":
+		switch n := val.(type) {
+		case int, int64:
+			return true
+		case float64:
+			return n == math.Trunc(n)
+		}
+		return false
+	case "number":
+		switch val.(type) {
+		case int, int64, float64:
+			return true
+		}
+		return false
+	case "array":
+		_, ok := val.([]interface{})
+		return ok
+	case "object":
+		_, ok := val.(map[string]interface{})
+		return ok
+	}
+	return true
+}
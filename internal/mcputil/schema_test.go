@@ -0,0 +1,81 @@
+package mcputil
+
+import (
+	"strings"
+	"testing"
+)
+
+func TestValidatorValidate(t *testing.T) {
+	schema := []byte(`{
+		"type": "object",
+		"properties": {
+			"file": {"type": "string"},
+			"path": {"type": "string"},
+			"depth": {"type": "integer"},
+			"ratio": {"type": "number"},
+			"sizes": {"type": "boolean"},
+			"paths": {"type": "array"},
+			"either": {"type": ["string", "array"]}
+		},
+		"required": ["file"]
+	}`)
+	aliases := map[string][]string{
+		"file": {"path", "input"},
+		"path": {"file", "dir"},
+	}
+	v, err := CompileValidator(schema, aliases)
+	if err != nil {
+		t.Fatalf("CompileValidator() error = %v", err)
+	}
+
+	tests := []struct {
+		name    string
+		args    map[string]interface{}
+		wantErr string
+	}{
+		{"valid", map[string]interface{}{"file": "a", "depth": float64(2), "ratio": 0.5}, ""},
+		{"required via alias", map[string]interface{}{"input": "a"}, ""},
+		{"canonical name is not an alias", map[string]interface{}{"path": "a"}, `missing required argument "file"`},
+		{"wrong string type", map[string]interface{}{"file": float64(1)}, `"file" must be of type string`},
+		{"fractional integer", map[string]interface{}{"file": "a", "depth": 1.5}, `"depth" must be of type integer`},
+		{"wrong number type", map[string]interface{}{"file": "a", "ratio": "half"}, `"ratio" must be of type number`},
+		{"wrong boolean type", map[string]interface{}{"file": "a", "sizes": "yes"}, `"sizes" must be of type boolean`},
+		{"wrong array type", map[string]interface{}{"file": "a", "paths": "a.txt"}, `"paths" must be of type array`},
+		{"union type unchecked", map[string]interface{}{"file": "a", "either": float64(1)}, ""},
+		{"null ignored", map[string]interface{}{"file": "a", "depth": nil}, ""},
+		{"undeclared key ignored", map[string]interface{}{"file": "a", "extra": 1}, ""},
+	}
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			err := v.Validate(tt.args)
+			if tt.wantErr == "" {
+				if err != nil {
+					t.Errorf("Validate() error = %v", err)
+				}
+				return
+			}
+			if err == nil || !strings.Contains(err.Error(), tt.wantErr) {
+				t.Errorf("Validate() error = %v, want %q", err, tt.wantErr)
+			}
+		})
+	}
+}
+
+func TestValidatorWithoutAliases(t *testing.T) {
+	v, err := CompileValidator([]byte(`{"properties": {"question": {"type": "string"}}, "required": ["question"]}`), nil)
+	if err != nil {
+		t.Fatalf("CompileValidator() error = %v", err)
+	}
+	if err := v.Validate(map[string]interface{}{"q": "x"}); err == nil {
+		t.Error("expected missing required argument error")
+	}
+	if err := v.Validate(map[string]interface{}{"question": "x"}); err != nil {
+		t.Errorf("Validate() error = %v", err)
+	}
+}
+
+func TestCompileValidatorInvalidSchema(t *testing.T) {
+	if _, err := CompileValidator([]byte(`{`), nil); err == nil {
+		t.Error("expected error for invalid schema")
+	}
+}
@@ -6,6 +6,7 @@ import (
 	"os"
 	"path/filepath"
 	"regexp"
+	"runtime"
 	"strings"
 	"sync"
 
@@ -134,22 +135,7 @@ func runMultigrep(cmd *cobra.Command, args []string) error {
 	}
 
 	// Search in parallel
-	results := make(map[string]*keywordResult)
-	var mu sync.Mutex
-	var wg sync.WaitGroup
-
-	for _, kw := range keywords {
-		wg.Add(1)
-		go func(keyword string) {
-			defer wg.Done()
-			result := searchKeyword(path, files, keyword, defPatterns)
-			mu.Lock()
-			results[keyword] = result
-			mu.Unlock()
-		}(kw)
-	}
-
-	wg.Wait()
+	results := searchKeywords(path, files, keywords, defPatterns)
 
 	// Calculate totals
 	totalMatches := 0
@@ -316,82 +302,199 @@ func collectFiles(basePath string, extensions []string) []string {
 	return files
 }
 
-func searchKeyword(basePath string, files []string, keyword string, defPatterns []string) *keywordResult {
-	result := &keywordResult{
-		FilesMatched:      []string{},
-		DefinitionMatches: []matchInfo{},
-		OtherMatches:      []matchInfo{},
-	}
+// keywordMatcher holds the per-keyword state shared by all file scans
+type keywordMatcher struct {
+	keyword    string
+	lower      string
+	defRegexes []*regexp.Regexp
+}
 
-	// Compile definition regexes
-	var defRegexes []*regexp.Regexp
+func newKeywordMatcher(keyword string, defPatterns []string) keywordMatcher {
+	m := keywordMatcher{keyword: keyword, lower: strings.ToLower(keyword)}
 	for _, pattern := range defPatterns {
 		re, err := regexp.Compile(fmt.Sprintf(pattern, regexp.QuoteMeta(keyword)))
 		if err == nil {
-			defRegexes = append(defRegexes, re)
+			m.defRegexes = append(m.defRegexes, re)
 		}
 	}
+	return m
+}
 
-	filesMatchedSet := make(map[string]bool)
+func (m *keywordMatcher) isDefinition(line string) bool {
+	for _, re := range m.defRegexes {
+		if re.MatchString(line) {
+			return true
+		}
+	}
+	return false
+}
+
+// fileHits are one keyword's matches within one file. Matches are capped at
+// multigrepMaxPerKw per kind; a file's later matches can never be among a
+// keyword's first multigrepMaxPerKw overall.
+type fileHits struct {
+	count  int
+	defs   []matchInfo
+	others []matchInfo
+}
 
-	for _, filePath := range files {
-		content, err := os.ReadFile(filePath)
-		if err != nil {
+// searchKeywords searches files for every keyword. Each file is read once and
+// checked against all keywords, with files scanned in parallel. Hits are
+// merged in file order as soon as each file's predecessors are done, so each
+// keyword's matches, caps and truncation are the same as a sequential
+// per-keyword scan, and at most a small window of scanned files waits in
+// memory to be merged.
+func searchKeywords(basePath string, files []string, keywords []string, defPatterns []string) map[string]*keywordResult {
+	matchers := make([]keywordMatcher, len(keywords))
+	merged := make([]*keywordResult, len(keywords))
+	for i, kw := range keywords {
+		matchers[i] = newKeywordMatcher(kw, defPatterns)
+		merged[i] = &keywordResult{
+			FilesMatched:      []string{},
+			DefinitionMatches: []matchInfo{},
+			OtherMatches:      []matchInfo{},
+		}
+	}
+
+	type scannedFile struct {
+		index   int
+		relPath string
+		hits    []fileHits
+	}
+
+	workers := runtime.NumCPU()
+	if workers > len(files) {
+		workers = len(files)
+	}
+	// window bounds how far scanning may run ahead of the merge
+	window := make(chan struct{}, 4*workers+1)
+	next := make(chan int)
+	scanned := make(chan scannedFile, workers)
+
+	go func() {
+		for i := range files {
+			window <- struct{}{}
+			next <- i
+		}
+		close(next)
+	}()
+
+	var wg sync.WaitGroup
+	for w := 0; w < workers; w++ {
+		wg.Add(1)
+		go func() {
+			defer wg.Done()
+			for i := range next {
+				relPath, _ := filepath.Rel(basePath, files[i])
+				scanned <- scannedFile{index: i, relPath: relPath, hits: scanFile(files[i], relPath, matchers)}
+			}
+		}()
+	}
+	go func() {
+		wg.Wait()
+		close(scanned)
+	}()
+
+	pending := make(map[int]scannedFile)
+	mergeNext := 0
+	for f := range scanned {
+		pending[f.index] = f
+		for {
+			f, ok := pending[mergeNext]
+			if !ok {
+				break
+			}
+			delete(pending, mergeNext)
+			mergeHits(merged, f.relPath, f.hits)
+			mergeNext++
+			<-window
+		}
+	}
+
+	results := make(map[string]*keywordResult, len(keywords))
+	for k, result := range merged {
+		result.Truncated = result.MatchCount > 0 &&
+			len(result.DefinitionMatches) >= multigrepMaxPerKw &&
+			len(result.OtherMatches) >= multigrepMaxPerKw
+		results[matchers[k].keyword] = result
+	}
+	return results
+}
+
+// mergeHits adds one file's hits to the per-keyword results. Files must be
+// merged in search order for the caps to keep the earliest matches.
+func mergeHits(results []*keywordResult, relPath string, hits []fileHits) {
+	for k, h := range hits {
+		if h.count == 0 {
 			continue
 		}
+		result := results[k]
+		result.MatchCount += h.count
+		result.FilesMatched = append(result.FilesMatched, relPath)
+		result.DefinitionMatches = appendCapped(result.DefinitionMatches, h.defs, multigrepMaxPerKw)
+		result.OtherMatches = appendCapped(result.OtherMatches, h.others, multigrepMaxPerKw)
+	}
+}
+
+// scanFile matches every keyword against one file, returning nil if the
+// file cannot be read
+func scanFile(filePath, relPath string, matchers []keywordMatcher) []fileHits {
+	content, err := os.ReadFile(filePath)
+	if err != nil {
+		return nil
+	}
 
-		lines := strings.Split(string(content), "\n")
-		for lineNum, line := range lines {
+	hits := make([]fileHits, len(matchers))
+	for lineNum, line := range strings.Split(string(content), "\n") {
+		var lower string
+		if multigrepIgnoreCase {
+			lower = strings.ToLower(line)
+		}
+		for k := range matchers {
+			m := &matchers[k]
 			var matches bool
 			if multigrepIgnoreCase {
-				matches = strings.Contains(strings.ToLower(line), strings.ToLower(keyword))
+				matches = strings.Contains(lower, m.lower)
 			} else {
-				matches = strings.Contains(line, keyword)
+				matches = strings.Contains(line, m.keyword)
+			}
+			if !matches {
+				continue
 			}
 
-			if matches {
-				result.MatchCount++
-				relPath, _ := filepath.Rel(basePath, filePath)
-				filesMatchedSet[relPath] = true
-
-				// Check if it's a definition
-				isDefinition := false
-				for _, re := range defRegexes {
-					if re.MatchString(line) {
-						isDefinition = true
-						break
-					}
-				}
-
-				info := matchInfo{
-					File:    relPath,
-					Line:    lineNum + 1,
-					Content: strings.TrimSpace(line),
-				}
-
-				if isDefinition {
-					if len(result.DefinitionMatches) < multigrepMaxPerKw {
-						result.DefinitionMatches = append(result.DefinitionMatches, info)
-					}
-				} else {
-					if len(result.OtherMatches) < multigrepMaxPerKw {
-						result.OtherMatches = append(result.OtherMatches, info)
-					}
-				}
-
-				if len(result.DefinitionMatches) >= multigrepMaxPerKw &&
-					len(result.OtherMatches) >= multigrepMaxPerKw {
-					result.Truncated = true
+			h := &hits[k]
+			h.count++
+			defsFull := len(h.defs) >= multigrepMaxPerKw
+			othersFull := len(h.others) >= multigrepMaxPerKw
+			if defsFull && othersFull {
+				continue
+			}
+			info := matchInfo{
+				File:    relPath,
+				Line:    lineNum + 1,
+				Content: strings.TrimSpace(line),
+			}
+			if m.isDefinition(line) {
+				if !defsFull {
+					h.defs = append(h.defs, info)
 				}
+			} else if !othersFull {
+				h.others = append(h.others, info)
 			}
 		}
 	}
+	return hits
+}
 
-	for f := range filesMatchedSet {
-		result.FilesMatched = append(result.FilesMatched, f)
+// appendCapped appends src to dst without letting dst exceed max entries
+func appendCapped(dst, src []matchInfo, max int) []matchInfo {
+	if room := max - len(dst); room < len(src) {
+		if room <= 0 {
+			return dst
+		}
+		src = src[:room]
 	}
-
-	return result
+	return append(dst, src...)
 }
 
 func truncate(s string, maxLen int) string {
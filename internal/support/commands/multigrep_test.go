@@ -2,6 +2,7 @@ package commands
 
 import (
 	"bytes"
+	"fmt"
 	"os"
 	"path/filepath"
 	"strings"
@@ -130,3 +131,41 @@ func TestMultigrepJSON(t *testing.T) {
 		t.Errorf("JSON output should contain keywords_searched: %s", output)
 	}
 }
+
+func TestSearchKeywordsKeepsFileOrder(t *testing.T) {
+	tmpDir := t.TempDir()
+
+	var files []string
+	for i := 0; i < 20; i++ {
+		path := filepath.Join(tmpDir, fmt.Sprintf("f%02d.go", i))
+		os.WriteFile(path, []byte("func alpha() {}\nalpha()\nbeta()\n"), 0644)
+		files = append(files, path)
+	}
+
+	origMax, origIgnore := multigrepMaxPerKw, multigrepIgnoreCase
+	defer func() { multigrepMaxPerKw, multigrepIgnoreCase = origMax, origIgnore }()
+	multigrepMaxPerKw, multigrepIgnoreCase = 3, false
+
+	results := searchKeywords(tmpDir, files, []string{"alpha", "beta"}, []string{`^\s*func\s+%s\s*\(`})
+
+	alpha := results["alpha"]
+	if alpha.MatchCount != 40 || len(alpha.FilesMatched) != 20 {
+		t.Errorf("alpha: MatchCount = %d, FilesMatched = %d, want 40 and 20", alpha.MatchCount, len(alpha.FilesMatched))
+	}
+	for i, m := range alpha.DefinitionMatches {
+		if want := fmt.Sprintf("f%02d.go", i); m.File != want || m.Line != 1 {
+			t.Errorf("alpha definition %d = %s:%d, want %s:1", i, m.File, m.Line, want)
+		}
+	}
+	if len(alpha.DefinitionMatches) != 3 || len(alpha.OtherMatches) != 3 || !alpha.Truncated {
+		t.Errorf("alpha should be capped at 3 per kind and truncated, got %+v", alpha)
+	}
+
+	beta := results["beta"]
+	if beta.MatchCount != 20 || len(beta.DefinitionMatches) != 0 || beta.Truncated {
+		t.Errorf("beta: unexpected result %+v", beta)
+	}
+	if beta.OtherMatches[0].File != "f00.go" || beta.OtherMatches[0].Line != 3 {
+		t.Errorf("beta first usage = %+v, want f00.go:3", beta.OtherMatches[0])
+	}
+}
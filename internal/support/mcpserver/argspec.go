@@ -0,0 +1,24 @@
+package mcpserver
+
+import "github.com/samestrin/llm-tools/internal/mcputil"
+
+// commandSpec describes how a tool's arguments become an llm-support command line
+type commandSpec struct {
+	subcommand []string
+	args       []mcputil.ArgSpec
+}
+
+// specBuilder returns an argument builder driven by a commandSpec.
+// Flags are emitted in the order listed.
+func specBuilder(subcommand []string, args ...mcputil.ArgSpec) func(map[string]interface{}) []string {
+	return commandSpec{subcommand: subcommand, args: args}.build
+}
+
+// build renders args as a command line. The argv is sized up front for the
+// subcommand, a flag and value per spec row, and the outputFlags suffix the
+// handler appends, so it is allocated once.
+func (spec commandSpec) build(args map[string]interface{}) []string {
+	cmdArgs := make([]string, 0, len(spec.subcommand)+2*len(spec.args)+len(outputFlags))
+	cmdArgs = append(cmdArgs, spec.subcommand...)
+	return mcputil.AppendArgs(cmdArgs, spec.args, args)
+}
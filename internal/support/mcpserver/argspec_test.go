@@ -0,0 +1,14 @@
+package mcpserver
+
+import "testing"
+
+func TestSpecBuilderAllocatesOnce(t *testing.T) {
+	args := map[string]interface{}{"path": "/repo", "depth": float64(2), "sizes": true}
+	allocs := testing.AllocsPerRun(100, func() {
+		_ = append(buildTreeArgs(args), outputFlags...)
+	})
+	// One allocation for the argv, one for formatting the depth
+	if allocs > 2 {
+		t.Errorf("buildTreeArgs allocated %v times, want at most 2", allocs)
+	}
+}
@@ -0,0 +1,62 @@
+package mcpserver
+
+import (
+	"encoding/json"
+	"os"
+	"path/filepath"
+	"strconv"
+	"strings"
+	"time"
+
+	"github.com/samestrin/llm-tools/internal/mcputil"
+)
+
+// ResultCacheTTL is how long a cached result stays valid. Directory mtimes
+// only change when entries are added or removed, so the TTL bounds how long
+// an edit inside a scanned directory can go unnoticed.
+var ResultCacheTTL = 60 * time.Second
+
+// ResultCacheSize is the maximum number of cached results
+var ResultCacheSize = 256
+
+// results holds output of commands registered with cacheFiles
+var results = newResultCache()
+
+func newResultCache() *mcputil.ResultCache {
+	return mcputil.NewResultCache(ResultCacheSize, ResultCacheTTL)
+}
+
+// resultCacheKey builds the cache key for a tool call from the command, its
+// canonicalized arguments, and the modification time of each path the
+// result depends on. A missing path argument means the working directory,
+// matching the CLI defaults. It reports false if a path cannot be stat'd.
+func resultCacheKey(cmdName string, args map[string]interface{}, fileKeys []string) (string, bool) {
+	// encoding/json sorts map keys, so equal arguments always encode identically
+	var sb strings.Builder
+	sb.WriteString(cmdName)
+	sb.WriteByte(0)
+	enc := json.NewEncoder(&sb)
+	enc.SetEscapeHTML(false)
+	if err := enc.Encode(args); err != nil {
+		return "", false
+	}
+	for _, key := range fileKeys {
+		path, _ := args[key].(string)
+		if path == "" {
+			path = "."
+		}
+		abs, err := filepath.Abs(path)
+		if err != nil {
+			return "", false
+		}
+		info, err := os.Stat(abs)
+		if err != nil {
+			return "", false
+		}
+		sb.WriteByte(0)
+		sb.WriteString(abs)
+		sb.WriteByte('@')
+		sb.WriteString(strconv.FormatInt(info.ModTime().UnixNano(), 10))
+	}
+	return sb.String(), true
+}
@@ -0,0 +1,114 @@
+package mcpserver
+
+import (
+	"os"
+	"path/filepath"
+	"strconv"
+	"strings"
+	"testing"
+	"time"
+)
+
+// countingBinary installs a fake llm-support that records each run and
+// prints out, returning a function reporting how many times it ran
+func countingBinary(t *testing.T, out string, exitCode int) func() int {
+	t.Helper()
+	log := filepath.Join(t.TempDir(), "runs")
+	fakeBinary(t, "echo run >> "+log+"\necho '"+out+"'\nexit "+strconv.Itoa(exitCode))
+
+	orig := results
+	results = newResultCache()
+	t.Cleanup(func() { results = orig })
+
+	return func() int {
+		data, err := os.ReadFile(log)
+		if err != nil {
+			return 0
+		}
+		return strings.Count(string(data), "run")
+	}
+}
+
+func TestExecuteHandlerCachesFilesystemResults(t *testing.T) {
+	runs := countingBinary(t, `{"stack":"go"}`, 0)
+	dir := t.TempDir()
+
+	for i := 0; i < 3; i++ {
+		output, err := ExecuteHandler(ToolPrefix+"detect", map[string]interface{}{"path": dir})
+		if err != nil {
+			t.Fatalf("ExecuteHandler() error = %v", err)
+		}
+		if output != "{\"stack\":\"go\"}\n" {
+			t.Errorf("ExecuteHandler() output = %q", output)
+		}
+	}
+	if n := runs(); n != 1 {
+		t.Errorf("binary ran %d times, want 1", n)
+	}
+
+	// Aliased arguments normalize to the same key
+	if _, err := ExecuteHandler(ToolPrefix+"detect", map[string]interface{}{"directory": dir}); err != nil {
+		t.Fatalf("ExecuteHandler() error = %v", err)
+	}
+	if n := runs(); n != 1 {
+		t.Errorf("aliased call ran the binary again (%d runs)", n)
+	}
+}
+
+func TestExecuteHandlerCacheMissesOnChange(t *testing.T) {
+	runs := countingBinary(t, `{}`, 0)
+	manifest := filepath.Join(t.TempDir(), "go.mod")
+	if err := os.WriteFile(manifest, []byte("module x\n"), 0644); err != nil {
+		t.Fatal(err)
+	}
+	args := map[string]interface{}{"manifest": manifest}
+
+	if _, err := ExecuteHandler(ToolPrefix+"deps", args); err != nil {
+		t.Fatal(err)
+	}
+	later := time.Now().Add(time.Hour)
+	if err := os.Chtimes(manifest, later, later); err != nil {
+		t.Fatal(err)
+	}
+	if _, err := ExecuteHandler(ToolPrefix+"deps", args); err != nil {
+		t.Fatal(err)
+	}
+	if n := runs(); n != 2 {
+		t.Errorf("binary ran %d times after manifest change, want 2", n)
+	}
+
+	// Different arguments are cached separately
+	if _, err := ExecuteHandler(ToolPrefix+"deps", map[string]interface{}{"manifest": manifest, "type": "dev"}); err != nil {
+		t.Fatal(err)
+	}
+	if n := runs(); n != 3 {
+		t.Errorf("binary ran %d times for new arguments, want 3", n)
+	}
+}
+
+func TestExecuteHandlerDoesNotCacheFailures(t *testing.T) {
+	runs := countingBinary(t, `{"error":"not a repo"}`, 1)
+	dir := t.TempDir()
+
+	for i := 0; i < 2; i++ {
+		if _, err := ExecuteHandler(ToolPrefix+"repo_root", map[string]interface{}{"path": dir}); err != nil {
+			t.Fatal(err)
+		}
+	}
+	if n := runs(); n != 2 {
+		t.Errorf("binary ran %d times, failed results should not be cached", n)
+	}
+}
+
+func TestExecuteHandlerSkipsCacheForOtherCommands(t *testing.T) {
+	runs := countingBinary(t, `{}`, 0)
+
+	for i := 0; i < 2; i++ {
+		if _, err := ExecuteHandler(ToolPrefix+"git_context", map[string]interface{}{}); err != nil {
+			t.Fatal(err)
+		}
+	}
+	if n := runs(); n != 2 {
+		t.Errorf("binary ran %d times, git_context should not be cached", n)
+	}
+}
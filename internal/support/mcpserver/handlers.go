@@ -6,15 +6,19 @@ import (
 	"fmt"
 	"os"
 	"os/exec"
+	"runtime"
+	"slices"
 	"strconv"
 	"strings"
 	"time"
+
+	"github.com/samestrin/llm-tools/internal/mcputil"
 )
 
 // paramAliases maps canonical parameter names to their accepted aliases.
 // This makes the MCP tools more forgiving when LLMs use alternative parameter names.
 var paramAliases = map[string][]string{
-	"path":     {"target", "file", "input", "dir", "directory", "file_path"},
+	"path":     {"target", "file", "input", "dir", "directory", "file_path", "plan_path"},
 	"file":     {"path", "input"},
 	"manifest": {"path", "file", "package"},
 	"pattern":  {"regex", "search"},
@@ -65,6 +69,16 @@ func normalizeArgs(args map[string]interface{}) map[string]interface{} {
 // BinaryPath is the path to the llm-support binary
 var BinaryPath = "/usr/local/bin/llm-support"
 
+// BinaryFound reports whether BinaryPath existed when the package was
+// initialized; the binary is not expected to appear or vanish while the
+// server runs, so it is checked once rather than per call
+var BinaryFound = binaryExists(BinaryPath)
+
+func binaryExists(path string) bool {
+	_, err := os.Stat(path)
+	return !os.IsNotExist(err)
+}
+
 // CommandTimeout is the default timeout for command execution
 var CommandTimeout = 60 * time.Second
 
@@ -78,22 +92,91 @@ var llmCommands = map[string]bool{
 	"foreach":  true,
 }
 
+// MaxConcurrent bounds how many llm-support processes run at once, so a
+// burst of tool calls cannot fork a process per call. Defaults to the CPU
+// count with a floor of 2 and can be overridden via
+// LLM_SUPPORT_MCP_MAX_CONCURRENT. LLM commands are not counted against it.
+var MaxConcurrent = maxConcurrentFromEnv()
+
+// MaxConcurrentLLM bounds concurrent LLM commands separately. They spend
+// their time waiting on the API rather than the CPU, and sharing slots with
+// filesystem tools would let a few long completions starve those for minutes.
+var MaxConcurrentLLM = 8
+
+// commandSem enforces MaxConcurrent and llmSem enforces MaxConcurrentLLM
+var (
+	commandSem = make(chan struct{}, MaxConcurrent)
+	llmSem     = make(chan struct{}, MaxConcurrentLLM)
+)
+
+func maxConcurrentFromEnv() int {
+	if v := os.Getenv("LLM_SUPPORT_MCP_MAX_CONCURRENT"); v != "" {
+		if n, err := strconv.Atoi(v); err == nil && n > 0 {
+			return n
+		}
+	}
+	return max(2, runtime.NumCPU())
+}
+
+// outputFlags are appended to every command for machine-parseable,
+// token-optimized output
+var outputFlags = []string{"--json", "--min"}
+
 // Debug enables verbose logging for debugging MCP tool execution
 var Debug = os.Getenv("LLM_SUPPORT_MCP_DEBUG") == "true"
 
 // ExecuteHandler executes the appropriate command for a tool
 func ExecuteHandler(toolName string, args map[string]interface{}) (string, error) {
+	return ExecuteHandlerContext(context.Background(), toolName, args)
+}
+
+// ExecuteHandlerContext executes the appropriate command for a tool.
+// Cancelling ctx (e.g. when the MCP client cancels the request) kills the
+// command instead of letting it run to its timeout, so concurrent tool
+// calls are not held up by abandoned ones.
+func ExecuteHandlerContext(parent context.Context, toolName string, args map[string]interface{}) (string, error) {
 	// Strip prefix
 	cmdName := strings.TrimPrefix(toolName, ToolPrefix)
 
-	// Build command args
-	cmdArgs, err := buildArgs(cmdName, args)
-	if err != nil {
+	builder, ok := commandRegistry[cmdName]
+	if !ok {
+		return "", fmt.Errorf("unknown command: %s", cmdName)
+	}
+	if err := validateArgs(cmdName, args); err != nil {
 		return "", err
 	}
 
+	// Normalize parameter aliases, then build command args
+	args = normalizeArgs(args)
+	cmdArgs := builder.build(args)
+
 	// Add --json and --min flags for machine-parseable, token-optimized output
-	cmdArgs = append(cmdArgs, "--json", "--min")
+	cmdArgs = append(cmdArgs, outputFlags...)
+
+	// Results that depend only on the filesystem are served from cache while
+	// the paths they read are unchanged
+	var cacheKey string
+	cacheable := false
+	if builder.cacheFiles != nil {
+		cacheKey, cacheable = resultCacheKey(cmdName, args, builder.cacheFiles)
+		if cacheable {
+			if output, ok := results.Get(cacheKey); ok {
+				return output, nil
+			}
+		}
+	}
+
+	// Wait for a free slot; the timeout starts once the command can run
+	sem := commandSem
+	if llmCommands[cmdName] {
+		sem = llmSem
+	}
+	select {
+	case sem <- struct{}{}:
+		defer func() { <-sem }()
+	case <-parent.Done():
+		return "", fmt.Errorf("command cancelled: %w", parent.Err())
+	}
 
 	// Determine timeout based on command type
 	timeout := CommandTimeout
@@ -102,7 +185,7 @@ func ExecuteHandler(toolName string, args map[string]interface{}) (string, error
 	}
 
 	// Execute command with appropriate timeout
-	ctx, cancel := context.WithTimeout(context.Background(), timeout)
+	ctx, cancel := context.WithTimeout(parent, timeout)
 	defer cancel()
 
 	if Debug {
@@ -110,193 +193,146 @@ func ExecuteHandler(toolName string, args map[string]interface{}) (string, error
 		fmt.Fprintf(os.Stderr, "[LLM_SUPPORT_MCP] Timeout: %v\n", timeout)
 	}
 
+	// WaitDelay bounds the wait for output pipes after the process is killed,
+	// so a lingering grandchild cannot hang the call
 	cmd := exec.CommandContext(ctx, BinaryPath, cmdArgs...)
-	output, err := cmd.CombinedOutput()
+	cmd.WaitDelay = time.Second
+
+	// Collect stdout and stderr in one builder, as CombinedOutput would, but
+	// hand the result back without copying it from []byte to string
+	var out strings.Builder
+	cmd.Stdout = &out
+	cmd.Stderr = &out
+	err := cmd.Run()
+	output := out.String()
+
+	if parent.Err() != nil {
+		return "", fmt.Errorf("command cancelled: %w", parent.Err())
+	}
 
 	if ctx.Err() == context.DeadlineExceeded {
 		// Return captured output on timeout - it may contain partial results or error messages
 		errMsg := fmt.Errorf("command timed out after %v (captured %d bytes)", timeout, len(output))
 		if Debug {
-			fmt.Fprintf(os.Stderr, "[LLM_SUPPORT_MCP] Timeout error (captured output): %q\n", string(output))
+			fmt.Fprintf(os.Stderr, "[LLM_SUPPORT_MCP] Timeout error (captured output): %q\n", output)
 		}
-		return string(output), errMsg
+		return output, errMsg
 	}
 
 	if err != nil {
 		// Return output even on error (may contain useful error message)
 		if len(output) > 0 {
 			if Debug {
-				fmt.Fprintf(os.Stderr, "[LLM_SUPPORT_MCP] Command failed with output: %q\n", string(output))
+				fmt.Fprintf(os.Stderr, "[LLM_SUPPORT_MCP] Command failed with output: %q\n", output)
 			}
-			return string(output), nil
+			return output, nil
 		}
 		return "", fmt.Errorf("command failed: %w", err)
 	}
 
-	return string(output), nil
+	if cacheable {
+		results.Put(cacheKey, nil, output)
+	}
+	return output, nil
+}
+
+// argBuilder renders a tool's arguments as an llm-support command line
+type argBuilder struct {
+	build func(args map[string]interface{}) []string
+	// cacheFiles lists the arguments naming paths the result depends on;
+	// when set, successful results are cached (see resultCacheKey)
+	cacheFiles []string
+}
+
+// commandRegistry maps command names to their argument builders, so each
+// call dispatches with a single map lookup
+var commandRegistry = map[string]argBuilder{
+	"tree":                  {build: buildTreeArgs},
+	"grep":                  {build: buildGrepArgs},
+	"multiexists":           {build: buildMultiexistsArgs},
+	"json_query":            {build: buildJSONQueryArgs},
+	"markdown_headers":      {build: buildMarkdownHeadersArgs},
+	"template":              {build: buildTemplateArgs},
+	"discover_tests":        {build: buildDiscoverTestsArgs, cacheFiles: []string{"path"}},
+	"multigrep":             {build: buildMultigrepArgs},
+	"analyze_deps":          {build: buildAnalyzeDepsArgs, cacheFiles: []string{"file"}},
+	"detect":                {build: buildDetectArgs, cacheFiles: []string{"path"}},
+	"project_components":    {build: buildProjectComponentsArgs},
+	"count":                 {build: buildCountArgs},
+	"summarize_dir":         {build: buildSummarizeDirArgs},
+	"deps":                  {build: buildDepsArgs, cacheFiles: []string{"manifest"}},
+	"git_context":           {build: buildGitContextArgs},
+	"validate_plan":         {build: buildValidatePlanArgs},
+	"partition_work":        {build: buildPartitionWorkArgs},
+	"repo_root":             {build: buildRepoRootArgs, cacheFiles: []string{"path"}},
+	"review_range":          {build: buildReviewRangeArgs},
+	"extract_relevant":      {build: buildExtractRelevantArgs},
+	"extract_links":         {build: buildExtractLinksArgs},
+	"highest":               {build: buildHighestArgs},
+	"plan_type":             {build: buildPlanTypeArgs},
+	"git_changes":           {build: buildGitChangesArgs},
+	"context":               {build: buildContextArgs},
+	"context_multiset":      {build: buildContextMultiSetArgs},
+	"context_multiget":      {build: buildContextMultiGetArgs},
+	"yaml_get":              {build: buildYamlGetArgs},
+	"yaml_set":              {build: buildYamlSetArgs},
+	"yaml_multiget":         {build: buildYamlMultigetArgs},
+	"yaml_multiset":         {build: buildYamlMultisetArgs},
+	"args":                  {build: buildArgsParserArgs},
+	"catfiles":              {build: buildCatfilesArgs},
+	"decode":                {build: buildDecodeArgs},
+	"diff":                  {build: buildDiffArgs},
+	"encode":                {build: buildEncodeArgs},
+	"extract":               {build: buildExtractArgs},
+	"foreach":               {build: buildForeachArgs},
+	"hash":                  {build: buildHashArgs},
+	"init_temp":             {build: buildInitTempArgs},
+	"clean_temp":            {build: buildCleanTempArgs},
+	"math":                  {build: buildMathArgs},
+	"report":                {build: buildReportArgs},
+	"stats":                 {build: buildStatsArgs},
+	"toml_query":            {build: buildTomlQueryArgs},
+	"toml_validate":         {build: buildTomlValidateArgs},
+	"toml_parse":            {build: buildTomlParseArgs},
+	"transform_case":        {build: buildTransformCaseArgs},
+	"transform_csv_to_json": {build: buildTransformCsvToJsonArgs},
+	"transform_json_to_csv": {build: buildTransformJsonToCsvArgs},
+	"transform_filter":      {build: buildTransformFilterArgs},
+	"transform_sort":        {build: buildTransformSortArgs},
+	"validate":              {build: buildValidateArgs},
+	"runtime":               {build: buildRuntimeArgs},
+	"complete":              {build: buildCompleteArgs},
+	"parse_stream":          {build: buildParseStreamArgs},
+	"route_td":              {build: buildRouteTDArgs},
+	"coverage_report":       {build: buildCoverageReportArgs},
+	"validate_risks":        {build: buildValidateRisksArgs},
+	"sprint_status":         {build: buildSprintStatusArgs},
+	"alignment_check":       {build: buildAlignmentCheckArgs},
+	"tdd_compliance":        {build: buildTddComplianceArgs},
+	"categorize_changes":    {build: buildCategorizeChangesArgs},
+	"format_td_table":       {build: buildFormatTDTableArgs},
+	"group_td":              {build: buildGroupTDArgs},
+	"td_stats":              {build: buildTDStatsArgs},
+	"td_clean":              {build: buildTDCleanArgs},
+	"td_matrix":             {build: buildTDMatrixArgs},
+	"td_filter":             {build: buildTDFilterArgs},
+	"td_dedupe":             {build: buildTdDedupeArgs},
+	"td_validate":           {build: buildTDValidateArgs},
+	"discovery_validate":    {build: buildDiscoveryValidateArgs},
+	"knowledge_audit":       {build: buildKnowledgeAuditArgs},
+	"diff_smell":            {build: buildDiffSmellArgs},
+	"tier_classifier":       {build: buildTierClassifierArgs},
+	"fetch":                 {build: buildFetchArgs},
 }
 
 // buildArgs builds CLI arguments for the given tool
 func buildArgs(cmdName string, args map[string]interface{}) ([]string, error) {
-	// Normalize parameter aliases before processing
-	args = normalizeArgs(args)
-
-	switch cmdName {
-	case "tree":
-		return buildTreeArgs(args), nil
-	case "grep":
-		return buildGrepArgs(args), nil
-	case "multiexists":
-		return buildMultiexistsArgs(args), nil
-	case "json_query":
-		return buildJSONQueryArgs(args), nil
-	case "markdown_headers":
-		return buildMarkdownHeadersArgs(args), nil
-	case "template":
-		return buildTemplateArgs(args), nil
-	case "discover_tests":
-		return buildDiscoverTestsArgs(args), nil
-	case "multigrep":
-		return buildMultigrepArgs(args), nil
-	case "analyze_deps":
-		return buildAnalyzeDepsArgs(args), nil
-	case "detect":
-		return buildDetectArgs(args), nil
-	case "project_components":
-		return buildProjectComponentsArgs(args), nil
-	case "count":
-		return buildCountArgs(args), nil
-	case "summarize_dir":
-		return buildSummarizeDirArgs(args), nil
-	case "deps":
-		return buildDepsArgs(args), nil
-	case "git_context":
-		return buildGitContextArgs(args), nil
-	case "validate_plan":
-		return buildValidatePlanArgs(args), nil
-	case "partition_work":
-		return buildPartitionWorkArgs(args), nil
-	case "repo_root":
-		return buildRepoRootArgs(args), nil
-	case "review_range":
-		return buildReviewRangeArgs(args), nil
-	case "extract_relevant":
-		return buildExtractRelevantArgs(args), nil
-	case "extract_links":
-		return buildExtractLinksArgs(args), nil
-	case "highest":
-		return buildHighestArgs(args), nil
-	case "plan_type":
-		return buildPlanTypeArgs(args), nil
-	case "git_changes":
-		return buildGitChangesArgs(args), nil
-	case "context":
-		return buildContextArgs(args), nil
-	case "context_multiset":
-		return buildContextMultiSetArgs(args), nil
-	case "context_multiget":
-		return buildContextMultiGetArgs(args), nil
-	case "yaml_get":
-		return buildYamlGetArgs(args), nil
-	case "yaml_set":
-		return buildYamlSetArgs(args), nil
-	case "yaml_multiget":
-		return buildYamlMultigetArgs(args), nil
-	case "yaml_multiset":
-		return buildYamlMultisetArgs(args), nil
-	case "args":
-		return buildArgsParserArgs(args), nil
-	case "catfiles":
-		return buildCatfilesArgs(args), nil
-	case "decode":
-		return buildDecodeArgs(args), nil
-	case "diff":
-		return buildDiffArgs(args), nil
-	case "encode":
-		return buildEncodeArgs(args), nil
-	case "extract":
-		return buildExtractArgs(args), nil
-	case "foreach":
-		return buildForeachArgs(args), nil
-	case "hash":
-		return buildHashArgs(args), nil
-	case "init_temp":
-		return buildInitTempArgs(args), nil
-	case "clean_temp":
-		return buildCleanTempArgs(args), nil
-	case "math":
-		return buildMathArgs(args), nil
-	case "report":
-		return buildReportArgs(args), nil
-	case "stats":
-		return buildStatsArgs(args), nil
-	case "toml_query":
-		return buildTomlQueryArgs(args), nil
-	case "toml_validate":
-		return buildTomlValidateArgs(args), nil
-	case "toml_parse":
-		return buildTomlParseArgs(args), nil
-	case "transform_case":
-		return buildTransformCaseArgs(args), nil
-	case "transform_csv_to_json":
-		return buildTransformCsvToJsonArgs(args), nil
-	case "transform_json_to_csv":
-		return buildTransformJsonToCsvArgs(args), nil
-	case "transform_filter":
-		return buildTransformFilterArgs(args), nil
-	case "transform_sort":
-		return buildTransformSortArgs(args), nil
-	case "validate":
-		return buildValidateArgs(args), nil
-	case "runtime":
-		return buildRuntimeArgs(args), nil
-	case "complete":
-		return buildCompleteArgs(args), nil
-	case "parse_stream":
-		return buildParseStreamArgs(args), nil
-	case "route_td":
-		return buildRouteTDArgs(args), nil
-	case "coverage_report":
-		return buildCoverageReportArgs(args), nil
-	case "validate_risks":
-		return buildValidateRisksArgs(args), nil
-	case "sprint_status":
-		return buildSprintStatusArgs(args), nil
-	case "alignment_check":
-		return buildAlignmentCheckArgs(args), nil
-	case "tdd_compliance":
-		return buildTddComplianceArgs(args), nil
-	case "categorize_changes":
-		return buildCategorizeChangesArgs(args), nil
-	case "format_td_table":
-		return buildFormatTDTableArgs(args), nil
-	case "group_td":
-		return buildGroupTDArgs(args), nil
-	case "td_stats":
-		return buildTDStatsArgs(args), nil
-	case "td_clean":
-		return buildTDCleanArgs(args), nil
-	case "td_matrix":
-		return buildTDMatrixArgs(args), nil
-	case "td_filter":
-		return buildTDFilterArgs(args), nil
-	case "td_dedupe":
-		return buildTdDedupeArgs(args), nil
-	case "td_validate":
-		return buildTDValidateArgs(args), nil
-	case "discovery_validate":
-		return buildDiscoveryValidateArgs(args), nil
-	case "knowledge_audit":
-		return buildKnowledgeAuditArgs(args), nil
-	case "diff_smell":
-		return buildDiffSmellArgs(args), nil
-	case "tier_classifier":
-		return buildTierClassifierArgs(args), nil
-	case "fetch":
-		return buildFetchArgs(args), nil
-	default:
+	builder, ok := commandRegistry[cmdName]
+	if !ok {
 		return nil, fmt.Errorf("unknown command: %s", cmdName)
 	}
+	// Normalize parameter aliases before processing
+	return builder.build(normalizeArgs(args)), nil
 }
 
 func buildFetchArgs(args map[string]interface{}) []string {
@@ -346,35 +382,15 @@ func buildFetchArgs(args map[string]interface{}) []string {
 	return cmdArgs
 }
 
-func buildTreeArgs(args map[string]interface{}) []string {
-	cmdArgs := []string{"tree"}
-	if path, ok := args["path"].(string); ok {
-		cmdArgs = append(cmdArgs, "--path", path)
-	}
-	if depth, ok := getInt(args, "depth"); ok {
-		cmdArgs = append(cmdArgs, "--depth", strconv.Itoa(depth))
-	}
-	if maxEntries, ok := getInt(args, "max_entries"); ok {
-		cmdArgs = append(cmdArgs, "--max-entries", strconv.Itoa(maxEntries))
-	}
-	if getBool(args, "sizes") {
-		cmdArgs = append(cmdArgs, "--sizes")
-	}
-	if excludes, ok := args["exclude"].([]interface{}); ok {
-		for _, e := range excludes {
-			if s, ok := e.(string); ok {
-				cmdArgs = append(cmdArgs, "--exclude", s)
-			}
-		}
-	}
-	if getBool(args, "no_gitignore") {
-		cmdArgs = append(cmdArgs, "--no-gitignore")
-	}
-	if getBool(args, "no_default_excludes") {
-		cmdArgs = append(cmdArgs, "--no-default-excludes")
-	}
-	return cmdArgs
-}
+var buildTreeArgs = specBuilder([]string{"tree"},
+	mcputil.Arg("path", "--path", mcputil.ArgString),
+	mcputil.Arg("depth", "--depth", mcputil.ArgInt),
+	mcputil.Arg("max_entries", "--max-entries", mcputil.ArgInt),
+	mcputil.Arg("sizes", "--sizes", mcputil.ArgBool),
+	mcputil.Arg("exclude", "--exclude", mcputil.ArgStringList),
+	mcputil.Arg("no_gitignore", "--no-gitignore", mcputil.ArgBool),
+	mcputil.Arg("no_default_excludes", "--no-default-excludes", mcputil.ArgBool),
+)
 
 func buildGrepArgs(args map[string]interface{}) []string {
 	cmdArgs := []string{"grep"}
@@ -468,9 +484,7 @@ func buildTemplateArgs(args map[string]interface{}) []string {
 	cmdArgs := []string{"template", templateFile}
 
 	if vars, ok := args["vars"].(map[string]interface{}); ok {
-		for k, v := range vars {
-			cmdArgs = append(cmdArgs, "--var", fmt.Sprintf("%s=%v", k, v))
-		}
+		cmdArgs = appendAssignments(cmdArgs, "--var", vars)
 	}
 	// Default to brackets syntax ([[var]]) to avoid conflicts with LLM template syntaxes
 	// (Claude uses $var, Qwen/others use {{var}})
@@ -488,287 +502,123 @@ func buildTemplateArgs(args map[string]interface{}) []string {
 	return cmdArgs
 }
 
-func buildDiscoverTestsArgs(args map[string]interface{}) []string {
-	cmdArgs := []string{"discover-tests"}
-	if path, ok := args["path"].(string); ok {
-		cmdArgs = append(cmdArgs, "--path", path)
-	}
-	if getBoolDefault(args, "json", true) {
-		cmdArgs = append(cmdArgs, "--json")
-	}
+var buildDiscoverTestsArgs = specBuilder([]string{"discover-tests"},
+	mcputil.Arg("path", "--path", mcputil.ArgString),
+	mcputil.Arg("json", "--json", mcputil.ArgBoolOn),
 	// NOTE: --min is intentionally NOT used here. This command documents specific
 	// output fields (PATTERN, FRAMEWORK, TEST_RUNNER, etc.) that must always be
 	// present in JSON output for reliable parsing. Using --min would omit empty fields.
-	return cmdArgs
-}
+)
 
-func buildMultigrepArgs(args map[string]interface{}) []string {
-	cmdArgs := []string{"multigrep"}
-	if keywords, ok := args["keywords"].(string); ok {
-		cmdArgs = append(cmdArgs, "--keywords", keywords)
-	}
-	if path, ok := args["path"].(string); ok {
-		cmdArgs = append(cmdArgs, "--path", path)
-	}
-	if ext, ok := args["extensions"].(string); ok {
-		cmdArgs = append(cmdArgs, "--extensions", ext)
-	}
-	if max, ok := getInt(args, "max_per_keyword"); ok {
-		cmdArgs = append(cmdArgs, "--max-per-keyword", strconv.Itoa(max))
-	}
-	if getBool(args, "ignore_case") {
-		cmdArgs = append(cmdArgs, "--ignore-case")
-	}
-	if getBool(args, "definitions_only") {
-		cmdArgs = append(cmdArgs, "--definitions-only")
-	}
-	if getBoolDefault(args, "json", true) {
-		cmdArgs = append(cmdArgs, "--json")
-	}
-	if getBoolDefault(args, "min", true) {
-		cmdArgs = append(cmdArgs, "--min")
-	}
-	if dir, ok := args["output_dir"].(string); ok {
-		cmdArgs = append(cmdArgs, "--output-dir", dir)
-	}
-	return cmdArgs
-}
+var buildMultigrepArgs = specBuilder([]string{"multigrep"},
+	mcputil.Arg("keywords", "--keywords", mcputil.ArgString),
+	mcputil.Arg("path", "--path", mcputil.ArgString),
+	mcputil.Arg("extensions", "--extensions", mcputil.ArgString),
+	mcputil.Arg("max_per_keyword", "--max-per-keyword", mcputil.ArgInt),
+	mcputil.Arg("ignore_case", "--ignore-case", mcputil.ArgBool),
+	mcputil.Arg("definitions_only", "--definitions-only", mcputil.ArgBool),
+	mcputil.Arg("json", "--json", mcputil.ArgBoolOn),
+	mcputil.Arg("min", "--min", mcputil.ArgBoolOn),
+	mcputil.Arg("output_dir", "--output-dir", mcputil.ArgString),
+)
 
-func buildAnalyzeDepsArgs(args map[string]interface{}) []string {
-	cmdArgs := []string{"analyze-deps"}
-	if file, ok := args["file"].(string); ok {
-		cmdArgs = append(cmdArgs, file)
-	}
-	if getBoolDefault(args, "json", true) {
-		cmdArgs = append(cmdArgs, "--json")
-	}
-	if getBoolDefault(args, "min", true) {
-		cmdArgs = append(cmdArgs, "--min")
-	}
-	return cmdArgs
-}
+var buildAnalyzeDepsArgs = specBuilder([]string{"analyze-deps"},
+	mcputil.Arg("file", "", mcputil.ArgPositional),
+	mcputil.Arg("json", "--json", mcputil.ArgBoolOn),
+	mcputil.Arg("min", "--min", mcputil.ArgBoolOn),
+)
 
-func buildDetectArgs(args map[string]interface{}) []string {
-	cmdArgs := []string{"detect"}
-	if path, ok := args["path"].(string); ok {
-		cmdArgs = append(cmdArgs, "--path", path)
-	}
-	if dirs, ok := args["dirs"].(string); ok && dirs != "" {
-		cmdArgs = append(cmdArgs, "--dirs", dirs)
-	}
-	if getBoolDefault(args, "json", true) {
-		cmdArgs = append(cmdArgs, "--json")
-	}
+var buildDetectArgs = specBuilder([]string{"detect"},
+	mcputil.Arg("path", "--path", mcputil.ArgString),
+	mcputil.Arg("dirs", "--dirs", mcputil.ArgNonEmpty),
+	mcputil.Arg("json", "--json", mcputil.ArgBoolOn),
 	// NOTE: --min is intentionally NOT used here. This command documents specific
 	// output fields (STACK, LANGUAGE, PACKAGE_MANAGER, etc.) that must always be
 	// present in JSON output for reliable parsing. Using --min would omit empty fields.
-	return cmdArgs
-}
+)
 
-func buildProjectComponentsArgs(args map[string]interface{}) []string {
-	cmdArgs := []string{"project-components"}
-	if file, ok := args["file"].(string); ok {
-		cmdArgs = append(cmdArgs, "--file", file)
-	}
-	if getBoolDefault(args, "json", true) {
-		cmdArgs = append(cmdArgs, "--json")
-	}
-	if getBool(args, "min") {
-		cmdArgs = append(cmdArgs, "--min")
-	}
-	return cmdArgs
-}
+var buildProjectComponentsArgs = specBuilder([]string{"project-components"},
+	mcputil.Arg("file", "--file", mcputil.ArgString),
+	mcputil.Arg("json", "--json", mcputil.ArgBoolOn),
+	mcputil.Arg("min", "--min", mcputil.ArgBool),
+)
 
-func buildCountArgs(args map[string]interface{}) []string {
-	cmdArgs := []string{"count"}
-	if mode, ok := args["mode"].(string); ok {
-		cmdArgs = append(cmdArgs, "--mode", mode)
-	}
-	if path, ok := args["path"].(string); ok {
-		cmdArgs = append(cmdArgs, "--path", path)
-	}
-	if getBool(args, "recursive") {
-		cmdArgs = append(cmdArgs, "--recursive")
-	}
-	if pattern, ok := args["pattern"].(string); ok {
-		cmdArgs = append(cmdArgs, "--pattern", pattern)
-	}
-	if getBoolDefault(args, "json", true) {
-		cmdArgs = append(cmdArgs, "--json")
-	}
-	if getBoolDefault(args, "min", true) {
-		cmdArgs = append(cmdArgs, "--min")
-	}
-	return cmdArgs
-}
+var buildCountArgs = specBuilder([]string{"count"},
+	mcputil.Arg("mode", "--mode", mcputil.ArgString),
+	mcputil.Arg("path", "--path", mcputil.ArgString),
+	mcputil.Arg("recursive", "--recursive", mcputil.ArgBool),
+	mcputil.Arg("pattern", "--pattern", mcputil.ArgString),
+	mcputil.Arg("json", "--json", mcputil.ArgBoolOn),
+	mcputil.Arg("min", "--min", mcputil.ArgBoolOn),
+)
 
-func buildSummarizeDirArgs(args map[string]interface{}) []string {
-	cmdArgs := []string{"summarize-dir"}
-	if path, ok := args["path"].(string); ok {
-		cmdArgs = append(cmdArgs, "--path", path)
-	}
-	if format, ok := args["format"].(string); ok {
-		cmdArgs = append(cmdArgs, "--format", format)
-	}
-	if getBool(args, "recursive") {
-		cmdArgs = append(cmdArgs, "--recursive")
-	}
-	if glob, ok := args["glob"].(string); ok {
-		cmdArgs = append(cmdArgs, "--glob", glob)
-	}
-	if max, ok := getInt(args, "max_tokens"); ok {
-		cmdArgs = append(cmdArgs, "--max-tokens", strconv.Itoa(max))
-	}
-	return cmdArgs
-}
+var buildSummarizeDirArgs = specBuilder([]string{"summarize-dir"},
+	mcputil.Arg("path", "--path", mcputil.ArgString),
+	mcputil.Arg("format", "--format", mcputil.ArgString),
+	mcputil.Arg("recursive", "--recursive", mcputil.ArgBool),
+	mcputil.Arg("glob", "--glob", mcputil.ArgString),
+	mcputil.Arg("max_tokens", "--max-tokens", mcputil.ArgInt),
+)
 
-func buildDepsArgs(args map[string]interface{}) []string {
-	cmdArgs := []string{"deps"}
-	if manifest, ok := args["manifest"].(string); ok {
-		cmdArgs = append(cmdArgs, manifest)
-	}
-	if t, ok := args["type"].(string); ok {
-		cmdArgs = append(cmdArgs, "--type", t)
-	}
-	if getBoolDefault(args, "json", true) {
-		cmdArgs = append(cmdArgs, "--json")
-	}
-	if getBoolDefault(args, "min", true) {
-		cmdArgs = append(cmdArgs, "--min")
-	}
-	return cmdArgs
-}
+var buildDepsArgs = specBuilder([]string{"deps"},
+	mcputil.Arg("manifest", "", mcputil.ArgPositional),
+	mcputil.Arg("type", "--type", mcputil.ArgString),
+	mcputil.Arg("json", "--json", mcputil.ArgBoolOn),
+	mcputil.Arg("min", "--min", mcputil.ArgBoolOn),
+)
 
-func buildGitContextArgs(args map[string]interface{}) []string {
-	cmdArgs := []string{"git-context"}
-	if path, ok := args["path"].(string); ok {
-		cmdArgs = append(cmdArgs, "--path", path)
-	}
-	if getBool(args, "include_diff") {
-		cmdArgs = append(cmdArgs, "--include-diff")
-	}
-	if since, ok := args["since"].(string); ok {
-		cmdArgs = append(cmdArgs, "--since", since)
-	}
-	if max, ok := getInt(args, "max_commits"); ok {
-		cmdArgs = append(cmdArgs, "--max-commits", strconv.Itoa(max))
-	}
-	if getBoolDefault(args, "json", true) {
-		cmdArgs = append(cmdArgs, "--json")
-	}
-	if getBoolDefault(args, "min", true) {
-		cmdArgs = append(cmdArgs, "--min")
-	}
-	return cmdArgs
-}
+var buildGitContextArgs = specBuilder([]string{"git-context"},
+	mcputil.Arg("path", "--path", mcputil.ArgString),
+	mcputil.Arg("include_diff", "--include-diff", mcputil.ArgBool),
+	mcputil.Arg("since", "--since", mcputil.ArgString),
+	mcputil.Arg("max_commits", "--max-commits", mcputil.ArgInt),
+	mcputil.Arg("json", "--json", mcputil.ArgBoolOn),
+	mcputil.Arg("min", "--min", mcputil.ArgBoolOn),
+)
 
-func buildValidatePlanArgs(args map[string]interface{}) []string {
-	cmdArgs := []string{"validate-plan"}
-	if path, ok := args["path"].(string); ok {
-		cmdArgs = append(cmdArgs, "--path", path)
-	}
-	if getBoolDefault(args, "json", true) {
-		cmdArgs = append(cmdArgs, "--json")
-	}
-	if getBoolDefault(args, "min", true) {
-		cmdArgs = append(cmdArgs, "--min")
-	}
-	return cmdArgs
-}
+var buildValidatePlanArgs = specBuilder([]string{"validate-plan"},
+	mcputil.Arg("path", "--path", mcputil.ArgString),
+	mcputil.Arg("json", "--json", mcputil.ArgBoolOn),
+	mcputil.Arg("min", "--min", mcputil.ArgBoolOn),
+)
 
-func buildPartitionWorkArgs(args map[string]interface{}) []string {
-	cmdArgs := []string{"partition-work"}
-	if stories, ok := args["stories"].(string); ok {
-		cmdArgs = append(cmdArgs, "--stories", stories)
-	}
-	if tasks, ok := args["tasks"].(string); ok {
-		cmdArgs = append(cmdArgs, "--tasks", tasks)
-	}
-	if getBool(args, "verbose") {
-		cmdArgs = append(cmdArgs, "--verbose")
-	}
-	if getBoolDefault(args, "json", true) {
-		cmdArgs = append(cmdArgs, "--json")
-	}
-	if getBoolDefault(args, "min", true) {
-		cmdArgs = append(cmdArgs, "--min")
-	}
-	return cmdArgs
-}
+var buildPartitionWorkArgs = specBuilder([]string{"partition-work"},
+	mcputil.Arg("stories", "--stories", mcputil.ArgString),
+	mcputil.Arg("tasks", "--tasks", mcputil.ArgString),
+	mcputil.Arg("verbose", "--verbose", mcputil.ArgBool),
+	mcputil.Arg("json", "--json", mcputil.ArgBoolOn),
+	mcputil.Arg("min", "--min", mcputil.ArgBoolOn),
+)
 
-func buildRepoRootArgs(args map[string]interface{}) []string {
-	cmdArgs := []string{"repo-root"}
-	if path, ok := args["path"].(string); ok {
-		cmdArgs = append(cmdArgs, "--path", path)
-	}
-	if getBool(args, "validate") {
-		cmdArgs = append(cmdArgs, "--validate")
-	}
-	return cmdArgs
-}
+var buildRepoRootArgs = specBuilder([]string{"repo-root"},
+	mcputil.Arg("path", "--path", mcputil.ArgString),
+	mcputil.Arg("validate", "--validate", mcputil.ArgBool),
+)
 
-func buildReviewRangeArgs(args map[string]interface{}) []string {
-	cmdArgs := []string{"review_range"}
-	if repo, ok := args["repo"].(string); ok && repo != "" {
-		cmdArgs = append(cmdArgs, "--repo", repo)
-	}
-	if base, ok := args["base"].(string); ok && base != "" {
-		cmdArgs = append(cmdArgs, "--base", base)
-	}
-	if head, ok := args["head"].(string); ok && head != "" {
-		cmdArgs = append(cmdArgs, "--head", head)
-	}
-	if mc, ok := args["merge_commit"].(string); ok && mc != "" {
-		cmdArgs = append(cmdArgs, "--merge-commit", mc)
-	}
-	return cmdArgs
-}
+var buildReviewRangeArgs = specBuilder([]string{"review_range"},
+	mcputil.Arg("repo", "--repo", mcputil.ArgNonEmpty),
+	mcputil.Arg("base", "--base", mcputil.ArgNonEmpty),
+	mcputil.Arg("head", "--head", mcputil.ArgNonEmpty),
+	mcputil.Arg("merge_commit", "--merge-commit", mcputil.ArgNonEmpty),
+)
 
-func buildExtractRelevantArgs(args map[string]interface{}) []string {
-	cmdArgs := []string{"extract-relevant"}
-	if path, ok := args["path"].(string); ok {
-		cmdArgs = append(cmdArgs, "--path", path)
-	}
-	if ctx, ok := args["context"].(string); ok {
-		cmdArgs = append(cmdArgs, "--context", ctx)
-	}
-	if conc, ok := getInt(args, "concurrency"); ok {
-		cmdArgs = append(cmdArgs, "--concurrency", strconv.Itoa(conc))
-	}
-	if output, ok := args["output"].(string); ok {
-		cmdArgs = append(cmdArgs, "--output", output)
-	}
-	if timeout, ok := getInt(args, "timeout"); ok {
-		cmdArgs = append(cmdArgs, "--timeout", strconv.Itoa(timeout))
-	}
-	if getBoolDefault(args, "json", true) {
-		cmdArgs = append(cmdArgs, "--json")
-	}
-	if getBoolDefault(args, "min", true) {
-		cmdArgs = append(cmdArgs, "--min")
-	}
-	return cmdArgs
-}
+var buildExtractRelevantArgs = specBuilder([]string{"extract-relevant"},
+	mcputil.Arg("path", "--path", mcputil.ArgString),
+	mcputil.Arg("context", "--context", mcputil.ArgString),
+	mcputil.Arg("concurrency", "--concurrency", mcputil.ArgInt),
+	mcputil.Arg("output", "--output", mcputil.ArgString),
+	mcputil.Arg("timeout", "--timeout", mcputil.ArgInt),
+	mcputil.Arg("json", "--json", mcputil.ArgBoolOn),
+	mcputil.Arg("min", "--min", mcputil.ArgBoolOn),
+)
 
-func buildExtractLinksArgs(args map[string]interface{}) []string {
-	cmdArgs := []string{"extract-links"}
-	if url, ok := args["url"].(string); ok {
-		cmdArgs = append(cmdArgs, "--url", url)
-	}
-	if context, ok := args["context"].(string); ok && context != "" {
-		cmdArgs = append(cmdArgs, "--context", context)
-	}
-	if timeout, ok := getInt(args, "timeout"); ok {
-		cmdArgs = append(cmdArgs, "--timeout", strconv.Itoa(timeout))
-	}
-	if getBoolDefault(args, "json", true) {
-		cmdArgs = append(cmdArgs, "--json")
-	}
-	if getBoolDefault(args, "min", true) {
-		cmdArgs = append(cmdArgs, "--min")
-	}
-	return cmdArgs
-}
+var buildExtractLinksArgs = specBuilder([]string{"extract-links"},
+	mcputil.Arg("url", "--url", mcputil.ArgString),
+	mcputil.Arg("context", "--context", mcputil.ArgNonEmpty),
+	mcputil.Arg("timeout", "--timeout", mcputil.ArgInt),
+	mcputil.Arg("json", "--json", mcputil.ArgBoolOn),
+	mcputil.Arg("min", "--min", mcputil.ArgBoolOn),
+)
 
 func buildHighestArgs(args map[string]interface{}) []string {
 	cmdArgs := []string{"highest"}
@@ -805,40 +655,20 @@ func buildHighestArgs(args map[string]interface{}) []string {
 	return cmdArgs
 }
 
-func buildPlanTypeArgs(args map[string]interface{}) []string {
-	cmdArgs := []string{"plan-type"}
-	if path, ok := args["path"].(string); ok {
-		cmdArgs = append(cmdArgs, "--path", path)
-	}
-	if getBoolDefault(args, "json", true) {
-		cmdArgs = append(cmdArgs, "--json")
-	}
-	if getBoolDefault(args, "min", true) {
-		cmdArgs = append(cmdArgs, "--min")
-	}
-	return cmdArgs
-}
+var buildPlanTypeArgs = specBuilder([]string{"plan-type"},
+	mcputil.Arg("path", "--path", mcputil.ArgString),
+	mcputil.Arg("json", "--json", mcputil.ArgBoolOn),
+	mcputil.Arg("min", "--min", mcputil.ArgBoolOn),
+)
 
-func buildGitChangesArgs(args map[string]interface{}) []string {
-	cmdArgs := []string{"git-changes"}
-	if path, ok := args["path"].(string); ok {
-		cmdArgs = append(cmdArgs, "--path", path)
-	}
-	// Handle include_untracked - default is true, only add flag if explicitly false
-	if v, ok := args["include_untracked"].(bool); ok && !v {
-		cmdArgs = append(cmdArgs, "--include-untracked=false")
-	}
-	if getBool(args, "staged_only") {
-		cmdArgs = append(cmdArgs, "--staged-only")
-	}
-	if getBoolDefault(args, "json", true) {
-		cmdArgs = append(cmdArgs, "--json")
-	}
-	if getBoolDefault(args, "min", true) {
-		cmdArgs = append(cmdArgs, "--min")
-	}
-	return cmdArgs
-}
+var buildGitChangesArgs = specBuilder([]string{"git-changes"},
+	mcputil.Arg("path", "--path", mcputil.ArgString),
+	// include_untracked defaults to true; only pass the flag when explicitly false
+	mcputil.Arg("include_untracked", "--include-untracked=false", mcputil.ArgBoolOff),
+	mcputil.Arg("staged_only", "--staged-only", mcputil.ArgBool),
+	mcputil.Arg("json", "--json", mcputil.ArgBoolOn),
+	mcputil.Arg("min", "--min", mcputil.ArgBoolOn),
+)
 
 func buildContextArgs(args map[string]interface{}) []string {
 	cmdArgs := []string{"context"}
@@ -915,15 +745,33 @@ func getBoolDefault(args map[string]interface{}, key string, defaultVal bool) bo
 }
 
 func getInt(args map[string]interface{}, key string) (int, bool) {
-	switch v := args[key].(type) {
-	case int:
-		return v, true
+	return mcputil.IntValue(args[key])
+}
+
+// appendAssignments appends flag KEY=VALUE for each entry in vars
+func appendAssignments(cmdArgs []string, flag string, vars map[string]interface{}) []string {
+	cmdArgs = slices.Grow(cmdArgs, 2*len(vars))
+	for k, v := range vars {
+		cmdArgs = append(cmdArgs, flag, k+"="+formatValue(v))
+	}
+	return cmdArgs
+}
+
+// formatValue renders a decoded JSON value as a CLI argument, producing the
+// same text as fmt.Sprint. The types JSON decodes to are formatted directly;
+// anything else falls back to fmt.
+func formatValue(v interface{}) string {
+	switch v := v.(type) {
+	case string:
+		return v
 	case float64:
-		return int(v), true
-	case int64:
-		return int(v), true
+		return strconv.FormatFloat(v, 'g', -1, 64)
+	case bool:
+		return strconv.FormatBool(v)
+	case int:
+		return strconv.Itoa(v)
 	}
-	return 0, false
+	return fmt.Sprint(v)
 }
 
 func getInt64(args map[string]interface{}, key string) (int64, bool) {
@@ -964,12 +812,7 @@ func buildContextMultiSetArgs(args map[string]interface{}) []string {
 	// Convert pairs object to KEY VALUE arguments
 	if pairs, ok := args["pairs"].(map[string]interface{}); ok {
 		for key, value := range pairs {
-			cmdArgs = append(cmdArgs, key)
-			if v, ok := value.(string); ok {
-				cmdArgs = append(cmdArgs, v)
-			} else {
-				cmdArgs = append(cmdArgs, fmt.Sprintf("%v", value))
-			}
+			cmdArgs = append(cmdArgs, key, formatValue(value))
 		}
 	}
 
@@ -1029,9 +872,7 @@ func buildCompleteArgs(args map[string]interface{}) []string {
 	}
 	// Handle vars as a map
 	if vars, ok := args["vars"].(map[string]interface{}); ok {
-		for k, v := range vars {
-			cmdArgs = append(cmdArgs, "--var", fmt.Sprintf("%s=%v", k, v))
-		}
+		cmdArgs = appendAssignments(cmdArgs, "--var", vars)
 	}
 	if system, ok := args["system"].(string); ok {
 		cmdArgs = append(cmdArgs, "--system", system)
@@ -1188,12 +1029,7 @@ func buildYamlMultisetArgs(args map[string]interface{}) []string {
 	// Convert pairs object to KEY VALUE arguments
 	if pairs, ok := args["pairs"].(map[string]interface{}); ok {
 		for key, value := range pairs {
-			cmdArgs = append(cmdArgs, key)
-			if v, ok := value.(string); ok {
-				cmdArgs = append(cmdArgs, v)
-			} else {
-				cmdArgs = append(cmdArgs, fmt.Sprintf("%v", value))
-			}
+			cmdArgs = append(cmdArgs, key, formatValue(value))
 		}
 	}
 
@@ -1384,9 +1220,7 @@ func buildForeachArgs(args map[string]interface{}) []string {
 		cmdArgs = append(cmdArgs, "--timeout", strconv.Itoa(timeout))
 	}
 	if vars, ok := args["vars"].(map[string]interface{}); ok {
-		for k, v := range vars {
-			cmdArgs = append(cmdArgs, "--var", fmt.Sprintf("%s=%v", k, v))
-		}
+		cmdArgs = appendAssignments(cmdArgs, "--var", vars)
 	}
 	if getBoolDefault(args, "json", true) {
 		cmdArgs = append(cmdArgs, "--json")
@@ -1421,59 +1255,25 @@ func buildHashArgs(args map[string]interface{}) []string {
 	return cmdArgs
 }
 
-func buildInitTempArgs(args map[string]interface{}) []string {
-	cmdArgs := []string{"init-temp"}
-
-	if name, ok := args["name"].(string); ok {
-		cmdArgs = append(cmdArgs, "--name", name)
-	}
-	// clean defaults to true, only add flag if explicitly false
-	if v, ok := args["clean"].(bool); ok && !v {
-		cmdArgs = append(cmdArgs, "--clean=false")
-	}
-	if getBool(args, "preserve") {
-		cmdArgs = append(cmdArgs, "--preserve")
-	}
-	if getBool(args, "with_git") {
-		cmdArgs = append(cmdArgs, "--with-git")
-	}
-	if getBool(args, "skip_context") {
-		cmdArgs = append(cmdArgs, "--skip-context")
-	}
-	if getBoolDefault(args, "json", true) {
-		cmdArgs = append(cmdArgs, "--json")
-	}
-	if getBoolDefault(args, "min", true) {
-		cmdArgs = append(cmdArgs, "--min")
-	}
-
-	return cmdArgs
-}
-
-func buildCleanTempArgs(args map[string]interface{}) []string {
-	cmdArgs := []string{"clean-temp"}
-
-	if name, ok := args["name"].(string); ok {
-		cmdArgs = append(cmdArgs, "--name", name)
-	}
-	if getBool(args, "all") {
-		cmdArgs = append(cmdArgs, "--all")
-	}
-	if olderThan, ok := args["older_than"].(string); ok {
-		cmdArgs = append(cmdArgs, "--older-than", olderThan)
-	}
-	if getBool(args, "dry_run") {
-		cmdArgs = append(cmdArgs, "--dry-run")
-	}
-	if getBoolDefault(args, "json", true) {
-		cmdArgs = append(cmdArgs, "--json")
-	}
-	if getBoolDefault(args, "min", true) {
-		cmdArgs = append(cmdArgs, "--min")
-	}
+var buildInitTempArgs = specBuilder([]string{"init-temp"},
+	mcputil.Arg("name", "--name", mcputil.ArgString),
+	// clean defaults to true; only pass the flag when explicitly false
+	mcputil.Arg("clean", "--clean=false", mcputil.ArgBoolOff),
+	mcputil.Arg("preserve", "--preserve", mcputil.ArgBool),
+	mcputil.Arg("with_git", "--with-git", mcputil.ArgBool),
+	mcputil.Arg("skip_context", "--skip-context", mcputil.ArgBool),
+	mcputil.Arg("json", "--json", mcputil.ArgBoolOn),
+	mcputil.Arg("min", "--min", mcputil.ArgBoolOn),
+)
 
-	return cmdArgs
-}
+var buildCleanTempArgs = specBuilder([]string{"clean-temp"},
+	mcputil.Arg("name", "--name", mcputil.ArgString),
+	mcputil.Arg("all", "--all", mcputil.ArgBool),
+	mcputil.Arg("older_than", "--older-than", mcputil.ArgString),
+	mcputil.Arg("dry_run", "--dry-run", mcputil.ArgBool),
+	mcputil.Arg("json", "--json", mcputil.ArgBoolOn),
+	mcputil.Arg("min", "--min", mcputil.ArgBoolOn),
+)
 
 func buildMathArgs(args map[string]interface{}) []string {
 	cmdArgs := []string{"math"}
@@ -1495,9 +1295,7 @@ func buildReportArgs(args map[string]interface{}) []string {
 		cmdArgs = append(cmdArgs, "--status", status)
 	}
 	if stats, ok := args["stats"].(map[string]interface{}); ok {
-		for k, v := range stats {
-			cmdArgs = append(cmdArgs, "--stat", fmt.Sprintf("%s=%v", k, v))
-		}
+		cmdArgs = appendAssignments(cmdArgs, "--stat", stats)
 	}
 	if output, ok := args["output"].(string); ok {
 		cmdArgs = append(cmdArgs, "--output", output)
@@ -1512,24 +1310,12 @@ func buildReportArgs(args map[string]interface{}) []string {
 	return cmdArgs
 }
 
-func buildStatsArgs(args map[string]interface{}) []string {
-	cmdArgs := []string{"stats"}
-
-	if path, ok := args["path"].(string); ok {
-		cmdArgs = append(cmdArgs, "--path", path)
-	}
-	if getBool(args, "no_gitignore") {
-		cmdArgs = append(cmdArgs, "--no-gitignore")
-	}
-	if getBoolDefault(args, "json", true) {
-		cmdArgs = append(cmdArgs, "--json")
-	}
-	if getBoolDefault(args, "min", true) {
-		cmdArgs = append(cmdArgs, "--min")
-	}
-
-	return cmdArgs
-}
+var buildStatsArgs = specBuilder([]string{"stats"},
+	mcputil.Arg("path", "--path", mcputil.ArgString),
+	mcputil.Arg("no_gitignore", "--no-gitignore", mcputil.ArgBool),
+	mcputil.Arg("json", "--json", mcputil.ArgBoolOn),
+	mcputil.Arg("min", "--min", mcputil.ArgBoolOn),
+)
 
 func buildTomlQueryArgs(args map[string]interface{}) []string {
 	cmdArgs := []string{"toml", "query"}
@@ -1689,70 +1475,32 @@ func buildRuntimeArgs(args map[string]interface{}) []string {
 	return cmdArgs
 }
 
-func buildParseStreamArgs(args map[string]interface{}) []string {
-	cmdArgs := []string{"parse-stream"}
-	if file, ok := args["file"].(string); ok {
-		cmdArgs = append(cmdArgs, "--file", file)
-	}
-	if content, ok := args["content"].(string); ok {
-		cmdArgs = append(cmdArgs, "--content", content)
-	}
-	if format, ok := args["format"].(string); ok {
-		cmdArgs = append(cmdArgs, "--format", format)
-	}
-	if delimiter, ok := args["delimiter"].(string); ok {
-		cmdArgs = append(cmdArgs, "--delimiter", delimiter)
-	}
-	if headers, ok := args["headers"].(string); ok {
-		cmdArgs = append(cmdArgs, "--headers", headers)
-	}
-	return cmdArgs
-}
+var buildParseStreamArgs = specBuilder([]string{"parse-stream"},
+	mcputil.Arg("file", "--file", mcputil.ArgString),
+	mcputil.Arg("content", "--content", mcputil.ArgString),
+	mcputil.Arg("format", "--format", mcputil.ArgString),
+	mcputil.Arg("delimiter", "--delimiter", mcputil.ArgString),
+	mcputil.Arg("headers", "--headers", mcputil.ArgString),
+)
 
-func buildRouteTDArgs(args map[string]interface{}) []string {
-	cmdArgs := []string{"route-td"}
-	if file, ok := args["file"].(string); ok {
-		cmdArgs = append(cmdArgs, "--file", file)
-	}
-	if content, ok := args["content"].(string); ok {
-		cmdArgs = append(cmdArgs, "--content", content)
-	}
-	if quickWinsMax, ok := getInt(args, "quick_wins_max"); ok {
-		cmdArgs = append(cmdArgs, "--quick-wins-max", strconv.Itoa(quickWinsMax))
-	}
-	if backlogMax, ok := getInt(args, "backlog_max"); ok {
-		cmdArgs = append(cmdArgs, "--backlog-max", strconv.Itoa(backlogMax))
-	}
-	return cmdArgs
-}
+var buildRouteTDArgs = specBuilder([]string{"route-td"},
+	mcputil.Arg("file", "--file", mcputil.ArgString),
+	mcputil.Arg("content", "--content", mcputil.ArgString),
+	mcputil.Arg("quick_wins_max", "--quick-wins-max", mcputil.ArgInt),
+	mcputil.Arg("backlog_max", "--backlog-max", mcputil.ArgInt),
+)
 
-func buildCoverageReportArgs(args map[string]interface{}) []string {
-	cmdArgs := []string{"coverage-report"}
-	if requirements, ok := args["requirements"].(string); ok {
-		cmdArgs = append(cmdArgs, "--requirements", requirements)
-	}
-	if stories, ok := args["stories"].(string); ok {
-		cmdArgs = append(cmdArgs, "--stories", stories)
-	}
-	return cmdArgs
-}
+var buildCoverageReportArgs = specBuilder([]string{"coverage-report"},
+	mcputil.Arg("requirements", "--requirements", mcputil.ArgString),
+	mcputil.Arg("stories", "--stories", mcputil.ArgString),
+)
 
-func buildValidateRisksArgs(args map[string]interface{}) []string {
-	cmdArgs := []string{"validate-risks"}
-	if design, ok := args["design"].(string); ok {
-		cmdArgs = append(cmdArgs, "--design", design)
-	}
-	if stories, ok := args["stories"].(string); ok {
-		cmdArgs = append(cmdArgs, "--stories", stories)
-	}
-	if tasks, ok := args["tasks"].(string); ok {
-		cmdArgs = append(cmdArgs, "--tasks", tasks)
-	}
-	if ac, ok := args["acceptance_criteria"].(string); ok {
-		cmdArgs = append(cmdArgs, "--acceptance-criteria", ac)
-	}
-	return cmdArgs
-}
+var buildValidateRisksArgs = specBuilder([]string{"validate-risks"},
+	mcputil.Arg("design", "--design", mcputil.ArgString),
+	mcputil.Arg("stories", "--stories", mcputil.ArgString),
+	mcputil.Arg("tasks", "--tasks", mcputil.ArgString),
+	mcputil.Arg("acceptance_criteria", "--acceptance-criteria", mcputil.ArgString),
+)
 
 func buildSprintStatusArgs(args map[string]interface{}) []string {
 	cmdArgs := []string{"sprint-status"}
@@ -1785,70 +1533,32 @@ func buildSprintStatusArgs(args map[string]interface{}) []string {
 	return cmdArgs
 }
 
-func buildAlignmentCheckArgs(args map[string]interface{}) []string {
-	cmdArgs := []string{"alignment-check"}
-	if requirements, ok := args["requirements"].(string); ok {
-		cmdArgs = append(cmdArgs, "--requirements", requirements)
-	}
-	if stories, ok := args["stories"].(string); ok {
-		cmdArgs = append(cmdArgs, "--stories", stories)
-	}
-	if tasks, ok := args["tasks"].(string); ok {
-		cmdArgs = append(cmdArgs, "--tasks", tasks)
-	}
-	return cmdArgs
-}
+var buildAlignmentCheckArgs = specBuilder([]string{"alignment-check"},
+	mcputil.Arg("requirements", "--requirements", mcputil.ArgString),
+	mcputil.Arg("stories", "--stories", mcputil.ArgString),
+	mcputil.Arg("tasks", "--tasks", mcputil.ArgString),
+)
 
-func buildTddComplianceArgs(args map[string]interface{}) []string {
-	cmdArgs := []string{"tdd-compliance"}
-	if path, ok := args["path"].(string); ok {
-		cmdArgs = append(cmdArgs, "--path", path)
-	}
-	if content, ok := args["content"].(string); ok {
-		cmdArgs = append(cmdArgs, "--content", content)
-	}
-	if since, ok := args["since"].(string); ok {
-		cmdArgs = append(cmdArgs, "--since", since)
-	}
-	if until, ok := args["until"].(string); ok {
-		cmdArgs = append(cmdArgs, "--until", until)
-	}
-	if count, ok := getInt(args, "count"); ok {
-		cmdArgs = append(cmdArgs, "--count", strconv.Itoa(count))
-	}
-	return cmdArgs
-}
+var buildTddComplianceArgs = specBuilder([]string{"tdd-compliance"},
+	mcputil.Arg("path", "--path", mcputil.ArgString),
+	mcputil.Arg("content", "--content", mcputil.ArgString),
+	mcputil.Arg("since", "--since", mcputil.ArgString),
+	mcputil.Arg("until", "--until", mcputil.ArgString),
+	mcputil.Arg("count", "--count", mcputil.ArgInt),
+)
 
-func buildCategorizeChangesArgs(args map[string]interface{}) []string {
-	cmdArgs := []string{"categorize-changes"}
-	if file, ok := args["file"].(string); ok {
-		cmdArgs = append(cmdArgs, "--file", file)
-	}
-	if content, ok := args["content"].(string); ok {
-		cmdArgs = append(cmdArgs, "--content", content)
-	}
-	if patterns, ok := args["sensitive_patterns"].(string); ok {
-		cmdArgs = append(cmdArgs, "--sensitive-patterns", patterns)
-	}
-	return cmdArgs
-}
+var buildCategorizeChangesArgs = specBuilder([]string{"categorize-changes"},
+	mcputil.Arg("file", "--file", mcputil.ArgString),
+	mcputil.Arg("content", "--content", mcputil.ArgString),
+	mcputil.Arg("sensitive_patterns", "--sensitive-patterns", mcputil.ArgString),
+)
 
-func buildFormatTDTableArgs(args map[string]interface{}) []string {
-	cmdArgs := []string{"format-td-table"}
-	if file, ok := args["file"].(string); ok {
-		cmdArgs = append(cmdArgs, "--file", file)
-	}
-	if content, ok := args["content"].(string); ok {
-		cmdArgs = append(cmdArgs, "--content", content)
-	}
-	if section, ok := args["section"].(string); ok {
-		cmdArgs = append(cmdArgs, "--section", section)
-	}
-	if checkbox, ok := args["checkbox"].(bool); ok && checkbox {
-		cmdArgs = append(cmdArgs, "--checkbox")
-	}
-	return cmdArgs
-}
+var buildFormatTDTableArgs = specBuilder([]string{"format-td-table"},
+	mcputil.Arg("file", "--file", mcputil.ArgString),
+	mcputil.Arg("content", "--content", mcputil.ArgString),
+	mcputil.Arg("section", "--section", mcputil.ArgString),
+	mcputil.Arg("checkbox", "--checkbox", mcputil.ArgBool),
+)
 
 func buildGroupTDArgs(args map[string]interface{}) []string {
 	cmdArgs := []string{"group-td"}
@@ -1904,79 +1614,48 @@ func buildGroupTDArgs(args map[string]interface{}) []string {
 	return cmdArgs
 }
 
-func buildTDStatsArgs(args map[string]interface{}) []string {
-	cmdArgs := []string{"td-stats"}
-	if path, ok := args["path"].(string); ok {
-		cmdArgs = append(cmdArgs, "--path", path)
-	}
-	if write, ok := args["write"].(bool); ok && write {
-		cmdArgs = append(cmdArgs, "--write")
-	}
-	if today, ok := args["today"].(string); ok && today != "" {
-		cmdArgs = append(cmdArgs, "--today", today)
-	}
-	cmdArgs = append(cmdArgs, "--json", "--min")
-	return cmdArgs
-}
+var buildTDStatsArgs = specBuilder([]string{"td-stats"},
+	mcputil.Arg("path", "--path", mcputil.ArgString),
+	mcputil.Arg("write", "--write", mcputil.ArgBool),
+	mcputil.Arg("today", "--today", mcputil.ArgNonEmpty),
+	mcputil.Arg("", "--json", mcputil.ArgAlways),
+	mcputil.Arg("", "--min", mcputil.ArgAlways),
+)
 
-func buildTDCleanArgs(args map[string]interface{}) []string {
-	cmdArgs := []string{"td-clean"}
-	if path, ok := args["path"].(string); ok {
-		cmdArgs = append(cmdArgs, "--path", path)
-	}
-	if today, ok := args["today"].(string); ok && today != "" {
-		cmdArgs = append(cmdArgs, "--today", today)
-	}
-	cmdArgs = append(cmdArgs, "--json", "--min")
-	return cmdArgs
-}
+var buildTDCleanArgs = specBuilder([]string{"td-clean"},
+	mcputil.Arg("path", "--path", mcputil.ArgString),
+	mcputil.Arg("today", "--today", mcputil.ArgNonEmpty),
+	mcputil.Arg("", "--json", mcputil.ArgAlways),
+	mcputil.Arg("", "--min", mcputil.ArgAlways),
+)
 
-func buildTDMatrixArgs(args map[string]interface{}) []string {
-	cmdArgs := []string{"td-matrix"}
-	if path, ok := args["path"].(string); ok {
-		cmdArgs = append(cmdArgs, "--path", path)
-	}
-	cmdArgs = append(cmdArgs, "--json", "--min")
-	return cmdArgs
-}
+var buildTDMatrixArgs = specBuilder([]string{"td-matrix"},
+	mcputil.Arg("path", "--path", mcputil.ArgString),
+	mcputil.Arg("", "--json", mcputil.ArgAlways),
+	mcputil.Arg("", "--min", mcputil.ArgAlways),
+)
 
-func buildTDFilterArgs(args map[string]interface{}) []string {
-	cmdArgs := []string{"td-filter"}
-	if path, ok := args["path"].(string); ok {
-		cmdArgs = append(cmdArgs, "--path", path)
-	}
-	for _, key := range []string{"mode", "severity", "confidence", "group", "focus"} {
-		if v, ok := args[key].(string); ok && v != "" {
-			cmdArgs = append(cmdArgs, "--"+key, v)
-		}
-	}
-	if v, ok := args["max"].(float64); ok {
-		cmdArgs = append(cmdArgs, "--max", strconv.Itoa(int(v)))
-	}
+var buildTDFilterArgs = specBuilder([]string{"td-filter"},
+	mcputil.Arg("path", "--path", mcputil.ArgString),
+	mcputil.Arg("mode", "--mode", mcputil.ArgNonEmpty),
+	mcputil.Arg("severity", "--severity", mcputil.ArgNonEmpty),
+	mcputil.Arg("confidence", "--confidence", mcputil.ArgNonEmpty),
+	mcputil.Arg("group", "--group", mcputil.ArgNonEmpty),
+	mcputil.Arg("focus", "--focus", mcputil.ArgNonEmpty),
+	mcputil.Arg("max", "--max", mcputil.ArgInt),
 	// Full JSON (no --min): the consumer iterates complete item objects; minimal
 	// mode would omit zero/empty item fields. The filtered set is small, so the
 	// token cost is negligible.
-	cmdArgs = append(cmdArgs, "--json")
-	return cmdArgs
-}
+	mcputil.Arg("", "--json", mcputil.ArgAlways),
+)
 
-func buildTdDedupeArgs(args map[string]interface{}) []string {
-	cmdArgs := []string{"td-dedupe"}
-	if v, ok := args["streams"].(string); ok && v != "" {
-		cmdArgs = append(cmdArgs, "--streams", v)
-	}
-	if v, ok := args["source_tags"].(string); ok && v != "" {
-		cmdArgs = append(cmdArgs, "--source-tags", v)
-	}
-	if v, ok := args["tolerance"].(float64); ok {
-		cmdArgs = append(cmdArgs, "--tolerance", strconv.Itoa(int(v)))
-	}
-	if v, ok := args["untrusted"].(string); ok && v != "" {
-		cmdArgs = append(cmdArgs, "--untrusted", v)
-	}
-	cmdArgs = append(cmdArgs, "--json")
-	return cmdArgs
-}
+var buildTdDedupeArgs = specBuilder([]string{"td-dedupe"},
+	mcputil.Arg("streams", "--streams", mcputil.ArgNonEmpty),
+	mcputil.Arg("source_tags", "--source-tags", mcputil.ArgNonEmpty),
+	mcputil.Arg("tolerance", "--tolerance", mcputil.ArgInt),
+	mcputil.Arg("untrusted", "--untrusted", mcputil.ArgNonEmpty),
+	mcputil.Arg("", "--json", mcputil.ArgAlways),
+)
 
 func buildTDValidateArgs(args map[string]interface{}) []string {
 	cmdArgs := []string{"td-validate"}
@@ -1999,56 +1678,29 @@ func buildTDValidateArgs(args map[string]interface{}) []string {
 	return cmdArgs
 }
 
-func buildDiscoveryValidateArgs(args map[string]interface{}) []string {
-	cmdArgs := []string{"discovery-validate"}
-	if v, ok := args["path"].(string); ok && v != "" {
-		cmdArgs = append(cmdArgs, "--path", v)
-	}
-	if v, ok := args["root"].(string); ok && v != "" {
-		cmdArgs = append(cmdArgs, "--root", v)
-	}
-	if v, ok := args["write"].(bool); ok && v {
-		cmdArgs = append(cmdArgs, "--write")
-	}
-	cmdArgs = append(cmdArgs, "--json", "--min")
-	return cmdArgs
-}
+var buildDiscoveryValidateArgs = specBuilder([]string{"discovery-validate"},
+	mcputil.Arg("path", "--path", mcputil.ArgNonEmpty),
+	mcputil.Arg("root", "--root", mcputil.ArgNonEmpty),
+	mcputil.Arg("write", "--write", mcputil.ArgBool),
+	mcputil.Arg("", "--json", mcputil.ArgAlways),
+	mcputil.Arg("", "--min", mcputil.ArgAlways),
+)
 
-func buildDiffSmellArgs(args map[string]interface{}) []string {
-	cmdArgs := []string{"diff-smell"}
-	if v, ok := args["diff"].(string); ok && v != "" {
-		cmdArgs = append(cmdArgs, "--diff", v)
-	}
-	if v, ok := args["repo"].(string); ok && v != "" {
-		cmdArgs = append(cmdArgs, "--repo", v)
-	}
-	if v, ok := args["rev"].(string); ok && v != "" {
-		cmdArgs = append(cmdArgs, "--rev", v)
-	}
-	cmdArgs = append(cmdArgs, "--json")
-	return cmdArgs
-}
+var buildDiffSmellArgs = specBuilder([]string{"diff-smell"},
+	mcputil.Arg("diff", "--diff", mcputil.ArgNonEmpty),
+	mcputil.Arg("repo", "--repo", mcputil.ArgNonEmpty),
+	mcputil.Arg("rev", "--rev", mcputil.ArgNonEmpty),
+	mcputil.Arg("", "--json", mcputil.ArgAlways),
+)
 
-func buildKnowledgeAuditArgs(args map[string]interface{}) []string {
-	cmdArgs := []string{"knowledge-audit"}
-	if v, ok := args["dir"].(string); ok && v != "" {
-		cmdArgs = append(cmdArgs, "--dir", v)
-	}
-	if v, ok := args["repair_schema"].(bool); ok && v {
-		cmdArgs = append(cmdArgs, "--repair-schema")
-	}
-	cmdArgs = append(cmdArgs, "--json")
-	return cmdArgs
-}
+var buildKnowledgeAuditArgs = specBuilder([]string{"knowledge-audit"},
+	mcputil.Arg("dir", "--dir", mcputil.ArgNonEmpty),
+	mcputil.Arg("repair_schema", "--repair-schema", mcputil.ArgBool),
+	mcputil.Arg("", "--json", mcputil.ArgAlways),
+)
 
-func buildTierClassifierArgs(args map[string]interface{}) []string {
-	cmdArgs := []string{"tier-classifier"}
-	if v, ok := args["packages"].(string); ok && v != "" {
-		cmdArgs = append(cmdArgs, "--packages", v)
-	}
-	if v, ok := args["config"].(string); ok && v != "" {
-		cmdArgs = append(cmdArgs, "--config", v)
-	}
-	cmdArgs = append(cmdArgs, "--json")
-	return cmdArgs
-}
+var buildTierClassifierArgs = specBuilder([]string{"tier-classifier"},
+	mcputil.Arg("packages", "--packages", mcputil.ArgNonEmpty),
+	mcputil.Arg("config", "--config", mcputil.ArgNonEmpty),
+	mcputil.Arg("", "--json", mcputil.ArgAlways),
+)
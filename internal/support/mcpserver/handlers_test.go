@@ -1,8 +1,16 @@
 package mcpserver
 
 import (
+	"context"
+	"fmt"
+	"os"
+	"path/filepath"
 	"reflect"
+	"runtime"
+	"strings"
+	"sync"
 	"testing"
+	"time"
 )
 
 func TestBuildDiffSmellArgs(t *testing.T) {
@@ -575,6 +583,11 @@ func TestBuildTemplateArgs(t *testing.T) {
 			args: map[string]interface{}{"file": "template.txt", "syntax": "braces"},
 			want: []string{"template", "template.txt", "--syntax", "braces", "--json", "--min"},
 		},
+		{
+			name: "with vars",
+			args: map[string]interface{}{"file": "template.txt", "vars": map[string]interface{}{"count": float64(3)}},
+			want: []string{"template", "template.txt", "--var", "count=3", "--syntax", "brackets", "--json", "--min"},
+		},
 	}
 
 	for _, tt := range tests {
@@ -587,6 +600,28 @@ func TestBuildTemplateArgs(t *testing.T) {
 	}
 }
 
+func TestAppendAssignments(t *testing.T) {
+	vars := map[string]interface{}{"name": "a=b", "n": float64(2.5), "ok": true}
+	got := appendAssignments([]string{"cmd"}, "--var", vars)
+	if len(got) != 7 || got[0] != "cmd" {
+		t.Fatalf("appendAssignments() = %q", got)
+	}
+	want := map[string]bool{"name=a=b": true, "n=2.5": true, "ok=true": true}
+	for i := 1; i < len(got); i += 2 {
+		if got[i] != "--var" || !want[got[i+1]] {
+			t.Errorf("appendAssignments() = %q", got)
+		}
+	}
+}
+
+func TestFormatValueMatchesSprint(t *testing.T) {
+	for _, v := range []interface{}{"text", float64(3), 2.5, 1e21, -0.000001, true, false, 42, nil, []interface{}{"a"}} {
+		if got, want := formatValue(v), fmt.Sprint(v); got != want {
+			t.Errorf("formatValue(%#v) = %q, want %q", v, got, want)
+		}
+	}
+}
+
 func TestBuildDiscoverTestsArgs(t *testing.T) {
 	tests := []struct {
 		name string
@@ -1026,6 +1061,12 @@ func TestNormalizeArgsIntegration(t *testing.T) {
 			args:    map[string]interface{}{"mode": "checkboxes", "target": "/readme.md"},
 			wantArg: "--path",
 		},
+		{
+			name:    "validate_plan with plan_path alias",
+			command: "validate_plan",
+			args:    map[string]interface{}{"plan_path": "/plan"},
+			wantArg: "--path",
+		},
 		{
 			name:    "tree with dir alias",
 			command: "tree",
@@ -1892,3 +1933,109 @@ func TestBuildReviewRangeArgs(t *testing.T) {
 		})
 	}
 }
+
+// fakeBinary points BinaryPath at a shell script for the duration of the test
+func fakeBinary(t *testing.T, script string) {
+	t.Helper()
+	if runtime.GOOS == "windows" {
+		t.Skip("requires a POSIX shell")
+	}
+	path := filepath.Join(t.TempDir(), "llm-support")
+	if err := os.WriteFile(path, []byte("#!/bin/sh\n"+script+"\n"), 0755); err != nil {
+		t.Fatal(err)
+	}
+	orig := BinaryPath
+	BinaryPath = path
+	t.Cleanup(func() { BinaryPath = orig })
+}
+
+func TestExecuteHandlerContextCancelled(t *testing.T) {
+	fakeBinary(t, "sleep 10")
+
+	ctx, cancel := context.WithCancel(context.Background())
+	time.AfterFunc(50*time.Millisecond, cancel)
+
+	start := time.Now()
+	_, err := ExecuteHandlerContext(ctx, ToolPrefix+"repo_root", map[string]interface{}{})
+	if err == nil || !strings.Contains(err.Error(), "cancelled") {
+		t.Fatalf("ExecuteHandlerContext() error = %v, want cancellation", err)
+	}
+	if elapsed := time.Since(start); elapsed > 5*time.Second {
+		t.Errorf("cancellation took %v, command should be killed promptly", elapsed)
+	}
+}
+
+func TestExecuteHandlerCombinesOutput(t *testing.T) {
+	fakeBinary(t, `echo out; echo err >&2; exit 1`)
+
+	output, err := ExecuteHandler(ToolPrefix+"repo_root", map[string]interface{}{})
+	if err != nil {
+		t.Fatalf("ExecuteHandler() error = %v", err)
+	}
+	if output != "out\nerr\n" {
+		t.Errorf("ExecuteHandler() output = %q, want stdout and stderr combined", output)
+	}
+}
+
+func TestExecuteHandlerBoundsConcurrency(t *testing.T) {
+	dir := t.TempDir()
+	lock, overlaps := filepath.Join(dir, "lock"), filepath.Join(dir, "overlaps")
+	fakeBinary(t, "mkdir "+lock+" 2>/dev/null || echo overlap >> "+overlaps+"\nsleep 0.05\nrmdir "+lock+" 2>/dev/null\necho '{}'")
+
+	origSem := commandSem
+	commandSem = make(chan struct{}, 1)
+	defer func() { commandSem = origSem }()
+
+	var wg sync.WaitGroup
+	for i := 0; i < 4; i++ {
+		wg.Add(1)
+		go func() {
+			defer wg.Done()
+			ExecuteHandler(ToolPrefix+"git_context", map[string]interface{}{})
+		}()
+	}
+	wg.Wait()
+
+	if _, err := os.Stat(overlaps); err == nil {
+		t.Error("commands overlapped, expected at most 1 running at once")
+	}
+}
+
+func TestExecuteHandlerCancelledWhileWaiting(t *testing.T) {
+	fakeBinary(t, "echo '{}'")
+
+	origSem := commandSem
+	commandSem = make(chan struct{}, 1)
+	commandSem <- struct{}{}
+	defer func() { commandSem = origSem }()
+
+	ctx, cancel := context.WithCancel(context.Background())
+	time.AfterFunc(50*time.Millisecond, cancel)
+
+	_, err := ExecuteHandlerContext(ctx, ToolPrefix+"git_context", map[string]interface{}{})
+	if err == nil || !strings.Contains(err.Error(), "cancelled") {
+		t.Fatalf("ExecuteHandlerContext() error = %v, want cancellation while waiting for a slot", err)
+	}
+}
+
+func TestExecuteHandlerLLMCommandsUseSeparatePool(t *testing.T) {
+	fakeBinary(t, "echo '{}'")
+
+	origSem, origLLM := commandSem, llmSem
+	commandSem, llmSem = make(chan struct{}, 1), make(chan struct{}, 1)
+	defer func() { commandSem, llmSem = origSem, origLLM }()
+
+	// A long-running completion holds the only LLM slot
+	llmSem <- struct{}{}
+
+	if _, err := ExecuteHandler(ToolPrefix+"git_context", map[string]interface{}{}); err != nil {
+		t.Fatalf("filesystem tool blocked by LLM command: %v", err)
+	}
+
+	ctx, cancel := context.WithTimeout(context.Background(), 50*time.Millisecond)
+	defer cancel()
+	_, err := ExecuteHandlerContext(ctx, ToolPrefix+"complete", map[string]interface{}{"prompt": "hi"})
+	if err == nil || !strings.Contains(err.Error(), "cancelled") {
+		t.Fatalf("ExecuteHandlerContext() error = %v, want to wait for an LLM slot", err)
+	}
+}
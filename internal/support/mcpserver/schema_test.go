@@ -0,0 +1,61 @@
+package mcpserver
+
+import (
+	"strings"
+	"testing"
+)
+
+func TestValidateArgs(t *testing.T) {
+	tests := []struct {
+		name    string
+		cmd     string
+		args    map[string]interface{}
+		wantErr string
+	}{
+		{"valid", "tree", map[string]interface{}{"path": ".", "depth": float64(2)}, ""},
+		{"missing required", "json_query", map[string]interface{}{"file": "a.json"}, `missing required argument "query"`},
+		{"required via alias", "validate_plan", map[string]interface{}{"directory": "plan/"}, ""},
+		{"canonical name is not an alias", "deps", map[string]interface{}{"path": "go.mod"}, `missing required argument "manifest"`},
+		{"path does not stand in for file", "json_query", map[string]interface{}{"path": "a.json", "query": ".a"}, `missing required argument "file"`},
+		{"wrong string type", "tree", map[string]interface{}{"path": float64(1)}, `"path" must be of type string`},
+		{"fractional integer", "tree", map[string]interface{}{"depth": 1.5}, `"depth" must be of type integer`},
+		{"wrong boolean type", "tree", map[string]interface{}{"sizes": "yes"}, `"sizes" must be of type boolean`},
+		{"wrong array type", "multiexists", map[string]interface{}{"paths": "a.txt"}, `"paths" must be of type array`},
+		{"undeclared key ignored", "tree", map[string]interface{}{"extra": 1}, ""},
+		{"unknown command", "nonexistent", map[string]interface{}{}, ""},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			err := validateArgs(tt.cmd, tt.args)
+			if tt.wantErr == "" {
+				if err != nil {
+					t.Errorf("validateArgs() error = %v", err)
+				}
+				return
+			}
+			if err == nil || !strings.Contains(err.Error(), tt.wantErr) {
+				t.Errorf("validateArgs() error = %v, want %q", err, tt.wantErr)
+			}
+		})
+	}
+}
+
+func TestCompileValidatorsCoversTools(t *testing.T) {
+	for _, def := range GetToolDefinitions() {
+		if _, ok := argValidators[strings.TrimPrefix(def.Name, ToolPrefix)]; !ok {
+			t.Errorf("no validator compiled for %s", def.Name)
+		}
+	}
+}
+
+func TestExecuteHandlerRejectsInvalidArgsWithoutRunning(t *testing.T) {
+	runs := countingBinary(t, `{}`, 0)
+
+	if _, err := ExecuteHandler(ToolPrefix+"json_query", map[string]interface{}{"file": "a.json"}); err == nil {
+		t.Error("expected error for missing query")
+	}
+	if n := runs(); n != 0 {
+		t.Error("command should not run when arguments are invalid")
+	}
+}
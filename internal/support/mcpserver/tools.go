@@ -14,1835 +14,1839 @@ type ToolDefinition struct {
 	InputSchema json.RawMessage
 }
 
-// GetToolDefinitions returns tool definitions for the official MCP SDK
+// GetToolDefinitions returns tool definitions for the official MCP SDK.
+// The definitions are built once; the returned slice is shared and must not be modified.
 func GetToolDefinitions() []ToolDefinition {
-	return []ToolDefinition{
-		// 1. Directory tree structure
-		{
-			Name:        ToolPrefix + "tree",
-			Description: "Display directory structure as a tree. Respects .gitignore. Use max_entries to limit output.",
-			InputSchema: json.RawMessage(`{
-						"type": "object",
-						"properties": {
-							"path": {
+	return toolDefinitions
+}
+
+// toolDefinitions holds every tool definition, built once at package initialization
+var toolDefinitions = []ToolDefinition{
+	// 1. Directory tree structure
+	{
+		Name:        ToolPrefix + "tree",
+		Description: "Display directory structure as a tree. Respects .gitignore. Use max_entries to limit output.",
+		InputSchema: json.RawMessage(`{
+					"type": "object",
+					"properties": {
+						"path": {
+							"type": "string"
+						},
+						"depth": {
+							"type": "integer",
+							"description": "Maximum depth to display"
+						},
+						"max_entries": {
+							"type": "integer",
+							"description": "Maximum entries to display (default: 500, 0 = unlimited)"
+						},
+						"sizes": {
+							"type": "boolean"
+						},
+						"exclude": {
+							"type": "array",
+							"items": {
 								"type": "string"
 							},
-							"depth": {
-								"type": "integer",
-								"description": "Maximum depth to display"
-							},
-							"max_entries": {
-								"type": "integer",
-								"description": "Maximum entries to display (default: 500, 0 = unlimited)"
-							},
-							"sizes": {
-								"type": "boolean"
-							},
-							"exclude": {
-								"type": "array",
-								"items": {
-									"type": "string"
-								},
-								"description": "Regex patterns to exclude (e.g., [\"test\", \"fixtures\"])"
-							},
-							"no_gitignore": {
-								"type": "boolean",
-								"description": "Disable .gitignore filtering"
-							},
-							"no_default_excludes": {
-								"type": "boolean",
-								"description": "Disable default excludes (node_modules, vendor, target, etc.)"
-							}
+							"description": "Regex patterns to exclude (e.g., [\"test\", \"fixtures\"])"
+						},
+						"no_gitignore": {
+							"type": "boolean",
+							"description": "Disable .gitignore filtering"
+						},
+						"no_default_excludes": {
+							"type": "boolean",
+							"description": "Disable default excludes (node_modules, vendor, target, etc.)"
 						}
-					}`),
-		},
-
-		// 2. Pattern search
-		{
-			Name:        ToolPrefix + "grep",
-			Description: "Search for regex pattern in files. Supports case-insensitive search and line numbers.",
-			InputSchema: json.RawMessage(`{
-						"type": "object",
-						"properties": {
-							"pattern": {
+					}
+				}`),
+	},
+
+	// 2. Pattern search
+	{
+		Name:        ToolPrefix + "grep",
+		Description: "Search for regex pattern in files. Supports case-insensitive search and line numbers.",
+		InputSchema: json.RawMessage(`{
+					"type": "object",
+					"properties": {
+						"pattern": {
+							"type": "string"
+						},
+						"paths": {
+							"type": "array",
+							"items": {
 								"type": "string"
-							},
-							"paths": {
-								"type": "array",
-								"items": {
-									"type": "string"
-								}
-							},
-							"ignore_case": {
-								"type": "boolean"
-							},
-							"line_numbers": {
-								"type": "boolean"
-							},
-							"files_only": {
-								"type": "boolean"
 							}
 						},
-						"required": ["pattern", "paths"]
-					}`),
-		},
-
-		// 3. Multi-file existence check
-		{
-			Name:        ToolPrefix + "multiexists",
-			Description: "Check if multiple files or directories exist. Returns detailed status for each path.",
-			InputSchema: json.RawMessage(`{
-						"type": "object",
-						"properties": {
-							"paths": {
-								"type": "array",
-								"items": {
-									"type": "string"
-								}
-							},
-							"verbose": {
-								"type": "boolean"
-							}
+						"ignore_case": {
+							"type": "boolean"
 						},
-						"required": ["paths"]
-					}`),
-		},
-
-		// 4. JSON query
-		{
-			Name:        ToolPrefix + "json_query",
-			Description: "Query JSON file with dot notation (e.g., '.users[0].name').",
-			InputSchema: json.RawMessage(`{
-						"type": "object",
-						"properties": {
-							"file": {
-								"type": "string"
-							},
-							"query": {
-								"type": "string",
-								"description": "Query (e.g., .users[0].name)"
-							}
+						"line_numbers": {
+							"type": "boolean"
 						},
-						"required": ["file", "query"]
-					}`),
-		},
-
-		// 5. Markdown headers extraction
-		{
-			Name:        ToolPrefix + "markdown_headers",
-			Description: "Extract headers from markdown file. Can filter by header level.",
-			InputSchema: json.RawMessage(`{
-						"type": "object",
-						"properties": {
-							"file": {
+						"files_only": {
+							"type": "boolean"
+						}
+					},
+					"required": ["pattern", "paths"]
+				}`),
+	},
+
+	// 3. Multi-file existence check
+	{
+		Name:        ToolPrefix + "multiexists",
+		Description: "Check if multiple files or directories exist. Returns detailed status for each path.",
+		InputSchema: json.RawMessage(`{
+					"type": "object",
+					"properties": {
+						"paths": {
+							"type": "array",
+							"items": {
 								"type": "string"
-							},
-							"level": {
-								"type": "string",
-								"description": "Level filter (e.g., 2,3)"
-							},
-							"plain": {
-								"type": "boolean",
-								"description": "Plain text output"
 							}
 						},
-						"required": ["file"]
-					}`),
-		},
-
-		// 6. Template substitution
-		{
-			Name:        ToolPrefix + "template",
-			Description: "Variable substitution in template files. Supports [[var]] or {{var}} syntax.",
-			InputSchema: json.RawMessage(`{
-						"type": "object",
-						"properties": {
-							"file": {
-								"type": "string"
-							},
-							"vars": {
-								"type": "object"
-							},
-							"syntax": {
-								"type": "string",
-								"enum": ["brackets", "braces"],
-								"description": "brackets or braces"
-							}
+						"verbose": {
+							"type": "boolean"
+						}
+					},
+					"required": ["paths"]
+				}`),
+	},
+
+	// 4. JSON query
+	{
+		Name:        ToolPrefix + "json_query",
+		Description: "Query JSON file with dot notation (e.g., '.users[0].name').",
+		InputSchema: json.RawMessage(`{
+					"type": "object",
+					"properties": {
+						"file": {
+							"type": "string"
 						},
-						"required": ["file"]
-					}`),
-		},
-
-		// 7. Discover test infrastructure
-		{
-			Name:        ToolPrefix + "discover_tests",
-			Description: "Discover test patterns, runners, and infrastructure in a project.",
-			InputSchema: json.RawMessage(`{
-						"type": "object",
-						"properties": {
-							"path": {
-								"type": "string"
-							}
+						"query": {
+							"type": "string",
+							"description": "Query (e.g., .users[0].name)"
 						}
-					}`),
-		},
-
-		// 8. Multi-keyword search
-		{
-			Name:        ToolPrefix + "multigrep",
-			Description: "Search multiple keywords in parallel. Prioritizes definitions over usages.",
-			InputSchema: json.RawMessage(`{
-						"type": "object",
-						"properties": {
-							"keywords": {
-								"type": "string"
-							},
-							"path": {
-								"type": "string",
-								"description": "Path to search (default: current directory)"
-							},
-							"extensions": {
-								"type": "string",
-								"description": "Comma-separated file extensions (e.g., 'ts,tsx,js')"
-							},
-							"max_per_keyword": {
-								"type": "integer",
-								"description": "Max matches per keyword (default: 20)"
-							},
-							"ignore_case": {
-								"type": "boolean"
-							},
-							"definitions_only": {
-								"type": "boolean",
-								"description": "Only show definition matches"
-							},
-							"output_dir": {
-								"type": "string",
-								"description": "Write per-keyword results to directory"
-							}
+					},
+					"required": ["file", "query"]
+				}`),
+	},
+
+	// 5. Markdown headers extraction
+	{
+		Name:        ToolPrefix + "markdown_headers",
+		Description: "Extract headers from markdown file. Can filter by header level.",
+		InputSchema: json.RawMessage(`{
+					"type": "object",
+					"properties": {
+						"file": {
+							"type": "string"
 						},
-						"required": ["keywords"]
-					}`),
-		},
-
-		// 9. File dependency analysis
-		{
-			Name:        ToolPrefix + "analyze_deps",
-			Description: "Analyze file dependencies from a markdown task file.",
-			InputSchema: json.RawMessage(`{
-						"type": "object",
-						"properties": {
-							"file": {
-								"type": "string"
-							}
+						"level": {
+							"type": "string",
+							"description": "Level filter (e.g., 2,3)"
 						},
-						"required": ["file"]
-					}`),
-		},
-
-		// 10. Project detection
-		{
-			Name:        ToolPrefix + "detect",
-			Description: "Detect project type and technology stack.",
-			InputSchema: json.RawMessage(`{
-						"type": "object",
-						"properties": {
-							"path": {
-								"type": "string",
-								"description": "Project path to analyze"
-							},
-							"dirs": {
-								"type": "string",
-								"description": "Subdirs for per-component detection (e.g., backend,frontend)"
-							}
+						"plain": {
+							"type": "boolean",
+							"description": "Plain text output"
 						}
-					}`),
-		},
-
-		// 11. Count items
-		{
-			Name:        ToolPrefix + "count",
-			Description: "Count checkboxes, lines, or files. For checkboxes: returns TOTAL, CHECKED, UNCHECKED, COMPLETION%.",
-			InputSchema: json.RawMessage(`{
-						"type": "object",
-						"properties": {
-							"mode": {
-								"type": "string",
-								"enum": ["checkboxes", "lines", "files"],
-								"description": "What to count"
-							},
-							"path": {
-								"type": "string",
-								"description": "File or directory to analyze"
-							},
-							"recursive": {
-								"type": "boolean"
-							},
-							"pattern": {
-								"type": "string",
-								"description": "Glob pattern (for files mode)"
-							}
+					},
+					"required": ["file"]
+				}`),
+	},
+
+	// 6. Template substitution
+	{
+		Name:        ToolPrefix + "template",
+		Description: "Variable substitution in template files. Supports [[var]] or {{var}} syntax.",
+		InputSchema: json.RawMessage(`{
+					"type": "object",
+					"properties": {
+						"file": {
+							"type": "string"
 						},
-						"required": ["mode", "path"]
-					}`),
-		},
-
-		// 12. Summarize directory
-		{
-			Name:        ToolPrefix + "summarize_dir",
-			Description: "Summarize directory contents for LLM context.",
-			InputSchema: json.RawMessage(`{
-						"type": "object",
-						"properties": {
-							"path": {
-								"type": "string"
-							},
-							"format": {
-								"type": "string",
-								"enum": ["outline", "headers", "frontmatter", "first-lines"]
-							},
-							"recursive": {
-								"type": "boolean"
-							},
-							"glob": {
-								"type": "string",
-								"description": "Glob pattern for files"
-							},
-							"max_tokens": {
-								"type": "integer",
-								"description": "Maximum tokens in output"
-							}
+						"vars": {
+							"type": "object"
 						},
-						"required": ["path"]
-					}`),
-		},
-
-		// 13. Extract dependencies from package manifests
-		{
-			Name:        ToolPrefix + "deps",
-			Description: "Extract dependencies from package manifests (package.json, go.mod, Cargo.toml, etc.).",
-			InputSchema: json.RawMessage(`{
-						"type": "object",
-						"properties": {
-							"manifest": {
-								"type": "string"
-							},
-							"type": {
-								"type": "string",
-								"enum": ["all", "prod", "dev"],
-								"description": "Dependency type to extract (default: all)"
-							}
+						"syntax": {
+							"type": "string",
+							"enum": ["brackets", "braces"],
+							"description": "brackets or braces"
+						}
+					},
+					"required": ["file"]
+				}`),
+	},
+
+	// 7. Discover test infrastructure
+	{
+		Name:        ToolPrefix + "discover_tests",
+		Description: "Discover test patterns, runners, and infrastructure in a project.",
+		InputSchema: json.RawMessage(`{
+					"type": "object",
+					"properties": {
+						"path": {
+							"type": "string"
+						}
+					}
+				}`),
+	},
+
+	// 8. Multi-keyword search
+	{
+		Name:        ToolPrefix + "multigrep",
+		Description: "Search multiple keywords in parallel. Prioritizes definitions over usages.",
+		InputSchema: json.RawMessage(`{
+					"type": "object",
+					"properties": {
+						"keywords": {
+							"type": "string"
 						},
-						"required": ["manifest"]
-					}`),
-		},
-
-		// 14. Git context gathering
-		{
-			Name:        ToolPrefix + "git_context",
-			Description: "Gather git information for LLM context.",
-			InputSchema: json.RawMessage(`{
-						"type": "object",
-						"properties": {
-							"path": {
-								"type": "string"
-							},
-							"include_diff": {
-								"type": "boolean",
-								"description": "Include diff statistics"
-							},
-							"since": {
-								"type": "string",
-								"description": "Only include commits since this date"
-							},
-							"max_commits": {
-								"type": "integer",
-								"description": "Maximum commits to show (default: 10)"
-							}
+						"path": {
+							"type": "string",
+							"description": "Path to search (default: current directory)"
+						},
+						"extensions": {
+							"type": "string",
+							"description": "Comma-separated file extensions (e.g., 'ts,tsx,js')"
+						},
+						"max_per_keyword": {
+							"type": "integer",
+							"description": "Max matches per keyword (default: 20)"
+						},
+						"ignore_case": {
+							"type": "boolean"
+						},
+						"definitions_only": {
+							"type": "boolean",
+							"description": "Only show definition matches"
+						},
+						"output_dir": {
+							"type": "string",
+							"description": "Write per-keyword results to directory"
 						}
-					}`),
-		},
-
-		// 15. Validate plan structure
-		{
-			Name:        ToolPrefix + "validate_plan",
-			Description: "Validate plan directory structure.",
-			InputSchema: json.RawMessage(`{
-						"type": "object",
-						"properties": {
-							"path": {
-								"type": "string"
-							}
+					},
+					"required": ["keywords"]
+				}`),
+	},
+
+	// 9. File dependency analysis
+	{
+		Name:        ToolPrefix + "analyze_deps",
+		Description: "Analyze file dependencies from a markdown task file.",
+		InputSchema: json.RawMessage(`{
+					"type": "object",
+					"properties": {
+						"file": {
+							"type": "string"
+						}
+					},
+					"required": ["file"]
+				}`),
+	},
+
+	// 10. Project detection
+	{
+		Name:        ToolPrefix + "detect",
+		Description: "Detect project type and technology stack.",
+		InputSchema: json.RawMessage(`{
+					"type": "object",
+					"properties": {
+						"path": {
+							"type": "string",
+							"description": "Project path to analyze"
 						},
-						"required": ["path"]
-					}`),
-		},
-
-		// 16. Partition work for parallel execution
-		{
-			Name:        ToolPrefix + "partition_work",
-			Description: "Partition work items into parallel execution groups using graph coloring.",
-			InputSchema: json.RawMessage(`{
-						"type": "object",
-						"properties": {
-							"stories": {
-								"type": "string"
-							},
-							"tasks": {
-								"type": "string"
-							},
-							"verbose": {
-								"type": "boolean"
-							}
+						"dirs": {
+							"type": "string",
+							"description": "Subdirs for per-component detection (e.g., backend,frontend)"
 						}
-					}`),
-		},
-
-		// 17. Repository root detection
-		{
-			Name:        ToolPrefix + "repo_root",
-			Description: "Find git repository root for a path.",
-			InputSchema: json.RawMessage(`{
-						"type": "object",
-						"properties": {
-							"path": {
-								"type": "string"
-							},
-							"validate": {
-								"type": "boolean"
-							}
+					}
+				}`),
+	},
+
+	// 11. Count items
+	{
+		Name:        ToolPrefix + "count",
+		Description: "Count checkboxes, lines, or files. For checkboxes: returns TOTAL, CHECKED, UNCHECKED, COMPLETION%.",
+		InputSchema: json.RawMessage(`{
+					"type": "object",
+					"properties": {
+						"mode": {
+							"type": "string",
+							"enum": ["checkboxes", "lines", "files"],
+							"description": "What to count"
+						},
+						"path": {
+							"type": "string",
+							"description": "File or directory to analyze"
+						},
+						"recursive": {
+							"type": "boolean"
+						},
+						"pattern": {
+							"type": "string",
+							"description": "Glob pattern (for files mode)"
 						}
-					}`),
-		},
-
-		// 18. Extract relevant content using LLM
-		{
-			Name:        ToolPrefix + "extract_relevant",
-			Description: "Extract relevant content from files/URLs using LLM. Filters to query-relevant parts.",
-			InputSchema: json.RawMessage(`{
-						"type": "object",
-						"properties": {
-							"path": {
-								"type": "string",
-								"description": "File, directory, or URL"
-							},
-							"context": {
-								"type": "string",
-								"description": "Relevance criteria"
-							},
-							"concurrency": {
-								"type": "integer",
-								"description": "Concurrent API calls (default: 2)"
-							},
-							"output": {
-								"type": "string"
-							},
-							"timeout": {
-								"type": "integer",
-								"description": "Timeout in seconds (default: 60)"
-							}
+					},
+					"required": ["mode", "path"]
+				}`),
+	},
+
+	// 12. Summarize directory
+	{
+		Name:        ToolPrefix + "summarize_dir",
+		Description: "Summarize directory contents for LLM context.",
+		InputSchema: json.RawMessage(`{
+					"type": "object",
+					"properties": {
+						"path": {
+							"type": "string"
 						},
-						"required": ["context"]
-					}`),
-		},
-
-		// 19. Extract links from URL
-		{
-			Name:        ToolPrefix + "extract_links",
-			Description: "Extract and rank links from a URL. Heuristic mode (default) or LLM-ranked (with context).",
-			InputSchema: json.RawMessage(`{
-						"type": "object",
-						"properties": {
-							"url": {
-								"type": "string",
-								"description": "URL"
-							},
-							"context": {
-								"type": "string",
-								"description": "Context for LLM-based ranking (enables LLM mode)"
-							},
-							"timeout": {
-								"type": "integer",
-								"description": "HTTP timeout in seconds (default: 30)"
-							}
+						"format": {
+							"type": "string",
+							"enum": ["outline", "headers", "frontmatter", "first-lines"]
 						},
-						"required": ["url"]
-					}`),
-		},
-
-		// 20. Find highest numbered directory/file
-		{
-			Name:        ToolPrefix + "highest",
-			Description: "Find highest numbered directory or file. Returns HIGHEST, NAME, FULL_PATH, NEXT, COUNT.",
-			InputSchema: json.RawMessage(`{
-						"type": "object",
-						"properties": {
-							"path": {
-								"type": "string",
-								"description": "Directory to search in (default: current directory)"
-							},
-							"paths": {
-								"type": "array",
-								"items": {
-									"type": "string"
-								},
-								"description": "Multiple dirs to search"
-							},
-							"pattern": {
-								"type": "string",
-								"description": "Custom regex for version extraction"
-							},
-							"type": {
-								"type": "string",
-								"enum": ["dir", "file", "both"],
-								"description": "Type to search: dir, file, both (default: both)"
-							},
-							"prefix": {
-								"type": "string",
-								"description": "Prefix filter (e.g., 01-)"
-							}
+						"recursive": {
+							"type": "boolean"
+						},
+						"glob": {
+							"type": "string",
+							"description": "Glob pattern for files"
+						},
+						"max_tokens": {
+							"type": "integer",
+							"description": "Maximum tokens in output"
 						}
-					}`),
-		},
-
-		// 20. Plan type extraction
-		{
-			Name:        ToolPrefix + "plan_type",
-			Description: "Extract plan type from planning metadata.",
-			InputSchema: json.RawMessage(`{
-						"type": "object",
-						"properties": {
-							"path": {
-								"type": "string",
-								"description": "Plan directory path (default: current directory)"
-							}
+					},
+					"required": ["path"]
+				}`),
+	},
+
+	// 13. Extract dependencies from package manifests
+	{
+		Name:        ToolPrefix + "deps",
+		Description: "Extract dependencies from package manifests (package.json, go.mod, Cargo.toml, etc.).",
+		InputSchema: json.RawMessage(`{
+					"type": "object",
+					"properties": {
+						"manifest": {
+							"type": "string"
+						},
+						"type": {
+							"type": "string",
+							"enum": ["all", "prod", "dev"],
+							"description": "Dependency type to extract (default: all)"
 						}
-					}`),
-		},
-
-		// 21. Git changes detection
-		{
-			Name:        ToolPrefix + "git_changes",
-			Description: "Count and list git working tree changes with optional path filtering.",
-			InputSchema: json.RawMessage(`{
-						"type": "object",
-						"properties": {
-							"path": {
-								"type": "string",
-								"description": "Path prefix filter"
-							},
-							"include_untracked": {
-								"type": "boolean",
-								"description": "Include untracked files (default: true)"
-							},
-							"staged_only": {
-								"type": "boolean",
-								"description": "Only show staged changes"
-							}
+					},
+					"required": ["manifest"]
+				}`),
+	},
+
+	// 14. Git context gathering
+	{
+		Name:        ToolPrefix + "git_context",
+		Description: "Gather git information for LLM context.",
+		InputSchema: json.RawMessage(`{
+					"type": "object",
+					"properties": {
+						"path": {
+							"type": "string"
+						},
+						"include_diff": {
+							"type": "boolean",
+							"description": "Include diff statistics"
+						},
+						"since": {
+							"type": "string",
+							"description": "Only include commits since this date"
+						},
+						"max_commits": {
+							"type": "integer",
+							"description": "Maximum commits to show (default: 10)"
 						}
-					}`),
-		},
-
-		// 22. Context multiset - batch set multiple key-value pairs
-		{
-			Name:        ToolPrefix + "context_multiset",
-			Description: "Set multiple context key-value pairs atomically.",
-			InputSchema: json.RawMessage(`{
-						"type": "object",
-						"properties": {
-							"dir": {
-								"type": "string",
-								"description": "Dir with context.env"
-							},
-							"pairs": {
-								"type": "object"
-							}
+					}
+				}`),
+	},
+
+	// 15. Validate plan structure
+	{
+		Name:        ToolPrefix + "validate_plan",
+		Description: "Validate plan directory structure.",
+		InputSchema: json.RawMessage(`{
+					"type": "object",
+					"properties": {
+						"path": {
+							"type": "string"
+						}
+					},
+					"required": ["path"]
+				}`),
+	},
+
+	// 16. Partition work for parallel execution
+	{
+		Name:        ToolPrefix + "partition_work",
+		Description: "Partition work items into parallel execution groups using graph coloring.",
+		InputSchema: json.RawMessage(`{
+					"type": "object",
+					"properties": {
+						"stories": {
+							"type": "string"
 						},
-						"required": ["dir", "pairs"]
-					}`),
-		},
-
-		// 23. Context multiget - batch retrieve multiple values
-		{
-			Name:        ToolPrefix + "context_multiget",
-			Description: "Retrieve multiple context values in a single call.",
-			InputSchema: json.RawMessage(`{
-						"type": "object",
-						"properties": {
-							"dir": {
-								"type": "string",
-								"description": "Dir with context.env"
-							},
-							"keys": {
-								"type": "array",
-								"items": {
-									"type": "string"
-								}
-							},
-							"defaults": {
-								"type": "object",
-								"description": "Defaults for missing keys"
-							}
+						"tasks": {
+							"type": "string"
 						},
-						"required": ["dir", "keys"]
-					}`),
-		},
-
-		// 24. Context variable management
-		{
-			Name:        ToolPrefix + "context",
-			Description: "Manage persistent key-value context storage. Supports init/set/get/list/dump/clear.",
-			InputSchema: json.RawMessage(`{
-						"type": "object",
-						"properties": {
-							"operation": {
-								"type": "string",
-								"enum": ["init", "set", "get", "list", "dump", "clear"],
-								"description": "init/set/get/list/dump/clear"
-							},
-							"dir": {
-								"type": "string",
-								"description": "Dir with context.env"
-							},
-							"key": {
-								"type": "string",
-								"description": "Key name"
-							},
-							"value": {
-								"type": "string",
-								"description": "Value"
-							},
-							"default": {
-								"type": "string",
-								"description": "Default if missing"
-							}
+						"verbose": {
+							"type": "boolean"
+						}
+					}
+				}`),
+	},
+
+	// 17. Repository root detection
+	{
+		Name:        ToolPrefix + "repo_root",
+		Description: "Find git repository root for a path.",
+		InputSchema: json.RawMessage(`{
+					"type": "object",
+					"properties": {
+						"path": {
+							"type": "string"
 						},
-						"required": ["operation", "dir"]
-					}`),
-		},
-
-		// 25. YAML get - retrieve value by dot-notation key
-		{
-			Name:        ToolPrefix + "yaml_get",
-			Description: "Retrieve a value from YAML config by dot-notation key.",
-			InputSchema: json.RawMessage(`{
-						"type": "object",
-						"properties": {
-							"file": {
-								"type": "string"
-							},
-							"key": {
-								"type": "string",
-								"description": "Dot-notation key"
-							},
-							"default": {
-								"type": "string",
-								"description": "Default if missing"
-							}
+						"validate": {
+							"type": "boolean"
+						}
+					}
+				}`),
+	},
+
+	// 18. Extract relevant content using LLM
+	{
+		Name:        ToolPrefix + "extract_relevant",
+		Description: "Extract relevant content from files/URLs using LLM. Filters to query-relevant parts.",
+		InputSchema: json.RawMessage(`{
+					"type": "object",
+					"properties": {
+						"path": {
+							"type": "string",
+							"description": "File, directory, or URL"
 						},
-						"required": ["file", "key"]
-					}`),
-		},
-
-		// 26. YAML set - store value at dot-notation key
-		{
-			Name:        ToolPrefix + "yaml_set",
-			Description: "Store a value in YAML config at dot-notation key.",
-			InputSchema: json.RawMessage(`{
-						"type": "object",
-						"properties": {
-							"file": {
-								"type": "string"
-							},
-							"key": {
-								"type": "string",
-								"description": "Dot-notation key"
-							},
-							"value": {
-								"type": "string"
-							},
-							"create": {
-								"type": "boolean",
-								"description": "Create file if it doesn't exist"
-							},
-							"dry_run": {
-								"type": "boolean",
-								"description": "Preview only"
-							},
-							"quiet": {
-								"type": "boolean",
-								"description": "Suppress success messages"
-							}
+						"context": {
+							"type": "string",
+							"description": "Relevance criteria"
 						},
-						"required": ["file", "key", "value"]
-					}`),
-		},
-
-		// 27. YAML multiget - retrieve multiple values
-		{
-			Name:        ToolPrefix + "yaml_multiget",
-			Description: "Retrieve multiple YAML values in a single call.",
-			InputSchema: json.RawMessage(`{
-						"type": "object",
-						"properties": {
-							"file": {
-								"type": "string"
-							},
-							"keys": {
-								"type": "array",
-								"items": {
-									"type": "string"
-								},
-								"description": "Keys (dot-notation)"
-							},
-							"defaults": {
-								"type": "object",
-								"description": "Defaults for keys"
-							},
-							"required_file": {
-								"type": "string",
-								"description": "File with required keys (one per line)"
-							}
+						"concurrency": {
+							"type": "integer",
+							"description": "Concurrent API calls (default: 2)"
 						},
-						"required": ["file"]
-					}`),
-		},
-
-		// 28. YAML multiset - set multiple key-value pairs
-		{
-			Name:        ToolPrefix + "yaml_multiset",
-			Description: "Set multiple YAML key-value pairs atomically.",
-			InputSchema: json.RawMessage(`{
-						"type": "object",
-						"properties": {
-							"file": {
-								"type": "string"
-							},
-							"pairs": {
-								"type": "object",
-								"description": "Key-value pairs"
-							},
-							"create": {
-								"type": "boolean",
-								"description": "Create file if it doesn't exist"
-							},
-							"dry_run": {
-								"type": "boolean",
-								"description": "Preview only"
-							},
-							"quiet": {
-								"type": "boolean",
-								"description": "Suppress success messages"
-							}
+						"output": {
+							"type": "string"
 						},
-						"required": ["file", "pairs"]
-					}`),
-		},
-
-		// 29. Parse arguments into structured format
-		{
-			Name:        ToolPrefix + "args",
-			Description: "Parse command-line arguments into structured format.",
-			InputSchema: json.RawMessage(`{
-						"type": "object",
-						"properties": {
-							"arguments": {
-								"type": "array",
-								"items": {
-									"type": "string"
-								}
-							}
+						"timeout": {
+							"type": "integer",
+							"description": "Timeout in seconds (default: 60)"
+						}
+					},
+					"required": ["context"]
+				}`),
+	},
+
+	// 19. Extract links from URL
+	{
+		Name:        ToolPrefix + "extract_links",
+		Description: "Extract and rank links from a URL. Heuristic mode (default) or LLM-ranked (with context).",
+		InputSchema: json.RawMessage(`{
+					"type": "object",
+					"properties": {
+						"url": {
+							"type": "string",
+							"description": "URL"
 						},
-						"required": ["arguments"]
-					}`),
-		},
-
-		// 30. Concatenate files with headers
-		{
-			Name:        ToolPrefix + "catfiles",
-			Description: "Concatenate multiple files with path headers. Respects .gitignore.",
-			InputSchema: json.RawMessage(`{
-						"type": "object",
-						"properties": {
-							"paths": {
-								"type": "array",
-								"items": {
-									"type": "string"
-								}
-							},
-							"max_size": {
-								"type": "integer",
-								"description": "Max size in MB (default: 10)"
-							},
-							"no_gitignore": {
-								"type": "boolean",
-								"description": "Disable .gitignore filtering"
-							}
+						"context": {
+							"type": "string",
+							"description": "Context for LLM-based ranking (enables LLM mode)"
 						},
-						"required": ["paths"]
-					}`),
-		},
-
-		// 31. Decode text
-		{
-			Name:        ToolPrefix + "decode",
-			Description: "Decode text using base64, base32, hex, or URL encoding.",
-			InputSchema: json.RawMessage(`{
-						"type": "object",
-						"properties": {
-							"text": {
-								"type": "string"
-							},
-							"encoding": {
-								"type": "string",
-								"enum": ["base64", "base32", "hex", "url"],
-								"description": "Encoding type (default: base64)"
-							}
+						"timeout": {
+							"type": "integer",
+							"description": "HTTP timeout in seconds (default: 30)"
+						}
+					},
+					"required": ["url"]
+				}`),
+	},
+
+	// 20. Find highest numbered directory/file
+	{
+		Name:        ToolPrefix + "highest",
+		Description: "Find highest numbered directory or file. Returns HIGHEST, NAME, FULL_PATH, NEXT, COUNT.",
+		InputSchema: json.RawMessage(`{
+					"type": "object",
+					"properties": {
+						"path": {
+							"type": "string",
+							"description": "Directory to search in (default: current directory)"
 						},
-						"required": ["text"]
-					}`),
-		},
-
-		// 32. Compare files
-		{
-			Name:        ToolPrefix + "diff",
-			Description: "Compare two files and show the differences.",
-			InputSchema: json.RawMessage(`{
-						"type": "object",
-						"properties": {
-							"file1": {
+						"paths": {
+							"type": "array",
+							"items": {
 								"type": "string"
 							},
-							"file2": {
-								"type": "string"
-							},
-							"unified": {
-								"type": "boolean",
-								"description": "Use unified diff format"
-							}
+							"description": "Multiple dirs to search"
 						},
-						"required": ["file1", "file2"]
-					}`),
-		},
-
-		// 33. Encode text
-		{
-			Name:        ToolPrefix + "encode",
-			Description: "Encode text using base64, base32, hex, or URL encoding.",
-			InputSchema: json.RawMessage(`{
-						"type": "object",
-						"properties": {
-							"text": {
-								"type": "string"
-							},
-							"encoding": {
-								"type": "string",
-								"enum": ["base64", "base32", "hex", "url"],
-								"description": "Encoding type (default: base64)"
-							}
+						"pattern": {
+							"type": "string",
+							"description": "Custom regex for version extraction"
 						},
-						"required": ["text"]
-					}`),
-		},
-
-		// 34. Extract patterns from text
-		{
-			Name:        ToolPrefix + "extract",
-			Description: "Extract patterns from text files. Types: urls, paths, variables, todos, emails, ips.",
-			InputSchema: json.RawMessage(`{
-						"type": "object",
-						"properties": {
-							"type": {
-								"type": "string",
-								"enum": ["urls", "paths", "variables", "todos", "emails", "ips"],
-								"description": "Type of pattern to extract"
-							},
-							"file": {
-								"type": "string"
-							},
-							"count": {
-								"type": "boolean"
-							},
-							"unique": {
-								"type": "boolean",
-								"description": "Remove duplicates"
-							}
+						"type": {
+							"type": "string",
+							"enum": ["dir", "file", "both"],
+							"description": "Type to search: dir, file, both (default: both)"
 						},
-						"required": ["type", "file"]
-					}`),
-		},
-
-		// 35. Batch process files with LLM
-		{
-			Name:        ToolPrefix + "foreach",
-			Description: "Process multiple files through an LLM using a template with [[var]] placeholders.",
-			InputSchema: json.RawMessage(`{
-						"type": "object",
-						"properties": {
-							"files": {
-								"type": "array",
-								"items": {
-									"type": "string"
-								}
-							},
-							"glob": {
-								"type": "string",
-								"description": "Glob pattern (alternative to files)"
-							},
-							"template": {
-								"type": "string",
-								"description": "Template file with [[var]] vars"
-							},
-							"llm": {
-								"type": "string",
-								"description": "LLM binary (default: gemini)"
-							},
-							"output_dir": {
-								"type": "string",
-								"description": "Output directory for processed files"
-							},
-							"output_pattern": {
-								"type": "string",
-								"description": "Output pattern (e.g., {{name}}-out.md)"
-							},
-							"parallel": {
-								"type": "integer",
-								"description": "Parallel count (default: 1)"
-							},
-							"skip_existing": {
-								"type": "boolean",
-								"description": "Skip existing"
-							},
-							"timeout": {
-								"type": "integer",
-								"description": "Timeout per file (default: 120s)"
-							},
-							"vars": {
-								"type": "object",
-								"description": "Template vars"
-							}
+						"prefix": {
+							"type": "string",
+							"description": "Prefix filter (e.g., 01-)"
+						}
+					}
+				}`),
+	},
+
+	// 20. Plan type extraction
+	{
+		Name:        ToolPrefix + "plan_type",
+		Description: "Extract plan type from planning metadata.",
+		InputSchema: json.RawMessage(`{
+					"type": "object",
+					"properties": {
+						"path": {
+							"type": "string",
+							"description": "Plan directory path (default: current directory)"
+						}
+					}
+				}`),
+	},
+
+	// 21. Git changes detection
+	{
+		Name:        ToolPrefix + "git_changes",
+		Description: "Count and list git working tree changes with optional path filtering.",
+		InputSchema: json.RawMessage(`{
+					"type": "object",
+					"properties": {
+						"path": {
+							"type": "string",
+							"description": "Path prefix filter"
 						},
-						"required": ["template"]
-					}`),
-		},
-
-		// 36. Generate hash checksums
-		{
-			Name:        ToolPrefix + "hash",
-			Description: "Generate hash checksums for files. Algorithms: md5, sha1, sha256 (default), sha512.",
-			InputSchema: json.RawMessage(`{
-						"type": "object",
-						"properties": {
-							"paths": {
-								"type": "array",
-								"items": {
-									"type": "string"
-								}
-							},
-							"algorithm": {
-								"type": "string",
-								"enum": ["md5", "sha1", "sha256", "sha512"],
-								"description": "Hash algorithm (default: sha256)"
-							}
+						"include_untracked": {
+							"type": "boolean",
+							"description": "Include untracked files (default: true)"
 						},
-						"required": ["paths"]
-					}`),
-		},
-
-		// 37. Initialize temp directory
-		{
-			Name:        ToolPrefix + "init_temp",
-			Description: "Initialize temp directory at .planning/.temp/{name}/.",
-			InputSchema: json.RawMessage(`{
-						"type": "object",
-						"properties": {
-							"name": {
-								"type": "string"
-							},
-							"clean": {
-								"type": "boolean",
-								"description": "Remove existing files (default: true)"
-							},
-							"preserve": {
-								"type": "boolean",
-								"description": "Keep existing files"
-							},
-							"with_git": {
-								"type": "boolean",
-								"description": "Include git info"
-							},
-							"skip_context": {
-								"type": "boolean",
-								"description": "Don't create context.env file"
-							}
+						"staged_only": {
+							"type": "boolean",
+							"description": "Only show staged changes"
+						}
+					}
+				}`),
+	},
+
+	// 22. Context multiset - batch set multiple key-value pairs
+	{
+		Name:        ToolPrefix + "context_multiset",
+		Description: "Set multiple context key-value pairs atomically.",
+		InputSchema: json.RawMessage(`{
+					"type": "object",
+					"properties": {
+						"dir": {
+							"type": "string",
+							"description": "Dir with context.env"
 						},
-						"required": ["name"]
-					}`),
-		},
-
-		// 38. Clean temp directory
-		{
-			Name:        ToolPrefix + "clean_temp",
-			Description: "Clean up temp directories created by init_temp.",
-			InputSchema: json.RawMessage(`{
-						"type": "object",
-						"properties": {
-							"name": {
-								"type": "string"
-							},
-							"all": {
-								"type": "boolean",
-								"description": "Remove all temp directories"
-							},
-							"older_than": {
-								"type": "string",
-								"description": "Remove dirs older than (e.g., 7d, 24h)"
-							},
-							"dry_run": {
-								"type": "boolean",
-								"description": "Preview only"
-							}
+						"pairs": {
+							"type": "object"
 						}
-					}`),
-		},
-
-		// 39. Evaluate math expressions
-		{
-			Name:        ToolPrefix + "math",
-			Description: "Evaluate mathematical expressions safely. Supports basic arithmetic, functions (sin, cos, sqrt, etc.), and variables.",
-			InputSchema: json.RawMessage(`{
-						"type": "object",
-						"properties": {
-							"expression": {
-								"type": "string"
-							}
+					},
+					"required": ["dir", "pairs"]
+				}`),
+	},
+
+	// 23. Context multiget - batch retrieve multiple values
+	{
+		Name:        ToolPrefix + "context_multiget",
+		Description: "Retrieve multiple context values in a single call.",
+		InputSchema: json.RawMessage(`{
+					"type": "object",
+					"properties": {
+						"dir": {
+							"type": "string",
+							"description": "Dir with context.env"
 						},
-						"required": ["expression"]
-					}`),
-		},
-
-		// 39. Generate status report
-		{
-			Name:        ToolPrefix + "report",
-			Description: "Generate a formatted markdown status report with title, statistics, and status.",
-			InputSchema: json.RawMessage(`{
-						"type": "object",
-						"properties": {
-							"title": {
-								"type": "string"
-							},
-							"status": {
-								"type": "string",
-								"enum": ["success", "partial", "failed"]
-							},
-							"stats": {
-								"type": "object",
-								"description": "Statistics as key-value pairs"
-							},
-							"output": {
+						"keys": {
+							"type": "array",
+							"items": {
 								"type": "string"
 							}
 						},
-						"required": ["title", "status"]
-					}`),
-		},
-
-		// 41. Directory statistics
-		{
-			Name:        ToolPrefix + "stats",
-			Description: "Display directory statistics (file counts, size, extension breakdown).",
-			InputSchema: json.RawMessage(`{
-						"type": "object",
-						"properties": {
-							"path": {
-								"type": "string"
-							},
-							"no_gitignore": {
-								"type": "boolean",
-								"description": "Disable .gitignore filtering"
-							}
+						"defaults": {
+							"type": "object",
+							"description": "Defaults for missing keys"
 						}
-					}`),
-		},
-
-		// 42. TOML query
-		{
-			Name:        ToolPrefix + "toml_query",
-			Description: "Query TOML file with dot-notation path.",
-			InputSchema: json.RawMessage(`{
-						"type": "object",
-						"properties": {
-							"file": {
-								"type": "string"
-							},
-							"path": {
-								"type": "string",
-								"description": "Dot-notation path"
-							}
+					},
+					"required": ["dir", "keys"]
+				}`),
+	},
+
+	// 24. Context variable management
+	{
+		Name:        ToolPrefix + "context",
+		Description: "Manage persistent key-value context storage. Supports init/set/get/list/dump/clear.",
+		InputSchema: json.RawMessage(`{
+					"type": "object",
+					"properties": {
+						"operation": {
+							"type": "string",
+							"enum": ["init", "set", "get", "list", "dump", "clear"],
+							"description": "init/set/get/list/dump/clear"
 						},
-						"required": ["file", "path"]
-					}`),
-		},
-
-		// 43. TOML validate
-		{
-			Name:        ToolPrefix + "toml_validate",
-			Description: "Validate TOML file syntax.",
-			InputSchema: json.RawMessage(`{
-						"type": "object",
-						"properties": {
-							"file": {
-								"type": "string"
-							}
+						"dir": {
+							"type": "string",
+							"description": "Dir with context.env"
 						},
-						"required": ["file"]
-					}`),
-		},
-
-		// 44. TOML parse
-		{
-			Name:        ToolPrefix + "toml_parse",
-			Description: "Parse and display TOML file contents.",
-			InputSchema: json.RawMessage(`{
-						"type": "object",
-						"properties": {
-							"file": {
-								"type": "string"
-							}
+						"key": {
+							"type": "string",
+							"description": "Key name"
 						},
-						"required": ["file"]
-					}`),
-		},
-
-		// 45. Transform case
-		{
-			Name:        ToolPrefix + "transform_case",
-			Description: "Transform text case. Formats: camelCase, PascalCase, snake_case, kebab-case, UPPERCASE, lowercase, Title Case.",
-			InputSchema: json.RawMessage(`{
-						"type": "object",
-						"properties": {
-							"text": {
-								"type": "string"
-							},
-							"to": {
-								"type": "string",
-								"enum": ["camelCase", "PascalCase", "snake_case", "kebab-case", "UPPERCASE", "lowercase", "Title Case"],
-								"description": "Target case format"
-							}
+						"value": {
+							"type": "string",
+							"description": "Value"
 						},
-						"required": ["text", "to"]
-					}`),
-		},
-
-		// 46. Transform CSV to JSON
-		{
-			Name:        ToolPrefix + "transform_csv_to_json",
-			Description: "Convert CSV file to JSON.",
-			InputSchema: json.RawMessage(`{
-						"type": "object",
-						"properties": {
-							"file": {
-								"type": "string"
-							}
+						"default": {
+							"type": "string",
+							"description": "Default if missing"
+						}
+					},
+					"required": ["operation", "dir"]
+				}`),
+	},
+
+	// 25. YAML get - retrieve value by dot-notation key
+	{
+		Name:        ToolPrefix + "yaml_get",
+		Description: "Retrieve a value from YAML config by dot-notation key.",
+		InputSchema: json.RawMessage(`{
+					"type": "object",
+					"properties": {
+						"file": {
+							"type": "string"
 						},
-						"required": ["file"]
-					}`),
-		},
-
-		// 47. Transform JSON to CSV
-		{
-			Name:        ToolPrefix + "transform_json_to_csv",
-			Description: "Convert JSON array file to CSV.",
-			InputSchema: json.RawMessage(`{
-						"type": "object",
-						"properties": {
-							"file": {
-								"type": "string"
-							}
+						"key": {
+							"type": "string",
+							"description": "Dot-notation key"
 						},
-						"required": ["file"]
-					}`),
-		},
-
-		// 48. Transform filter lines
-		{
-			Name:        ToolPrefix + "transform_filter",
-			Description: "Filter lines in a file by regex pattern.",
-			InputSchema: json.RawMessage(`{
-						"type": "object",
-						"properties": {
-							"file": {
-								"type": "string"
-							},
-							"pattern": {
-								"type": "string",
-								"description": "Regex pattern to match"
-							},
-							"invert": {
-								"type": "boolean",
-								"description": "Invert match (exclude matching lines)"
-							}
+						"default": {
+							"type": "string",
+							"description": "Default if missing"
+						}
+					},
+					"required": ["file", "key"]
+				}`),
+	},
+
+	// 26. YAML set - store value at dot-notation key
+	{
+		Name:        ToolPrefix + "yaml_set",
+		Description: "Store a value in YAML config at dot-notation key.",
+		InputSchema: json.RawMessage(`{
+					"type": "object",
+					"properties": {
+						"file": {
+							"type": "string"
 						},
-						"required": ["file", "pattern"]
-					}`),
-		},
-
-		// 49. Transform sort lines
-		{
-			Name:        ToolPrefix + "transform_sort",
-			Description: "Sort lines in a file.",
-			InputSchema: json.RawMessage(`{
-						"type": "object",
-						"properties": {
-							"file": {
-								"type": "string"
-							},
-							"reverse": {
-								"type": "boolean",
-								"description": "Sort in reverse order"
-							}
+						"key": {
+							"type": "string",
+							"description": "Dot-notation key"
 						},
-						"required": ["file"]
-					}`),
-		},
-
-		// 50. Validate files
-		{
-			Name:        ToolPrefix + "validate",
-			Description: "Validate files of various formats: JSON, TOML, YAML, CSV, Markdown.",
-			InputSchema: json.RawMessage(`{
-						"type": "object",
-						"properties": {
-							"files": {
-								"type": "array",
-								"items": {
-									"type": "string"
-								}
-							}
+						"value": {
+							"type": "string"
 						},
-						"required": ["files"]
-					}`),
-		},
-
-		// 51. Calculate runtime/elapsed time
-		{
-			Name:        ToolPrefix + "runtime",
-			Description: "Calculate elapsed time between epoch timestamps.",
-			InputSchema: json.RawMessage(`{
-						"type": "object",
-						"properties": {
-							"start": {
-								"type": "integer",
-								"description": "Start epoch timestamp (required)"
-							},
-							"end": {
-								"type": "integer",
-								"description": "End epoch timestamp (default: now)"
-							},
-							"format": {
-								"type": "string",
-								"enum": ["secs", "mins", "mins-secs", "hms", "human", "compact"],
-								"description": "Output format (default: human)"
-							},
-							"precision": {
-								"type": "integer",
-								"description": "Decimal precision for output (default: 1)"
-							},
-							"label": {
-								"type": "boolean",
-								"description": "Include 'Runtime: ' prefix"
-							},
-							"raw": {
-								"type": "boolean",
-								"description": "Output raw number without unit suffix"
-							}
+						"create": {
+							"type": "boolean",
+							"description": "Create file if it doesn't exist"
 						},
-						"required": ["start"]
-					}`),
-		},
-
-		// 52. Complete - Direct OpenAI API completion
-		{
-			Name:        ToolPrefix + "complete",
-			Description: "Send prompt to OpenAI-compatible API. Uses OPENAI_API_KEY/BASE_URL/MODEL env vars.",
-			InputSchema: json.RawMessage(`{
-						"type": "object",
-						"properties": {
-							"prompt": {
-								"type": "string"
-							},
-							"file": {
-								"type": "string",
-								"description": "Read prompt from file"
-							},
-							"template": {
-								"type": "string",
-								"description": "Template file with [[var]] placeholders"
-							},
-							"vars": {
-								"type": "object",
-								"description": "Template vars"
-							},
-							"system": {
-								"type": "string"
-							},
-							"model": {
-								"type": "string",
-								"description": "Model to use (overrides OPENAI_MODEL)"
-							},
-							"temperature": {
-								"type": "number",
-								"description": "Temperature 0.0-2.0 (default: 0.7)"
-							},
-							"max_tokens": {
-								"type": "integer",
-								"description": "Maximum tokens in response (0 = no limit)"
-							},
-							"timeout": {
-								"type": "integer",
-								"description": "Request timeout in seconds (default: 120)"
-							},
-							"retries": {
-								"type": "integer",
-								"description": "Number of retries on failure (default: 3)"
-							},
-							"output": {
-								"type": "string"
-							}
+						"dry_run": {
+							"type": "boolean",
+							"description": "Preview only"
+						},
+						"quiet": {
+							"type": "boolean",
+							"description": "Suppress success messages"
 						}
-					}`),
-		},
-
-		// 48. Route technical debt issues
-		{
-			Name:        ToolPrefix + "route_td",
-			Description: "Route technical debt items by time estimate (quick_wins/backlog/td_files).",
-			InputSchema: json.RawMessage(`{
-						"type": "object",
-						"properties": {
-							"file": {
-								"type": "string"
-							},
-							"content": {
+					},
+					"required": ["file", "key", "value"]
+				}`),
+	},
+
+	// 27. YAML multiget - retrieve multiple values
+	{
+		Name:        ToolPrefix + "yaml_multiget",
+		Description: "Retrieve multiple YAML values in a single call.",
+		InputSchema: json.RawMessage(`{
+					"type": "object",
+					"properties": {
+						"file": {
+							"type": "string"
+						},
+						"keys": {
+							"type": "array",
+							"items": {
 								"type": "string"
 							},
-							"quick_wins_max": {
-								"type": "integer",
-								"description": "Quick wins max min (default: 30)"
-							},
-							"backlog_max": {
-								"type": "integer",
-								"description": "Backlog max min (default: 2880)"
-							}
+							"description": "Keys (dot-notation)"
+						},
+						"defaults": {
+							"type": "object",
+							"description": "Defaults for keys"
+						},
+						"required_file": {
+							"type": "string",
+							"description": "File with required keys (one per line)"
 						}
-					}`),
-		},
-
-		// 49. Parse structured data streams
-		{
-			Name:        ToolPrefix + "parse_stream",
-			Description: "Parse structured data streams (pipe-delimited, markdown checklists) into JSON.",
-			InputSchema: json.RawMessage(`{
-						"type": "object",
-						"properties": {
-							"file": {
-								"type": "string"
-							},
-							"content": {
+					},
+					"required": ["file"]
+				}`),
+	},
+
+	// 28. YAML multiset - set multiple key-value pairs
+	{
+		Name:        ToolPrefix + "yaml_multiset",
+		Description: "Set multiple YAML key-value pairs atomically.",
+		InputSchema: json.RawMessage(`{
+					"type": "object",
+					"properties": {
+						"file": {
+							"type": "string"
+						},
+						"pairs": {
+							"type": "object",
+							"description": "Key-value pairs"
+						},
+						"create": {
+							"type": "boolean",
+							"description": "Create file if it doesn't exist"
+						},
+						"dry_run": {
+							"type": "boolean",
+							"description": "Preview only"
+						},
+						"quiet": {
+							"type": "boolean",
+							"description": "Suppress success messages"
+						}
+					},
+					"required": ["file", "pairs"]
+				}`),
+	},
+
+	// 29. Parse arguments into structured format
+	{
+		Name:        ToolPrefix + "args",
+		Description: "Parse command-line arguments into structured format.",
+		InputSchema: json.RawMessage(`{
+					"type": "object",
+					"properties": {
+						"arguments": {
+							"type": "array",
+							"items": {
 								"type": "string"
-							},
-							"format": {
-								"type": "string",
-								"enum": ["auto", "pipe", "markdown-checklist"],
-								"description": "auto/pipe/markdown-checklist"
-							},
-							"delimiter": {
-								"type": "string",
-								"description": "Delimiter for pipe format (default: |)"
-							},
-							"headers": {
-								"type": "string",
-								"description": "Header names (comma-separated)"
 							}
 						}
-					}`),
-		},
-
-		// 50. Coverage report for requirements
-		{
-			Name:        ToolPrefix + "coverage_report",
-			Description: "Calculate requirement coverage from user stories.",
-			InputSchema: json.RawMessage(`{
-						"type": "object",
-						"properties": {
-							"requirements": {
-								"type": "string"
-							},
-							"stories": {
+					},
+					"required": ["arguments"]
+				}`),
+	},
+
+	// 30. Concatenate files with headers
+	{
+		Name:        ToolPrefix + "catfiles",
+		Description: "Concatenate multiple files with path headers. Respects .gitignore.",
+		InputSchema: json.RawMessage(`{
+					"type": "object",
+					"properties": {
+						"paths": {
+							"type": "array",
+							"items": {
 								"type": "string"
 							}
 						},
-						"required": ["requirements", "stories"]
-					}`),
-		},
-
-		// 51. Validate risks coverage
-		{
-			Name:        ToolPrefix + "validate_risks",
-			Description: "Cross-reference sprint risks with stories/tasks/ACs for coverage.",
-			InputSchema: json.RawMessage(`{
-						"type": "object",
-						"properties": {
-							"design": {
-								"type": "string"
-							},
-							"stories": {
-								"type": "string"
-							},
-							"tasks": {
-								"type": "string"
-							},
-							"acceptance_criteria": {
-								"type": "string"
-							}
+						"max_size": {
+							"type": "integer",
+							"description": "Max size in MB (default: 10)"
 						},
-						"required": ["design"]
-					}`),
-		},
-
-		// 52. Alignment check for requirements
-		{
-			Name:        ToolPrefix + "alignment_check",
-			Description: "Verify requirements alignment with delivered stories.",
-			InputSchema: json.RawMessage(`{
-						"type": "object",
-						"properties": {
-							"requirements": {
-								"type": "string"
-							},
-							"stories": {
-								"type": "string"
-							},
-							"tasks": {
-								"type": "string",
-								"description": "Path to tasks directory (optional, scanned for additional traceability)"
-							}
+						"no_gitignore": {
+							"type": "boolean",
+							"description": "Disable .gitignore filtering"
+						}
+					},
+					"required": ["paths"]
+				}`),
+	},
+
+	// 31. Decode text
+	{
+		Name:        ToolPrefix + "decode",
+		Description: "Decode text using base64, base32, hex, or URL encoding.",
+		InputSchema: json.RawMessage(`{
+					"type": "object",
+					"properties": {
+						"text": {
+							"type": "string"
 						},
-						"required": ["requirements", "stories"]
-					}`),
-		},
-
-		// 53. Sprint status determination
-		{
-			Name:        ToolPrefix + "sprint_status",
-			Description: "Determine sprint completion status (COMPLETED/PARTIAL/FAILED).",
-			InputSchema: json.RawMessage(`{
-						"type": "object",
-						"properties": {
-							"tasks_total": {
-								"type": "integer",
-								"description": "Total number of tasks"
-							},
-							"tasks_completed": {
-								"type": "integer",
-								"description": "Number of completed tasks"
-							},
-							"tests_passed": {
-								"type": "boolean"
-							},
-							"coverage": {
-								"type": "number"
-							},
-							"critical_issues": {
-								"type": "integer",
-								"description": "Number of critical issues"
-							},
-							"completed_threshold": {
-								"type": "number",
-								"description": "Threshold for COMPLETED (default: 0.90)"
-							},
-							"partial_threshold": {
-								"type": "number",
-								"description": "Threshold for PARTIAL (default: 0.50)"
-							},
-							"coverage_threshold": {
-								"type": "number",
-								"description": "Min coverage (default: 60)"
-							}
+						"encoding": {
+							"type": "string",
+							"enum": ["base64", "base32", "hex", "url"],
+							"description": "Encoding type (default: base64)"
+						}
+					},
+					"required": ["text"]
+				}`),
+	},
+
+	// 32. Compare files
+	{
+		Name:        ToolPrefix + "diff",
+		Description: "Compare two files and show the differences.",
+		InputSchema: json.RawMessage(`{
+					"type": "object",
+					"properties": {
+						"file1": {
+							"type": "string"
 						},
-						"required": ["tests_passed"]
-					}`),
-		},
-
-		// 54. TDD compliance analysis
-		{
-			Name:        ToolPrefix + "tdd_compliance",
-			Description: "Analyze git history for TDD compliance.",
-			InputSchema: json.RawMessage(`{
-						"type": "object",
-						"properties": {
-							"path": {
-								"type": "string"
-							},
-							"content": {
-								"type": "string",
-								"description": "Git log (pipe-delimited)"
-							},
-							"since": {
-								"type": "string",
-								"description": "Analyze commits since date (YYYY-MM-DD)"
-							},
-							"until": {
-								"type": "string",
-								"description": "Analyze commits until date (YYYY-MM-DD)"
-							},
-							"count": {
-								"type": "integer",
-								"description": "Maximum number of commits to analyze"
-							}
+						"file2": {
+							"type": "string"
+						},
+						"unified": {
+							"type": "boolean",
+							"description": "Use unified diff format"
 						}
-					}`),
-		},
-
-		// 55. Categorize git changes
-		{
-			Name:        ToolPrefix + "categorize_changes",
-			Description: "Categorize git status output by file type (source, test, config, docs, generated, other). Detects sensitive files.",
-			InputSchema: json.RawMessage(`{
-						"type": "object",
-						"properties": {
-							"file": {
-								"type": "string"
-							},
-							"content": {
-								"type": "string"
-							},
-							"sensitive_patterns": {
-								"type": "string",
-								"description": "Extra sensitive patterns (comma-separated)"
-							}
+					},
+					"required": ["file1", "file2"]
+				}`),
+	},
+
+	// 33. Encode text
+	{
+		Name:        ToolPrefix + "encode",
+		Description: "Encode text using base64, base32, hex, or URL encoding.",
+		InputSchema: json.RawMessage(`{
+					"type": "object",
+					"properties": {
+						"text": {
+							"type": "string"
+						},
+						"encoding": {
+							"type": "string",
+							"enum": ["base64", "base32", "hex", "url"],
+							"description": "Encoding type (default: base64)"
 						}
-					}`),
-		},
-
-		// 56. Format TD items as markdown tables
-		{
-			Name:        ToolPrefix + "format_td_table",
-			Description: "Format technical debt items as markdown tables.",
-			InputSchema: json.RawMessage(`{
-						"type": "object",
-						"properties": {
-							"file": {
-								"type": "string"
-							},
-							"content": {
-								"type": "string"
-							},
-							"section": {
-								"type": "string",
-								"enum": ["quick_wins", "backlog", "td_files", "all"],
-								"description": "Section: quick_wins/backlog/td_files/all"
-							},
-							"checkbox": {
-								"type": "boolean",
-								"description": "Add checkbox column"
-							}
+					},
+					"required": ["text"]
+				}`),
+	},
+
+	// 34. Extract patterns from text
+	{
+		Name:        ToolPrefix + "extract",
+		Description: "Extract patterns from text files. Types: urls, paths, variables, todos, emails, ips.",
+		InputSchema: json.RawMessage(`{
+					"type": "object",
+					"properties": {
+						"type": {
+							"type": "string",
+							"enum": ["urls", "paths", "variables", "todos", "emails", "ips"],
+							"description": "Type of pattern to extract"
+						},
+						"file": {
+							"type": "string"
+						},
+						"count": {
+							"type": "boolean"
+						},
+						"unique": {
+							"type": "boolean",
+							"description": "Remove duplicates"
 						}
-					}`),
-		},
-
-		// 57. Group TD items by path/category
-		{
-			Name:        ToolPrefix + "group_td",
-			Description: "Group technical debt items by path, category, or file.",
-			InputSchema: json.RawMessage(`{
-						"type": "object",
-						"properties": {
-							"file": {
-								"type": "string"
-							},
-							"content": {
+					},
+					"required": ["type", "file"]
+				}`),
+	},
+
+	// 35. Batch process files with LLM
+	{
+		Name:        ToolPrefix + "foreach",
+		Description: "Process multiple files through an LLM using a template with [[var]] placeholders.",
+		InputSchema: json.RawMessage(`{
+					"type": "object",
+					"properties": {
+						"files": {
+							"type": "array",
+							"items": {
 								"type": "string"
-							},
-							"group_by": {
-								"type": "string",
-								"enum": ["path", "category", "file"],
-								"description": "Strategy: path, category, or file"
-							},
-							"path_depth": {
-								"type": "integer",
-								"description": "Number of path segments for theme (default: 2)"
-							},
-							"min_group_size": {
-								"type": "integer",
-								"description": "Min items per group (default: 3)"
-							},
-							"critical_override": {
-								"type": "boolean",
-								"description": "CRITICAL gets own group (default: true)"
-							},
-							"root_theme": {
-								"type": "string",
-								"description": "Root theme (default: misc)"
-							},
-							"assign_numbers": {
-								"type": "boolean",
-								"description": "Assign group numbers"
-							},
-							"output_file": {
-								"type": "string",
-								"description": "Output markdown file (appends)"
-							},
-							"checkbox": {
-								"type": "boolean",
-								"description": "Add checkbox column"
-							},
-							"sprint_label": {
-								"type": "string",
-								"description": "Sprint name for section header in output file"
-							},
-							"date_label": {
-								"type": "string",
-								"description": "Date for section header in output file"
-							},
-							"format": {
-								"type": "string",
-								"enum": ["json", "pipe"],
-								"description": "Input format: json (default) or pipe (pipe-delimited text with # comments)"
-							},
-							"headers": {
-								"type": "string",
-								"description": "Column headers for pipe format"
-							},
-							"delimiter": {
-								"type": "string",
-								"description": "Field delimiter for pipe format (default: |)"
 							}
+						},
+						"glob": {
+							"type": "string",
+							"description": "Glob pattern (alternative to files)"
+						},
+						"template": {
+							"type": "string",
+							"description": "Template file with [[var]] vars"
+						},
+						"llm": {
+							"type": "string",
+							"description": "LLM binary (default: gemini)"
+						},
+						"output_dir": {
+							"type": "string",
+							"description": "Output directory for processed files"
+						},
+						"output_pattern": {
+							"type": "string",
+							"description": "Output pattern (e.g., {{name}}-out.md)"
+						},
+						"parallel": {
+							"type": "integer",
+							"description": "Parallel count (default: 1)"
+						},
+						"skip_existing": {
+							"type": "boolean",
+							"description": "Skip existing"
+						},
+						"timeout": {
+							"type": "integer",
+							"description": "Timeout per file (default: 120s)"
+						},
+						"vars": {
+							"type": "object",
+							"description": "Template vars"
 						}
-					}`),
-		},
-		// 58. Tech debt statistics
-		{
-			Name:        ToolPrefix + "td_stats",
-			Description: "Generate tech debt statistics from a markdown README with checkbox/severity table. States: [ ] open, [/] deferred, [x] resolved, [-] unreproducible (closed without a fix, counted separately from resolved). Total counts every state. The Unreproducible column appears only in files that use [-], so a three-state README renders unchanged. With write=true, rewrites the ## Stats section and Last Modified line in place deterministically (no data rows added or removed — use td_clean for that).",
-			InputSchema: json.RawMessage(`{
-						"type": "object",
-						"properties": {
-							"path": {
+					},
+					"required": ["template"]
+				}`),
+	},
+
+	// 36. Generate hash checksums
+	{
+		Name:        ToolPrefix + "hash",
+		Description: "Generate hash checksums for files. Algorithms: md5, sha1, sha256 (default), sha512.",
+		InputSchema: json.RawMessage(`{
+					"type": "object",
+					"properties": {
+						"paths": {
+							"type": "array",
+							"items": {
 								"type": "string"
-							},
-							"write": {
-								"type": "boolean",
-								"description": "Rewrite the ## Stats section and Last Modified line in place"
-							},
-							"today": {
-								"type": "string",
-								"description": "Date for the Last Modified line (YYYY-MM-DD); defaults to today. Only used with write=true."
 							}
 						},
-						"required": ["path"]
-					}`),
-		},
-
-		// 58z. Tech debt open-items cross-tab
-		{
-			Name:        ToolPrefix + "td_matrix",
-			Description: "Cross-tab OPEN technical-debt items by severity (columns) and group (rows), with row/column totals. Resolved [x] and deferred [/] items are excluded; only rows inside dated '### [date] From...' sections are counted. Read-only. Returns structured counts plus a rendered markdown table.",
-			InputSchema: json.RawMessage(`{
-						"type": "object",
-						"properties": {
-							"path": {"type": "string", "description": "Path to the technical-debt README"}
-						},
-						"required": ["path"]
-					}`),
-		},
-
-		// 58a. Tech debt README cleanup
-		{
-			Name:        ToolPrefix + "td_clean",
-			Description: "Clean a technical-debt README in place: strip resolved [x] rows (whole-cell match, not prose substrings), remove sprint sections left empty, regenerate the Stats section, and refresh the Last Modified line. Only a fix retires a row: [ ] open, [/] deferred and [-] unreproducible rows are all kept, and a section holding only [-] rows is not treated as empty. Returns counts of rows/sections removed and post-cleanup totals. No-op (file untouched) when no resolved rows exist. Deterministic replacement for in-model row stripping.",
-			InputSchema: json.RawMessage(`{
-						"type": "object",
-						"properties": {
-							"path": {"type": "string", "description": "Path to the technical-debt README"},
-							"today": {"type": "string", "description": "Date for the Last Modified line (YYYY-MM-DD); defaults to today"}
-						},
-						"required": ["path"]
-					}`),
-		},
-
-		// 58b. Tech debt selection/filtering
-		{
-			Name:        ToolPrefix + "td_filter",
-			Description: "Select unchecked technical-debt rows from a README by filter criteria (mode quick-wins/backlog/all, severity, confidence, group, section focus, max). Returns matching rows + a summary of counts and the group write-scope. Deterministic replacement for in-model table parsing.",
-			InputSchema: json.RawMessage(`{
-						"type": "object",
-						"properties": {
-							"path": {"type": "string", "description": "Path to the technical-debt README"},
-							"mode": {"type": "string", "enum": ["quick-wins", "backlog", "all"], "description": "Effort threshold (default quick-wins)"},
-							"severity": {"type": "string", "description": "Comma-separated severities to keep (low,medium,high,critical); empty = all"},
-							"confidence": {"type": "string", "description": "Comma-separated confidences to keep (low,medium,high); empty = all"},
-							"group": {"type": "string", "description": "Group-column value to keep (e.g. solo,1,2,u); empty = all"},
-							"focus": {"type": "string", "description": "Section header substring, case-insensitive"},
-							"max": {"type": "integer", "description": "Max items returned (default 10)"}
-						},
-						"required": ["path"]
-					}`),
-		},
-
-		// 58c. Tech debt cross-reviewer dedupe/merge
-		{
-			Name:        ToolPrefix + "td_dedupe",
-			Description: "Cluster and merge technical-debt streams from multiple reviewers by (file, line +/- tolerance). Aggregates REVIEWERS union, SEVERITY max, CATEGORY modal, EST_MINUTES max, CONFIDENCE (HIGH for 2+ distinct reviewers), and severity-disagreement; flags multi-item clusters needs_review with members for model adjudication. Deterministic replacement for in-model reconcile clustering.",
-			InputSchema: json.RawMessage(`{
-						"type": "object",
-						"properties": {
-							"streams": {"type": "string", "description": "Comma-separated td-stream.txt paths"},
-							"source_tags": {"type": "string", "description": "Comma-separated source labels parallel to streams (default: parent dir name)"},
-							"tolerance": {"type": "integer", "description": "Line-proximity window for clustering (default 3)"},
-							"untrusted": {"type": "string", "description": "Comma-separated source tags whose findings alone yield CONFIDENCE LOW"}
-						},
-						"required": ["streams"]
-					}`),
-		},
-
-		// 58c-2. Technical debt file/symbol validation
-		{
-			Name:        ToolPrefix + "td_validate",
-			Description: "Validate open (and optionally deferred) technical-debt rows by checking whether the cited file and symbol still exist in the repository. Closed rows are skipped — both [x] resolved and [-] unreproducible — since neither has anything left to ground. Returns per-item status: valid, file_missing, symbol_not_found, or no_file. Use to identify stale TD items that can be closed as won't-fix.",
-			InputSchema: json.RawMessage(`{
-						"type": "object",
-						"properties": {
-							"path": {"type": "string", "description": "Path to the technical-debt README"},
-							"root": {"type": "string", "description": "Repo root for resolving relative file paths (default: current directory)"},
-							"mode": {"type": "string", "enum": ["open", "all"], "description": "open = open [ ] items only (default); all = also include deferred [/] items"},
-							"coherence": {"type": "boolean", "description": "Advisory: flag rows whose FIX reads as incoherent with its PROBLEM (copy-paste signature). Needs an embedding/reranker endpoint; degrades gracefully if none is reachable."},
-							"coherence_collection": {"type": "string", "description": "Qdrant collection for the optional grounding signal (e.g. atcr-code); empty disables grounding"}
-						},
-						"required": ["path"]
-					}`),
-		},
-
-		// 58c-3. Codebase-discovery.json path validation
-		{
-			Name:        ToolPrefix + "discovery_validate",
-			Description: "Verify that file paths cited in a codebase-discovery.json plan artifact still exist. Checks files_to_modify[*].path, related_files[*].path, semantic_matches[*].file, reusable_components[*].path, existing_patterns[*].files[], and integration_points[*].location (file segment). Report-only by default; pass write=true to mark stale entries status=deprecated with a deprecated_reason (never deletes, never overwrites an entry's existing reason field). Skips files_to_create[*] (expected not to exist yet) and reports build_from.primary_file / test_patterns.* as informational-only (never auto-mutated). Entries already status=deprecated are left untouched. Deterministic replacement for model-driven path re-verification in /refine-codebase-discovery.",
-			InputSchema: json.RawMessage(`{
-						"type": "object",
-						"properties": {
-							"path": {"type": "string", "description": "Path to codebase-discovery.json"},
-							"root": {"type": "string", "description": "Repo root for resolving relative paths cited in the JSON (default: current directory)"},
-							"write": {"type": "boolean", "description": "Mark stale entries deprecated in place (default: false, report-only)"}
-						},
-						"required": ["path"]
-					}`),
-		},
-
-		// 58d. Package documentation tier classification
-		{
-			Name:        ToolPrefix + "tier_classifier",
-			Description: "Classify packages into documentation tiers (critical/important/pattern/utility/skip) via deterministic passes 1-3: explicit config map, glob patterns, keyword categories. Returns assigned map + unassigned list (for the model's Pass 4) + per-pass counts. Deterministic replacement for in-model tier assignment in /init-documentation.",
-			InputSchema: json.RawMessage(`{
-						"type": "object",
-						"properties": {
-							"packages": {"type": "string", "description": "Comma-separated package names"},
-							"config": {"type": "string", "description": "Path to package-tiers.yaml (packages/patterns/categories)"}
-						},
-						"required": ["packages"]
-					}`),
-		},
-
-		// 58e. Knowledge-base audit + frontmatter repair
-		{
-			Name:        ToolPrefix + "knowledge_audit",
-			Description: "Audit a .knowledge/ directory for frontmatter drift and stale code references. Per entry: schema conformance (missing/unknown/aliased keys, soft fields needing input) and drift (git-derived created date, age, cited-file existence + commits-since-capture, unfilled placeholders), plus a flags array (code_changed_after_capture/dangling_ref/incomplete/needs_input) marking entries that warrant model review. Read-only by default; repair_schema deterministically normalizes frontmatter (rename aliases, fill derivable/bookkeeping keys, synthesize missing id, derive files from body) preserving the body, filename, and existing id, and is idempotent.",
-			InputSchema: json.RawMessage(`{
-						"type": "object",
-						"properties": {
-							"dir": {"type": "string", "description": "Path to the .knowledge directory"},
-							"repair_schema": {"type": "boolean", "description": "Write deterministic frontmatter normalization (default false = read-only report)"}
-						},
-						"required": ["dir"]
-					}`),
-		},
-
-		// 58f. Diff over-simplification / reward-hack smell
-		{
-			Name:        ToolPrefix + "diff_smell",
-			Description: "Scan a diff for over-simplification / reward-hack fingerprints: the change touched only tests (test_only), a test removed assertions without replacing them (weakened_assertion), or an added line suppressed a linter/type-checker (suppression), swallowed an exception (empty_catch), or stubbed a body (stub_body). Deterministic, model-independent gate for /resolve-td — the inverse of its too-complex SAFE_SCOPE check. Returns smells + summary.verdict (hard=force review / soft_only=adjudicate / clean). Source is a diff file (`diff`) or a commit (`repo`+`rev`, via git show).",
-			InputSchema: json.RawMessage(`{
-						"type": "object",
-						"properties": {
-							"diff": {"type": "string", "description": "Path to a unified diff file (takes precedence over repo/rev)"},
-							"repo": {"type": "string", "description": "Repository to read the commit diff from when diff is not given"},
-							"rev": {"type": "string", "description": "Commit to scan via 'git show <rev>' (default HEAD)"}
-						}
-					}`),
-		},
-
-		// 59. Project components (monorepo support)
-		{
-			Name:        ToolPrefix + "project_components",
-			Description: "Read project config and return normalized component list.",
-			InputSchema: json.RawMessage(`{
-						"type": "object",
-						"properties": {
-							"file": {
+						"algorithm": {
+							"type": "string",
+							"enum": ["md5", "sha1", "sha256", "sha512"],
+							"description": "Hash algorithm (default: sha256)"
+						}
+					},
+					"required": ["paths"]
+				}`),
+	},
+
+	// 37. Initialize temp directory
+	{
+		Name:        ToolPrefix + "init_temp",
+		Description: "Initialize temp directory at .planning/.temp/{name}/.",
+		InputSchema: json.RawMessage(`{
+					"type": "object",
+					"properties": {
+						"name": {
+							"type": "string"
+						},
+						"clean": {
+							"type": "boolean",
+							"description": "Remove existing files (default: true)"
+						},
+						"preserve": {
+							"type": "boolean",
+							"description": "Keep existing files"
+						},
+						"with_git": {
+							"type": "boolean",
+							"description": "Include git info"
+						},
+						"skip_context": {
+							"type": "boolean",
+							"description": "Don't create context.env file"
+						}
+					},
+					"required": ["name"]
+				}`),
+	},
+
+	// 38. Clean temp directory
+	{
+		Name:        ToolPrefix + "clean_temp",
+		Description: "Clean up temp directories created by init_temp.",
+		InputSchema: json.RawMessage(`{
+					"type": "object",
+					"properties": {
+						"name": {
+							"type": "string"
+						},
+						"all": {
+							"type": "boolean",
+							"description": "Remove all temp directories"
+						},
+						"older_than": {
+							"type": "string",
+							"description": "Remove dirs older than (e.g., 7d, 24h)"
+						},
+						"dry_run": {
+							"type": "boolean",
+							"description": "Preview only"
+						}
+					}
+				}`),
+	},
+
+	// 39. Evaluate math expressions
+	{
+		Name:        ToolPrefix + "math",
+		Description: "Evaluate mathematical expressions safely. Supports basic arithmetic, functions (sin, cos, sqrt, etc.), and variables.",
+		InputSchema: json.RawMessage(`{
+					"type": "object",
+					"properties": {
+						"expression": {
+							"type": "string"
+						}
+					},
+					"required": ["expression"]
+				}`),
+	},
+
+	// 39. Generate status report
+	{
+		Name:        ToolPrefix + "report",
+		Description: "Generate a formatted markdown status report with title, statistics, and status.",
+		InputSchema: json.RawMessage(`{
+					"type": "object",
+					"properties": {
+						"title": {
+							"type": "string"
+						},
+						"status": {
+							"type": "string",
+							"enum": ["success", "partial", "failed"]
+						},
+						"stats": {
+							"type": "object",
+							"description": "Statistics as key-value pairs"
+						},
+						"output": {
+							"type": "string"
+						}
+					},
+					"required": ["title", "status"]
+				}`),
+	},
+
+	// 41. Directory statistics
+	{
+		Name:        ToolPrefix + "stats",
+		Description: "Display directory statistics (file counts, size, extension breakdown).",
+		InputSchema: json.RawMessage(`{
+					"type": "object",
+					"properties": {
+						"path": {
+							"type": "string"
+						},
+						"no_gitignore": {
+							"type": "boolean",
+							"description": "Disable .gitignore filtering"
+						}
+					}
+				}`),
+	},
+
+	// 42. TOML query
+	{
+		Name:        ToolPrefix + "toml_query",
+		Description: "Query TOML file with dot-notation path.",
+		InputSchema: json.RawMessage(`{
+					"type": "object",
+					"properties": {
+						"file": {
+							"type": "string"
+						},
+						"path": {
+							"type": "string",
+							"description": "Dot-notation path"
+						}
+					},
+					"required": ["file", "path"]
+				}`),
+	},
+
+	// 43. TOML validate
+	{
+		Name:        ToolPrefix + "toml_validate",
+		Description: "Validate TOML file syntax.",
+		InputSchema: json.RawMessage(`{
+					"type": "object",
+					"properties": {
+						"file": {
+							"type": "string"
+						}
+					},
+					"required": ["file"]
+				}`),
+	},
+
+	// 44. TOML parse
+	{
+		Name:        ToolPrefix + "toml_parse",
+		Description: "Parse and display TOML file contents.",
+		InputSchema: json.RawMessage(`{
+					"type": "object",
+					"properties": {
+						"file": {
+							"type": "string"
+						}
+					},
+					"required": ["file"]
+				}`),
+	},
+
+	// 45. Transform case
+	{
+		Name:        ToolPrefix + "transform_case",
+		Description: "Transform text case. Formats: camelCase, PascalCase, snake_case, kebab-case, UPPERCASE, lowercase, Title Case.",
+		InputSchema: json.RawMessage(`{
+					"type": "object",
+					"properties": {
+						"text": {
+							"type": "string"
+						},
+						"to": {
+							"type": "string",
+							"enum": ["camelCase", "PascalCase", "snake_case", "kebab-case", "UPPERCASE", "lowercase", "Title Case"],
+							"description": "Target case format"
+						}
+					},
+					"required": ["text", "to"]
+				}`),
+	},
+
+	// 46. Transform CSV to JSON
+	{
+		Name:        ToolPrefix + "transform_csv_to_json",
+		Description: "Convert CSV file to JSON.",
+		InputSchema: json.RawMessage(`{
+					"type": "object",
+					"properties": {
+						"file": {
+							"type": "string"
+						}
+					},
+					"required": ["file"]
+				}`),
+	},
+
+	// 47. Transform JSON to CSV
+	{
+		Name:        ToolPrefix + "transform_json_to_csv",
+		Description: "Convert JSON array file to CSV.",
+		InputSchema: json.RawMessage(`{
+					"type": "object",
+					"properties": {
+						"file": {
+							"type": "string"
+						}
+					},
+					"required": ["file"]
+				}`),
+	},
+
+	// 48. Transform filter lines
+	{
+		Name:        ToolPrefix + "transform_filter",
+		Description: "Filter lines in a file by regex pattern.",
+		InputSchema: json.RawMessage(`{
+					"type": "object",
+					"properties": {
+						"file": {
+							"type": "string"
+						},
+						"pattern": {
+							"type": "string",
+							"description": "Regex pattern to match"
+						},
+						"invert": {
+							"type": "boolean",
+							"description": "Invert match (exclude matching lines)"
+						}
+					},
+					"required": ["file", "pattern"]
+				}`),
+	},
+
+	// 49. Transform sort lines
+	{
+		Name:        ToolPrefix + "transform_sort",
+		Description: "Sort lines in a file.",
+		InputSchema: json.RawMessage(`{
+					"type": "object",
+					"properties": {
+						"file": {
+							"type": "string"
+						},
+						"reverse": {
+							"type": "boolean",
+							"description": "Sort in reverse order"
+						}
+					},
+					"required": ["file"]
+				}`),
+	},
+
+	// 50. Validate files
+	{
+		Name:        ToolPrefix + "validate",
+		Description: "Validate files of various formats: JSON, TOML, YAML, CSV, Markdown.",
+		InputSchema: json.RawMessage(`{
+					"type": "object",
+					"properties": {
+						"files": {
+							"type": "array",
+							"items": {
 								"type": "string"
 							}
+						}
+					},
+					"required": ["files"]
+				}`),
+	},
+
+	// 51. Calculate runtime/elapsed time
+	{
+		Name:        ToolPrefix + "runtime",
+		Description: "Calculate elapsed time between epoch timestamps.",
+		InputSchema: json.RawMessage(`{
+					"type": "object",
+					"properties": {
+						"start": {
+							"type": "integer",
+							"description": "Start epoch timestamp (required)"
 						},
-						"required": ["file"]
-					}`),
-		},
-
-		// 60. Review range - deterministic git review-range resolution
-		{
-			Name:        ToolPrefix + "review_range",
-			Description: "Deterministically resolve a git review range (base/head SHAs, commit and file counts) and detect empty ranges (already-merged branches). Use before review_direct/multi_review fan-outs.",
-			InputSchema: json.RawMessage(`{
-						"type": "object",
-						"properties": {
-							"repo": {
-								"type": "string",
-								"description": "Repository path (default: .)"
-							},
-							"base": {
-								"type": "string",
-								"description": "Explicit base ref"
-							},
-							"head": {
-								"type": "string",
-								"description": "Explicit head ref (default: HEAD)"
-							},
-							"merge_commit": {
-								"type": "string",
-								"description": "Merge/squash commit SHA; resolves to sha^..sha (mutually exclusive with base/head)"
-							}
+						"end": {
+							"type": "integer",
+							"description": "End epoch timestamp (default: now)"
+						},
+						"format": {
+							"type": "string",
+							"enum": ["secs", "mins", "mins-secs", "hms", "human", "compact"],
+							"description": "Output format (default: human)"
+						},
+						"precision": {
+							"type": "integer",
+							"description": "Decimal precision for output (default: 1)"
+						},
+						"label": {
+							"type": "boolean",
+							"description": "Include 'Runtime: ' prefix"
+						},
+						"raw": {
+							"type": "boolean",
+							"description": "Output raw number without unit suffix"
+						}
+					},
+					"required": ["start"]
+				}`),
+	},
+
+	// 52. Complete - Direct OpenAI API completion
+	{
+		Name:        ToolPrefix + "complete",
+		Description: "Send prompt to OpenAI-compatible API. Uses OPENAI_API_KEY/BASE_URL/MODEL env vars.",
+		InputSchema: json.RawMessage(`{
+					"type": "object",
+					"properties": {
+						"prompt": {
+							"type": "string"
+						},
+						"file": {
+							"type": "string",
+							"description": "Read prompt from file"
+						},
+						"template": {
+							"type": "string",
+							"description": "Template file with [[var]] placeholders"
+						},
+						"vars": {
+							"type": "object",
+							"description": "Template vars"
+						},
+						"system": {
+							"type": "string"
+						},
+						"model": {
+							"type": "string",
+							"description": "Model to use (overrides OPENAI_MODEL)"
+						},
+						"temperature": {
+							"type": "number",
+							"description": "Temperature 0.0-2.0 (default: 0.7)"
+						},
+						"max_tokens": {
+							"type": "integer",
+							"description": "Maximum tokens in response (0 = no limit)"
+						},
+						"timeout": {
+							"type": "integer",
+							"description": "Request timeout in seconds (default: 120)"
+						},
+						"retries": {
+							"type": "integer",
+							"description": "Number of retries on failure (default: 3)"
+						},
+						"output": {
+							"type": "string"
+						}
+					}
+				}`),
+	},
+
+	// 48. Route technical debt issues
+	{
+		Name:        ToolPrefix + "route_td",
+		Description: "Route technical debt items by time estimate (quick_wins/backlog/td_files).",
+		InputSchema: json.RawMessage(`{
+					"type": "object",
+					"properties": {
+						"file": {
+							"type": "string"
+						},
+						"content": {
+							"type": "string"
+						},
+						"quick_wins_max": {
+							"type": "integer",
+							"description": "Quick wins max min (default: 30)"
+						},
+						"backlog_max": {
+							"type": "integer",
+							"description": "Backlog max min (default: 2880)"
+						}
+					}
+				}`),
+	},
+
+	// 49. Parse structured data streams
+	{
+		Name:        ToolPrefix + "parse_stream",
+		Description: "Parse structured data streams (pipe-delimited, markdown checklists) into JSON.",
+		InputSchema: json.RawMessage(`{
+					"type": "object",
+					"properties": {
+						"file": {
+							"type": "string"
+						},
+						"content": {
+							"type": "string"
+						},
+						"format": {
+							"type": "string",
+							"enum": ["auto", "pipe", "markdown-checklist"],
+							"description": "auto/pipe/markdown-checklist"
+						},
+						"delimiter": {
+							"type": "string",
+							"description": "Delimiter for pipe format (default: |)"
+						},
+						"headers": {
+							"type": "string",
+							"description": "Header names (comma-separated)"
+						}
+					}
+				}`),
+	},
+
+	// 50. Coverage report for requirements
+	{
+		Name:        ToolPrefix + "coverage_report",
+		Description: "Calculate requirement coverage from user stories.",
+		InputSchema: json.RawMessage(`{
+					"type": "object",
+					"properties": {
+						"requirements": {
+							"type": "string"
+						},
+						"stories": {
+							"type": "string"
+						}
+					},
+					"required": ["requirements", "stories"]
+				}`),
+	},
+
+	// 51. Validate risks coverage
+	{
+		Name:        ToolPrefix + "validate_risks",
+		Description: "Cross-reference sprint risks with stories/tasks/ACs for coverage.",
+		InputSchema: json.RawMessage(`{
+					"type": "object",
+					"properties": {
+						"design": {
+							"type": "string"
+						},
+						"stories": {
+							"type": "string"
+						},
+						"tasks": {
+							"type": "string"
+						},
+						"acceptance_criteria": {
+							"type": "string"
+						}
+					},
+					"required": ["design"]
+				}`),
+	},
+
+	// 52. Alignment check for requirements
+	{
+		Name:        ToolPrefix + "alignment_check",
+		Description: "Verify requirements alignment with delivered stories.",
+		InputSchema: json.RawMessage(`{
+					"type": "object",
+					"properties": {
+						"requirements": {
+							"type": "string"
+						},
+						"stories": {
+							"type": "string"
+						},
+						"tasks": {
+							"type": "string",
+							"description": "Path to tasks directory (optional, scanned for additional traceability)"
+						}
+					},
+					"required": ["requirements", "stories"]
+				}`),
+	},
+
+	// 53. Sprint status determination
+	{
+		Name:        ToolPrefix + "sprint_status",
+		Description: "Determine sprint completion status (COMPLETED/PARTIAL/FAILED).",
+		InputSchema: json.RawMessage(`{
+					"type": "object",
+					"properties": {
+						"tasks_total": {
+							"type": "integer",
+							"description": "Total number of tasks"
+						},
+						"tasks_completed": {
+							"type": "integer",
+							"description": "Number of completed tasks"
+						},
+						"tests_passed": {
+							"type": "boolean"
+						},
+						"coverage": {
+							"type": "number"
+						},
+						"critical_issues": {
+							"type": "integer",
+							"description": "Number of critical issues"
+						},
+						"completed_threshold": {
+							"type": "number",
+							"description": "Threshold for COMPLETED (default: 0.90)"
+						},
+						"partial_threshold": {
+							"type": "number",
+							"description": "Threshold for PARTIAL (default: 0.50)"
+						},
+						"coverage_threshold": {
+							"type": "number",
+							"description": "Min coverage (default: 60)"
+						}
+					},
+					"required": ["tests_passed"]
+				}`),
+	},
+
+	// 54. TDD compliance analysis
+	{
+		Name:        ToolPrefix + "tdd_compliance",
+		Description: "Analyze git history for TDD compliance.",
+		InputSchema: json.RawMessage(`{
+					"type": "object",
+					"properties": {
+						"path": {
+							"type": "string"
+						},
+						"content": {
+							"type": "string",
+							"description": "Git log (pipe-delimited)"
+						},
+						"since": {
+							"type": "string",
+							"description": "Analyze commits since date (YYYY-MM-DD)"
+						},
+						"until": {
+							"type": "string",
+							"description": "Analyze commits until date (YYYY-MM-DD)"
+						},
+						"count": {
+							"type": "integer",
+							"description": "Maximum number of commits to analyze"
+						}
+					}
+				}`),
+	},
+
+	// 55. Categorize git changes
+	{
+		Name:        ToolPrefix + "categorize_changes",
+		Description: "Categorize git status output by file type (source, test, config, docs, generated, other). Detects sensitive files.",
+		InputSchema: json.RawMessage(`{
+					"type": "object",
+					"properties": {
+						"file": {
+							"type": "string"
+						},
+						"content": {
+							"type": "string"
+						},
+						"sensitive_patterns": {
+							"type": "string",
+							"description": "Extra sensitive patterns (comma-separated)"
+						}
+					}
+				}`),
+	},
+
+	// 56. Format TD items as markdown tables
+	{
+		Name:        ToolPrefix + "format_td_table",
+		Description: "Format technical debt items as markdown tables.",
+		InputSchema: json.RawMessage(`{
+					"type": "object",
+					"properties": {
+						"file": {
+							"type": "string"
+						},
+						"content": {
+							"type": "string"
+						},
+						"section": {
+							"type": "string",
+							"enum": ["quick_wins", "backlog", "td_files", "all"],
+							"description": "Section: quick_wins/backlog/td_files/all"
+						},
+						"checkbox": {
+							"type": "boolean",
+							"description": "Add checkbox column"
+						}
+					}
+				}`),
+	},
+
+	// 57. Group TD items by path/category
+	{
+		Name:        ToolPrefix + "group_td",
+		Description: "Group technical debt items by path, category, or file.",
+		InputSchema: json.RawMessage(`{
+					"type": "object",
+					"properties": {
+						"file": {
+							"type": "string"
+						},
+						"content": {
+							"type": "string"
+						},
+						"group_by": {
+							"type": "string",
+							"enum": ["path", "category", "file"],
+							"description": "Strategy: path, category, or file"
+						},
+						"path_depth": {
+							"type": "integer",
+							"description": "Number of path segments for theme (default: 2)"
+						},
+						"min_group_size": {
+							"type": "integer",
+							"description": "Min items per group (default: 3)"
+						},
+						"critical_override": {
+							"type": "boolean",
+							"description": "CRITICAL gets own group (default: true)"
+						},
+						"root_theme": {
+							"type": "string",
+							"description": "Root theme (default: misc)"
+						},
+						"assign_numbers": {
+							"type": "boolean",
+							"description": "Assign group numbers"
+						},
+						"output_file": {
+							"type": "string",
+							"description": "Output markdown file (appends)"
+						},
+						"checkbox": {
+							"type": "boolean",
+							"description": "Add checkbox column"
+						},
+						"sprint_label": {
+							"type": "string",
+							"description": "Sprint name for section header in output file"
+						},
+						"date_label": {
+							"type": "string",
+							"description": "Date for section header in output file"
+						},
+						"format": {
+							"type": "string",
+							"enum": ["json", "pipe"],
+							"description": "Input format: json (default) or pipe (pipe-delimited text with # comments)"
+						},
+						"headers": {
+							"type": "string",
+							"description": "Column headers for pipe format"
+						},
+						"delimiter": {
+							"type": "string",
+							"description": "Field delimiter for pipe format (default: |)"
+						}
+					}
+				}`),
+	},
+	// 58. Tech debt statistics
+	{
+		Name:        ToolPrefix + "td_stats",
+		Description: "Generate tech debt statistics from a markdown README with checkbox/severity table. States: [ ] open, [/] deferred, [x] resolved, [-] unreproducible (closed without a fix, counted separately from resolved). Total counts every state. The Unreproducible column appears only in files that use [-], so a three-state README renders unchanged. With write=true, rewrites the ## Stats section and Last Modified line in place deterministically (no data rows added or removed — use td_clean for that).",
+		InputSchema: json.RawMessage(`{
+					"type": "object",
+					"properties": {
+						"path": {
+							"type": "string"
+						},
+						"write": {
+							"type": "boolean",
+							"description": "Rewrite the ## Stats section and Last Modified line in place"
+						},
+						"today": {
+							"type": "string",
+							"description": "Date for the Last Modified line (YYYY-MM-DD); defaults to today. Only used with write=true."
+						}
+					},
+					"required": ["path"]
+				}`),
+	},
+
+	// 58z. Tech debt open-items cross-tab
+	{
+		Name:        ToolPrefix + "td_matrix",
+		Description: "Cross-tab OPEN technical-debt items by severity (columns) and group (rows), with row/column totals. Resolved [x] and deferred [/] items are excluded; only rows inside dated '### [date] From...' sections are counted. Read-only. Returns structured counts plus a rendered markdown table.",
+		InputSchema: json.RawMessage(`{
+					"type": "object",
+					"properties": {
+						"path": {"type": "string", "description": "Path to the technical-debt README"}
+					},
+					"required": ["path"]
+				}`),
+	},
+
+	// 58a. Tech debt README cleanup
+	{
+		Name:        ToolPrefix + "td_clean",
+		Description: "Clean a technical-debt README in place: strip resolved [x] rows (whole-cell match, not prose substrings), remove sprint sections left empty, regenerate the Stats section, and refresh the Last Modified line. Only a fix retires a row: [ ] open, [/] deferred and [-] unreproducible rows are all kept, and a section holding only [-] rows is not treated as empty. Returns counts of rows/sections removed and post-cleanup totals. No-op (file untouched) when no resolved rows exist. Deterministic replacement for in-model row stripping.",
+		InputSchema: json.RawMessage(`{
+					"type": "object",
+					"properties": {
+						"path": {"type": "string", "description": "Path to the technical-debt README"},
+						"today": {"type": "string", "description": "Date for the Last Modified line (YYYY-MM-DD); defaults to today"}
+					},
+					"required": ["path"]
+				}`),
+	},
+
+	// 58b. Tech debt selection/filtering
+	{
+		Name:        ToolPrefix + "td_filter",
+		Description: "Select unchecked technical-debt rows from a README by filter criteria (mode quick-wins/backlog/all, severity, confidence, group, section focus, max). Returns matching rows + a summary of counts and the group write-scope. Deterministic replacement for in-model table parsing.",
+		InputSchema: json.RawMessage(`{
+					"type": "object",
+					"properties": {
+						"path": {"type": "string", "description": "Path to the technical-debt README"},
+						"mode": {"type": "string", "enum": ["quick-wins", "backlog", "all"], "description": "Effort threshold (default quick-wins)"},
+						"severity": {"type": "string", "description": "Comma-separated severities to keep (low,medium,high,critical); empty = all"},
+						"confidence": {"type": "string", "description": "Comma-separated confidences to keep (low,medium,high); empty = all"},
+						"group": {"type": "string", "description": "Group-column value to keep (e.g. solo,1,2,u); empty = all"},
+						"focus": {"type": "string", "description": "Section header substring, case-insensitive"},
+						"max": {"type": "integer", "description": "Max items returned (default 10)"}
+					},
+					"required": ["path"]
+				}`),
+	},
+
+	// 58c. Tech debt cross-reviewer dedupe/merge
+	{
+		Name:        ToolPrefix + "td_dedupe",
+		Description: "Cluster and merge technical-debt streams from multiple reviewers by (file, line +/- tolerance). Aggregates REVIEWERS union, SEVERITY max, CATEGORY modal, EST_MINUTES max, CONFIDENCE (HIGH for 2+ distinct reviewers), and severity-disagreement; flags multi-item clusters needs_review with members for model adjudication. Deterministic replacement for in-model reconcile clustering.",
+		InputSchema: json.RawMessage(`{
+					"type": "object",
+					"properties": {
+						"streams": {"type": "string", "description": "Comma-separated td-stream.txt paths"},
+						"source_tags": {"type": "string", "description": "Comma-separated source labels parallel to streams (default: parent dir name)"},
+						"tolerance": {"type": "integer", "description": "Line-proximity window for clustering (default 3)"},
+						"untrusted": {"type": "string", "description": "Comma-separated source tags whose findings alone yield CONFIDENCE LOW"}
+					},
+					"required": ["streams"]
+				}`),
+	},
+
+	// 58c-2. Technical debt file/symbol validation
+	{
+		Name:        ToolPrefix + "td_validate",
+		Description: "Validate open (and optionally deferred) technical-debt rows by checking whether the cited file and symbol still exist in the repository. Closed rows are skipped — both [x] resolved and [-] unreproducible — since neither has anything left to ground. Returns per-item status: valid, file_missing, symbol_not_found, or no_file. Use to identify stale TD items that can be closed as won't-fix.",
+		InputSchema: json.RawMessage(`{
+					"type": "object",
+					"properties": {
+						"path": {"type": "string", "description": "Path to the technical-debt README"},
+						"root": {"type": "string", "description": "Repo root for resolving relative file paths (default: current directory)"},
+						"mode": {"type": "string", "enum": ["open", "all"], "description": "open = open [ ] items only (default); all = also include deferred [/] items"},
+						"coherence": {"type": "boolean", "description": "Advisory: flag rows whose FIX reads as incoherent with its PROBLEM (copy-paste signature). Needs an embedding/reranker endpoint; degrades gracefully if none is reachable."},
+						"coherence_collection": {"type": "string", "description": "Qdrant collection for the optional grounding signal (e.g. atcr-code); empty disables grounding"}
+					},
+					"required": ["path"]
+				}`),
+	},
+
+	// 58c-3. Codebase-discovery.json path validation
+	{
+		Name:        ToolPrefix + "discovery_validate",
+		Description: "Verify that file paths cited in a codebase-discovery.json plan artifact still exist. Checks files_to_modify[*].path, related_files[*].path, semantic_matches[*].file, reusable_components[*].path, existing_patterns[*].files[], and integration_points[*].location (file segment). Report-only by default; pass write=true to mark stale entries status=deprecated with a deprecated_reason (never deletes, never overwrites an entry's existing reason field). Skips files_to_create[*] (expected not to exist yet) and reports build_from.primary_file / test_patterns.* as informational-only (never auto-mutated). Entries already status=deprecated are left untouched. Deterministic replacement for model-driven path re-verification in /refine-codebase-discovery.",
+		InputSchema: json.RawMessage(`{
+					"type": "object",
+					"properties": {
+						"path": {"type": "string", "description": "Path to codebase-discovery.json"},
+						"root": {"type": "string", "description": "Repo root for resolving relative paths cited in the JSON (default: current directory)"},
+						"write": {"type": "boolean", "description": "Mark stale entries deprecated in place (default: false, report-only)"}
+					},
+					"required": ["path"]
+				}`),
+	},
+
+	// 58d. Package documentation tier classification
+	{
+		Name:        ToolPrefix + "tier_classifier",
+		Description: "Classify packages into documentation tiers (critical/important/pattern/utility/skip) via deterministic passes 1-3: explicit config map, glob patterns, keyword categories. Returns assigned map + unassigned list (for the model's Pass 4) + per-pass counts. Deterministic replacement for in-model tier assignment in /init-documentation.",
+		InputSchema: json.RawMessage(`{
+					"type": "object",
+					"properties": {
+						"packages": {"type": "string", "description": "Comma-separated package names"},
+						"config": {"type": "string", "description": "Path to package-tiers.yaml (packages/patterns/categories)"}
+					},
+					"required": ["packages"]
+				}`),
+	},
+
+	// 58e. Knowledge-base audit + frontmatter repair
+	{
+		Name:        ToolPrefix + "knowledge_audit",
+		Description: "Audit a .knowledge/ directory for frontmatter drift and stale code references. Per entry: schema conformance (missing/unknown/aliased keys, soft fields needing input) and drift (git-derived created date, age, cited-file existence + commits-since-capture, unfilled placeholders), plus a flags array (code_changed_after_capture/dangling_ref/incomplete/needs_input) marking entries that warrant model review. Read-only by default; repair_schema deterministically normalizes frontmatter (rename aliases, fill derivable/bookkeeping keys, synthesize missing id, derive files from body) preserving the body, filename, and existing id, and is idempotent.",
+		InputSchema: json.RawMessage(`{
+					"type": "object",
+					"properties": {
+						"dir": {"type": "string", "description": "Path to the .knowledge directory"},
+						"repair_schema": {"type": "boolean", "description": "Write deterministic frontmatter normalization (default false = read-only report)"}
+					},
+					"required": ["dir"]
+				}`),
+	},
+
+	// 58f. Diff over-simplification / reward-hack smell
+	{
+		Name:        ToolPrefix + "diff_smell",
+		Description: "Scan a diff for over-simplification / reward-hack fingerprints: the change touched only tests (test_only), a test removed assertions without replacing them (weakened_assertion), or an added line suppressed a linter/type-checker (suppression), swallowed an exception (empty_catch), or stubbed a body (stub_body). Deterministic, model-independent gate for /resolve-td — the inverse of its too-complex SAFE_SCOPE check. Returns smells + summary.verdict (hard=force review / soft_only=adjudicate / clean). Source is a diff file (`diff`) or a commit (`repo`+`rev`, via git show).",
+		InputSchema: json.RawMessage(`{
+					"type": "object",
+					"properties": {
+						"diff": {"type": "string", "description": "Path to a unified diff file (takes precedence over repo/rev)"},
+						"repo": {"type": "string", "description": "Repository to read the commit diff from when diff is not given"},
+						"rev": {"type": "string", "description": "Commit to scan via 'git show <rev>' (default HEAD)"}
+					}
+				}`),
+	},
+
+	// 59. Project components (monorepo support)
+	{
+		Name:        ToolPrefix + "project_components",
+		Description: "Read project config and return normalized component list.",
+		InputSchema: json.RawMessage(`{
+					"type": "object",
+					"properties": {
+						"file": {
+							"type": "string"
+						}
+					},
+					"required": ["file"]
+				}`),
+	},
+
+	// 60. Review range - deterministic git review-range resolution
+	{
+		Name:        ToolPrefix + "review_range",
+		Description: "Deterministically resolve a git review range (base/head SHAs, commit and file counts) and detect empty ranges (already-merged branches). Use before review_direct/multi_review fan-outs.",
+		InputSchema: json.RawMessage(`{
+					"type": "object",
+					"properties": {
+						"repo": {
+							"type": "string",
+							"description": "Repository path (default: .)"
+						},
+						"base": {
+							"type": "string",
+							"description": "Explicit base ref"
+						},
+						"head": {
+							"type": "string",
+							"description": "Explicit head ref (default: HEAD)"
+						},
+						"merge_commit": {
+							"type": "string",
+							"description": "Merge/squash commit SHA; resolves to sha^..sha (mutually exclusive with base/head)"
 						}
-					}`),
-		},
-
-		// Fetch URL with FlareSolverr + rotating-proxy fallback
-		{
-			Name:        ToolPrefix + "fetch",
-			Description: "Download a URL with a smart fallback ladder: direct HTTP first, then a rotating HTTP proxy on IP-level blocks (403/429/5xx/conn), then FlareSolverr on Cloudflare/JS challenge pages. Config from env (FETCH_FLARESOLVERR_URL, FETCH_PROXY_URL, FETCH_TIMEOUT, FETCH_MAX_RETRIES, FETCH_USER_AGENT) overridable per call. HTML is returned as Markdown by default (token-efficient); pass format=text or format=raw to change. Returns {url, final_url, status, tier, format, bytes} plus body inline (or pass output to write the body to a file for large pages). Set no_fallback for a direct-only fetch.",
-			InputSchema: json.RawMessage(`{
-						"type": "object",
-						"properties": {
-							"url": {"type": "string", "description": "URL to download (http:// or https://)"},
-							"format": {"type": "string", "enum": ["raw", "text", "markdown"], "description": "HTML output transform (non-HTML passes through). raw=as received, text=tags stripped, markdown=structure-preserving. Defaults to markdown for token efficiency."},
-							"output": {"type": "string", "description": "Write the body to this file instead of returning it inline"},
-							"flaresolverr": {"type": "string", "description": "FlareSolverr endpoint (overrides FETCH_FLARESOLVERR_URL)"},
-							"proxy": {"type": "string", "description": "Rotating proxy URL (overrides FETCH_PROXY_URL)"},
-							"flaresolverr_proxy": {"type": "string", "description": "Proxy for the FlareSolverr render only, e.g. a no-auth relay (overrides FETCH_FLARESOLVERR_PROXY_URL)"},
-							"timeout": {"type": "integer", "description": "Per-attempt timeout in seconds (default 30)"},
-							"retries": {"type": "integer", "description": "Retries within a tier (default 2)"},
-							"via": {"type": "string", "enum": ["auto", "direct", "proxy", "flaresolverr"], "description": "Routing: auto=full fallback ladder (default), or force a single tier (direct/proxy/flaresolverr)"},
-							"no_fallback": {"type": "boolean", "description": "Direct fetch only (alias for via=direct)"},
-							"flaresolverr_no_proxy": {"type": "boolean", "description": "Keep the FlareSolverr render direct even when a proxy is configured (FlareSolverr otherwise egresses through the proxy, which defeats IP blocks on sites like Reddit but uses more proxy bandwidth)"}
-						},
-						"required": ["url"]
-					}`),
-		},
-	}
+					}
+				}`),
+	},
+
+	// Fetch URL with FlareSolverr + rotating-proxy fallback
+	{
+		Name:        ToolPrefix + "fetch",
+		Description: "Download a URL with a smart fallback ladder: direct HTTP first, then a rotating HTTP proxy on IP-level blocks (403/429/5xx/conn), then FlareSolverr on Cloudflare/JS challenge pages. Config from env (FETCH_FLARESOLVERR_URL, FETCH_PROXY_URL, FETCH_TIMEOUT, FETCH_MAX_RETRIES, FETCH_USER_AGENT) overridable per call. HTML is returned as Markdown by default (token-efficient); pass format=text or format=raw to change. Returns {url, final_url, status, tier, format, bytes} plus body inline (or pass output to write the body to a file for large pages). Set no_fallback for a direct-only fetch.",
+		InputSchema: json.RawMessage(`{
+					"type": "object",
+					"properties": {
+						"url": {"type": "string", "description": "URL to download (http:// or https://)"},
+						"format": {"type": "string", "enum": ["raw", "text", "markdown"], "description": "HTML output transform (non-HTML passes through). raw=as received, text=tags stripped, markdown=structure-preserving. Defaults to markdown for token efficiency."},
+						"output": {"type": "string", "description": "Write the body to this file instead of returning it inline"},
+						"flaresolverr": {"type": "string", "description": "FlareSolverr endpoint (overrides FETCH_FLARESOLVERR_URL)"},
+						"proxy": {"type": "string", "description": "Rotating proxy URL (overrides FETCH_PROXY_URL)"},
+						"flaresolverr_proxy": {"type": "string", "description": "Proxy for the FlareSolverr render only, e.g. a no-auth relay (overrides FETCH_FLARESOLVERR_PROXY_URL)"},
+						"timeout": {"type": "integer", "description": "Per-attempt timeout in seconds (default 30)"},
+						"retries": {"type": "integer", "description": "Retries within a tier (default 2)"},
+						"via": {"type": "string", "enum": ["auto", "direct", "proxy", "flaresolverr"], "description": "Routing: auto=full fallback ladder (default), or force a single tier (direct/proxy/flaresolverr)"},
+						"no_fallback": {"type": "boolean", "description": "Direct fetch only (alias for via=direct)"},
+						"flaresolverr_no_proxy": {"type": "boolean", "description": "Keep the FlareSolverr render direct even when a proxy is configured (FlareSolverr otherwise egresses through the proxy, which defeats IP blocks on sites like Reddit but uses more proxy bandwidth)"}
+					},
+					"required": ["url"]
+				}`),
+	},
 }
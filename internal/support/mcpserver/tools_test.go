@@ -185,3 +185,25 @@ func TestToolSchemaRequiredFields(t *testing.T) {
 		}
 	}
 }
+
+func TestGetToolDefinitionsCached(t *testing.T) {
+	first := GetToolDefinitions()
+	second := GetToolDefinitions()
+
+	if len(first) == 0 || &first[0] != &second[0] {
+		t.Error("GetToolDefinitions() should return the same cached slice on every call")
+	}
+}
+
+func TestCommandRegistryCoversTools(t *testing.T) {
+	tools := GetToolDefinitions()
+	for _, tool := range tools {
+		cmdName := tool.Name[len(ToolPrefix):]
+		if _, ok := commandRegistry[cmdName]; !ok {
+			t.Errorf("tool %s has no entry in commandRegistry", tool.Name)
+		}
+	}
+	if len(commandRegistry) != len(tools) {
+		t.Errorf("commandRegistry has %d entries, want %d", len(commandRegistry), len(tools))
+	}
+}
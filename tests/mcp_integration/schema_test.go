@@ -21,7 +21,7 @@ func TestLLMSupportToolCount(t *testing.T) {
 // TestLLMClarificationToolCount verifies the correct number of tools
 func TestLLMClarificationToolCount(t *testing.T) {
 	tools := clarifyserver.GetToolDefinitions()
-	expected := 13
+	expected := 14
 	if len(tools) != expected {
 		t.Errorf("Expected %d llm-clarification tools, got %d", expected, len(tools))
 	}